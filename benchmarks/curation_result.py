@@ -0,0 +1,104 @@
+"""Benchmark of the GWAS Catalog curation result computation.
+
+Compares the single pass join plan used by `GWASCatalogCuration.result` with the previous plan
+(anti join, inner join, full join and another anti join over the previous curation) on synthetic inputs.
+Each plan runs in a fresh process, so the reported peak resident memory is not shared between the plans.
+
+Usage:
+
+    uv run python benchmarks/curation_result.py --studies 100000 500000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+import polars as pl
+from loguru import logger
+from synthetic import synthetic_inputs
+
+from gentroutils.parsers.curation import (
+    CuratedStudyStatus,
+    CurationSchema,
+    GWASCatalogCuration,
+    SyncedSummaryStatisticsSchema,
+)
+
+
+def legacy_result(previous: pl.DataFrame, studies: pl.DataFrame, synced: pl.DataFrame) -> pl.DataFrame:
+    """Result computation used before the single pass join plan, kept as the benchmark reference."""
+    removed_studies = previous.join(studies, on=CurationSchema.STUDY_ID, how="anti").select(
+        CurationSchema.STUDY_ID, pl.lit(CuratedStudyStatus.REMOVED).alias("status")
+    )
+    curated_studies = previous.join(studies, on=CurationSchema.STUDY_ID, how="inner").select(
+        CurationSchema.STUDY_ID, pl.lit(CuratedStudyStatus.CURATED).alias("status")
+    )
+    prev_studies = pl.concat([removed_studies, curated_studies], how="vertical")
+    prev_studies = (
+        prev_studies.join(previous, on=CurationSchema.STUDY_ID, how="full", coalesce=True)
+        .with_columns(pl.coalesce(CurationSchema.IS_CURATED, pl.lit(False)).alias(CurationSchema.IS_CURATED))
+        .select(*CurationSchema.extended_columns())
+    )
+    assert all(prev_studies.select(CurationSchema.STUDY_ID).is_unique()), "Study IDs must be unique after merging."
+    new_studies = studies.join(previous, on=CurationSchema.STUDY_ID, how="anti")
+    new_studies_annotated = new_studies.join(synced, on=CurationSchema.STUDY_ID, how="left").select(
+        CurationSchema.STUDY_ID,
+        pl.lit(None).alias(CurationSchema.STUDY_TYPE),
+        pl.lit(None).alias(CurationSchema.ANALYSIS_FLAG),
+        pl.lit(None).alias(CurationSchema.QUALITY_CONTROL),
+        pl.lit(False).alias(CurationSchema.IS_CURATED),
+        CurationSchema.PUBMED_ID,
+        CurationSchema.PUBLICATION_TITLE,
+        CurationSchema.TRAIT_FROM_SOURCE,
+        pl.when(pl.col(SyncedSummaryStatisticsSchema.SYNCED).is_null())
+        .then(pl.lit(CuratedStudyStatus.NO_SUMSTATS))
+        .otherwise(pl.lit(CuratedStudyStatus.TO_CURATE))
+        .alias("status"),
+    )
+    all_studies = pl.concat([prev_studies, new_studies_annotated], how="vertical")
+    assert all(all_studies.select(CurationSchema.STUDY_ID).is_unique()), "Study IDs must be unique after merging."
+    return all_studies.select(CurationSchema.extended_columns())
+
+
+def _measure(plan: str, n_studies: int, repeat: int) -> dict[str, float]:
+    """Run the plan in the current process and measure the best wall time and the peak memory growth."""
+    logger.remove()
+    previous, studies, synced = synthetic_inputs(n_studies)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if plan == "legacy":
+            result = legacy_result(previous, studies, synced)
+        else:
+            result = GWASCatalogCuration(previous, studies, synced).result
+        timings.append(time.perf_counter() - start)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "wall_s": min(timings),
+        "peak_rss_mb": (peak_rss - baseline_rss) / 1024,
+        "result_mb": result.estimated_size("mb"),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--studies", type=int, nargs="+", default=[100_000, 500_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'studies':>10} {'plan':>8} {'wall [s]':>10} {'peak rss [MB]':>15} {'result [MB]':>12}")
+    for n_studies in args.studies:
+        for plan in ("legacy", "single"):
+            with ctx.Pool(1) as pool:
+                m = pool.apply(_measure, (plan, n_studies, args.repeat))
+            print(f"{n_studies:>10} {plan:>8} {m['wall_s']:>10.3f} {m['peak_rss_mb']:>15.1f} {m['result_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
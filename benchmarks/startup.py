@@ -0,0 +1,95 @@
+"""Startup benchmark of the gentroutils task registration.
+
+otter imports every module of `gentroutils.tasks` when the runner registers the tasks, before any step runs,
+so the import time of the task modules is paid by every (also the shortest) step. The task modules defer
+the heavy dependencies (`polars`, `aiohttp`, `aioftp`, `tqdm`) to the `run` method of the tasks.
+
+The benchmark registers the tasks in fresh interpreters with `-X importtime` and reports the median import time
+of each task module on top of otter (which is imported first and not counted). The run fails when any of the
+deferred dependencies is imported at registration, or the registration takes longer than the budget.
+
+Usage:
+
+    uv run python benchmarks/startup.py
+    uv run python benchmarks/startup.py --repeat 20 --budget-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFERRED_MODULES = ("polars", "aiohttp", "aioftp", "tqdm")
+"""Modules that must not be imported when the tasks are registered."""
+
+REGISTER = """
+import importlib, json, pkgutil, sys, time
+import otter, otter.task.model, otter.task.task_reporter, otter.storage
+start = time.perf_counter()
+import gentroutils.tasks
+for module in pkgutil.iter_modules(gentroutils.tasks.__path__, "gentroutils.tasks."):
+    importlib.import_module(module.name)
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"elapsed_ms": elapsed_ms, "loaded": [m for m in {deferred} if m in sys.modules]}}))
+"""
+
+
+def _register() -> tuple[float, dict[str, float], list[str]]:
+    """Register the tasks in a fresh interpreter.
+
+    Returns:
+        tuple[float, dict[str, float], list[str]]: The registration time in ms, the cumulative import time in ms
+            of the top level gentroutils imports reported by `-X importtime` and the deferred modules
+            that were imported.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", REGISTER.format(deferred=DEFERRED_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Only the top level imports are reported, the nested ones are part of their cumulative time.
+        if name.startswith(" gentroutils"):
+            timings[name.strip()] = int(cumulative) / 1000
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    return result["elapsed_ms"], timings, result["loaded"]
+
+
+def main() -> int:
+    """Run the startup benchmark, print the import times and return the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=150, help="Maximum median registration time.")
+    args = parser.parse_args()
+
+    runs = [_register() for _ in range(args.repeat)]
+    modules = sorted({m for _, timings, _ in runs for m in timings})
+    print(f"{'module':>40} {'median [ms]':>12} {'max [ms]':>10}")
+    for module in modules:
+        samples = [timings.get(module, 0.0) for _, timings, _ in runs]
+        print(f"{module:>40} {statistics.median(samples):>12.1f} {max(samples):>10.1f}")
+    elapsed = [elapsed_ms for elapsed_ms, _, _ in runs]
+    total = statistics.median(elapsed)
+    print(f"{'registration':>40} {total:>12.1f} {max(elapsed):>10.1f}")
+
+    failures = []
+    loaded = sorted({m for _, _, deferred in runs for m in deferred})
+    if loaded:
+        failures.append(f"deferred modules imported at registration: {', '.join(loaded)}")
+    if total > args.budget_ms:
+        failures.append(f"registration took {total:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
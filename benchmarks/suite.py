@@ -0,0 +1,158 @@
+"""Synthetic scale benchmark suite of the GWAS Catalog curation.
+
+Measures the wall time and the peak resident memory growth of the three curation stages:
+
+    * `load` - parsing the previous curation and the download studies TSV files.
+    * `crawl` - listing the synced summary statistics with `GCSSummaryStatisticsFileCrawler`,
+      the GCS listing is served from memory by a fake storage client.
+    * `result` - computing `GWASCatalogCuration.result`.
+
+Each stage runs in a fresh process after its inputs are generated, so the memory of one stage or one size
+does not leak into the next. The results are compared with the stored baseline, the run fails when a stage
+is slower or uses more memory than the baseline by more than the tolerance.
+
+Usage:
+
+    uv run python benchmarks/suite.py --studies 100000 500000 2000000
+    uv run python benchmarks/suite.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from loguru import logger
+from synthetic import SUMSTATS_GLOB, FakeStorageClient, synthetic_inputs, synthetic_listing
+
+from gentroutils.parsers.curation import DownloadStudiesSchema, GCSSummaryStatisticsFileCrawler, GWASCatalogCuration
+
+STAGES = ("load", "crawl", "result")
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def _setup_load(n_studies: int, tmp_dir: Path) -> Callable[[], Any]:
+    """Write the synthetic previous curation and studies as TSV files and return their parser."""
+    previous, studies, _ = synthetic_inputs(n_studies)
+    previous_path, studies_path = tmp_dir / "previous_curation.tsv", tmp_dir / "studies.tsv"
+    previous.write_csv(previous_path, separator="\t")
+    reverse_mapping = {v: k for k, v in DownloadStudiesSchema.mapping().items()}
+    studies.rename(reverse_mapping).write_csv(studies_path, separator="\t", quote_char="`")
+
+    def load() -> Any:
+        return (
+            GWASCatalogCuration.read_previous_curation(previous_path.as_posix()),
+            GWASCatalogCuration.read_studies(studies_path.as_posix()),
+        )
+
+    return load
+
+
+def _setup_crawl(n_studies: int, tmp_dir: Path) -> Callable[[], Any]:
+    """Build the in-memory listing and return the crawl served by the fake storage client."""
+    client = FakeStorageClient(synthetic_listing(n_studies))
+
+    def crawl() -> Any:
+        with patch("gentroutils.io.gcs.listing.gcs_client", return_value=client):
+            return GCSSummaryStatisticsFileCrawler(SUMSTATS_GLOB).crawl()
+
+    return crawl
+
+
+def _setup_result(n_studies: int, tmp_dir: Path) -> Callable[[], Any]:
+    """Generate the synthetic frames and return the result computation."""
+    previous, studies, synced = synthetic_inputs(n_studies)
+    # `result` is cached on the instance, a new instance is built for every repetition
+    return lambda: GWASCatalogCuration(previous, studies, synced).result
+
+
+SETUP: dict[str, Callable[[int, Path], Callable[[], Any]]] = {
+    "load": _setup_load,
+    "crawl": _setup_crawl,
+    "result": _setup_result,
+}
+
+
+def _measure(stage: str, n_studies: int, repeat: int) -> dict[str, float]:
+    """Run the stage in the current process and measure the best wall time and the peak memory growth."""
+    logger.remove()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run = SETUP[stage](n_studies, Path(tmp_dir))
+        baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"wall_s": round(min(timings), 4), "peak_rss_mb": round((peak_rss - baseline_rss) / 1024, 1)}
+
+
+def _compare(current: float, baseline: float | None, tolerance: float, floor: float) -> tuple[str, bool]:
+    """Format the change against the baseline and tell if it exceeds the tolerance.
+
+    Changes below the `floor` (in the measured unit) are ignored, they are within the measurement noise.
+    """
+    if baseline is None:
+        return "new", False
+    change = current - baseline
+    ratio = change / baseline if baseline else 0.0
+    return f"{ratio:+.0%}", change > floor and ratio > tolerance
+
+
+def main() -> int:
+    """Run the benchmark suite, print the comparison table and return the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--studies", type=int, nargs="+", default=[100_000, 500_000, 2_000_000])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression.")
+    parser.add_argument("--output", type=Path, help="Write the measurements as JSON.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the measurements as the baseline.")
+    args = parser.parse_args()
+
+    baseline: dict[str, dict[str, dict[str, float]]] = (
+        json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    )
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    regressions = []
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'stage':>8} {'studies':>10} {'wall [s]':>10} {'vs base':>8} {'peak rss [MB]':>14} {'vs base':>8}")
+    for stage in args.stages:
+        for n_studies in args.studies:
+            with ctx.Pool(1) as pool:
+                m = pool.apply(_measure, (stage, n_studies, args.repeat))
+            results.setdefault(stage, {})[str(n_studies)] = m
+            base = baseline.get(stage, {}).get(str(n_studies), {})
+            wall, wall_regressed = _compare(m["wall_s"], base.get("wall_s"), args.tolerance, floor=0.05)
+            rss, rss_regressed = _compare(m["peak_rss_mb"], base.get("peak_rss_mb"), args.tolerance, floor=16)
+            if wall_regressed or rss_regressed:
+                regressions.append(f"{stage} @ {n_studies}")
+            print(f"{stage:>8} {n_studies:>10} {m['wall_s']:>10.3f} {wall:>8} {m['peak_rss_mb']:>14.1f} {rss:>8}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.update_baseline:
+        for stage, sizes in results.items():
+            baseline.setdefault(stage, {}).update(sizes)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline updated in {args.baseline}")
+        return 0
+    if regressions:
+        print(f"Regressions beyond {args.tolerance:.0%} of the baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Synthetic GWAS Catalog inputs used by the benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import polars as pl
+
+from gentroutils.parsers.curation import CurationSchema, DownloadStudiesSchema, SyncedSummaryStatisticsSchema
+
+SHARD_SIZE = 1_000
+"""Number of accessions in each `raw_summary_statistics/GCST{start}-GCST{end}/` directory."""
+
+PAGE_SIZE = 1_000
+"""Number of objects returned in each page of the fake listing, the GCS JSON API maximum."""
+
+BUCKET = "gwas_catalog_inputs"
+SUMSTATS_GLOB = f"gs://{BUCKET}/raw_summary_statistics/**.h.tsv.gz"
+
+
+def _accession(n: pl.Expr) -> pl.Expr:
+    """Format the row index as a GWAS Catalog accession."""
+    return pl.format("GCST{}", n.cast(pl.String).str.zfill(9))
+
+
+def synthetic_inputs(n_studies: int, seed: int = 42) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """Generate previous curation, studies and synced summary statistics frames.
+
+    The previous curation holds 90% of the studies plus 5% of removed studies, the remaining 10% of the
+    studies are new and roughly 70% of the studies have synced summary statistics.
+
+    Args:
+        n_studies (int): Number of studies in the latest release.
+        seed (int): Random seed.
+
+    Returns:
+        tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]: previous curation, studies and synced frames.
+    """
+    n_removed = n_studies // 20
+    n_new = n_studies // 10
+    n = pl.col("n")
+    accession = _accession(n)
+
+    def sample(values: list[str | None] | list[bool], salt: int) -> pl.Expr:
+        """Pick a value from the list, deterministic for the row index."""
+        return pl.lit(pl.Series(values)).gather((n.hash(seed + salt) % len(values)).cast(pl.Int64))
+
+    rows = pl.DataFrame({"n": pl.int_range(0, n_studies + n_removed, eager=True)})
+    studies = rows.filter(n < n_studies).select(
+        accession.alias(DownloadStudiesSchema.STUDY_ID),
+        pl.format("trait {}", n).alias(DownloadStudiesSchema.TRAIT_FROM_SOURCE),
+        (n % 50_000 + 10_000_000).alias(DownloadStudiesSchema.PUBMED_ID),
+        pl.format("publication {}", n % 50_000).alias(DownloadStudiesSchema.PUBLICATION_TITLE),
+    )
+    previous = rows.filter((n < n_studies - n_new) | (n >= n_studies)).select(
+        accession.alias(CurationSchema.STUDY_ID),
+        sample(["gwas", "pqtl", None], 1).alias(CurationSchema.STUDY_TYPE),
+        sample(["Metabolite", "Multivariate analysis", None], 2).alias(CurationSchema.ANALYSIS_FLAG),
+        sample(["Pass", "Fail", None], 3).alias(CurationSchema.QUALITY_CONTROL),
+        sample([True, False], 4).alias(CurationSchema.IS_CURATED),
+        (n % 50_000 + 10_000_000).alias(CurationSchema.PUBMED_ID),
+        pl.format("publication {}", n % 50_000).alias(CurationSchema.PUBLICATION_TITLE),
+        pl.format("trait {}", n).alias(CurationSchema.TRAIT_FROM_SOURCE),
+    )
+    synced = rows.filter((n < n_studies) & (n.hash(seed) % 10 < 7)).select(
+        pl.format("gs://bucket/raw_summary_statistics/{}.h.tsv.gz", accession).alias(
+            SyncedSummaryStatisticsSchema.FILE_PATH
+        ),
+        pl.lit(True).alias(SyncedSummaryStatisticsSchema.SYNCED),
+        accession.alias(SyncedSummaryStatisticsSchema.STUDY_ID),
+    )
+    return previous, studies, synced
+
+
+def synthetic_listing(n_studies: int, seed: int = 42) -> dict[str, list[dict[str, str]]]:
+    """Generate the object resources of the synced summary statistics, grouped by the shard directory.
+
+    The objects follow the layout of the GWAS Catalog FTP mirror, for example
+    `raw_summary_statistics/GCST000001001-GCST000002000/GCST000001234/harmonised/GCST000001234.h.tsv.gz`.
+
+    Args:
+        n_studies (int): Number of studies in the latest release.
+        seed (int): Random seed, the same studies are synced as in `synthetic_inputs`.
+
+    Returns:
+        dict[str, list[dict[str, str]]]: Object resources (as returned by the JSON API) per shard prefix.
+    """
+    n = pl.col("n")
+    shard_start = n // SHARD_SIZE * SHARD_SIZE
+    objects = (
+        pl.DataFrame({"n": pl.int_range(0, n_studies, eager=True)})
+        .filter(n.hash(seed) % 10 < 7)
+        .select(
+            pl.format(
+                "raw_summary_statistics/{}-{}/", _accession(shard_start + 1), _accession(shard_start + SHARD_SIZE)
+            ).alias("shard"),
+            pl.format("{}/harmonised/{}.h.tsv.gz", _accession(n), _accession(n)).alias("name"),
+            (n.hash(seed) % 500_000_000 + 1_000_000).cast(pl.String).alias("size"),
+            (n + 1_700_000_000_000_000).cast(pl.String).alias("generation"),
+            pl.lit("2025-01-01T00:00:00.000Z").alias("updated"),
+        )
+        .with_columns(pl.concat_str("shard", "name").alias("name"))
+    )
+    listing: dict[str, list[dict[str, str]]] = {}
+    for shard, items in objects.group_by("shard", maintain_order=True):
+        listing[str(shard[0])] = items.drop("shard").to_dicts()
+    return listing
+
+
+class FakeBlobIterator:
+    """Stand-in for the `HTTPIterator` returned by `Client.list_blobs`, serving pre-built JSON pages."""
+
+    def __init__(self, items: list[dict[str, Any]], prefixes: list[str] | None = None):
+        self._items = items
+        self._prefixes = prefixes or []
+        self.prefixes: set[str] = set()
+
+    @property
+    def pages(self) -> Iterator[SimpleNamespace]:
+        """Listing pages, the prefixes are set once all pages are consumed."""
+        for start in range(0, len(self._items), PAGE_SIZE):
+            yield SimpleNamespace(raw_page={"items": self._items[start : start + PAGE_SIZE]})
+        self.prefixes = set(self._prefixes)
+
+
+class FakeStorageClient:
+    """Storage client listing the synthetic summary statistics from memory."""
+
+    def __init__(self, listing: dict[str, list[dict[str, str]]]):
+        self.listing = listing
+
+    def list_blobs(
+        self,
+        bucket: str,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        fields: str | None = None,
+        start_offset: str | None = None,
+        **kwargs: Any,
+    ) -> FakeBlobIterator:
+        """List the objects (or the sub prefixes, when the delimiter is set) under the prefix."""
+        if delimiter == "/":
+            return FakeBlobIterator([], prefixes=[p for p in self.listing if p.startswith(prefix or "")])
+        items = self.listing.get(prefix or "", [])
+        if start_offset:
+            items = [item for item in items if item["name"] >= start_offset]
+        return FakeBlobIterator(items)
@@ -0,0 +1,277 @@
+"""End-to-end benchmark of the fetch transfers against a local FTP server and the GCS emulator.
+
+Starts an anonymous `pyftpdlib` server and `gcloud-storage-emulator` on free local ports, generates
+release-shaped files (GWAS Catalog associations TSV, plain and as a single-member zip) under a
+`releases/YYYY/MM/DD/` directory and transfers them with `FTPtoGCPTransferableObject` through the
+`TransferManager` at several concurrency levels.
+
+Every run transfers `--files` copies of one file in a fresh process and reports:
+
+    * `MB/s` - the throughput of the uploaded (unzipped) content.
+    * `peak rss` - the peak resident memory growth of the process during the transfers.
+    * `loop lag` - the 99th percentile and maximum delay of a 10 ms ticker running on the event loop,
+      the time the loop was blocked by synchronous work (unzip, upload) instead of serving the other transfers.
+
+Usage:
+
+    uv run python benchmarks/transfer.py
+    uv run python benchmarks/transfer.py --sizes-mb 1 64 1024 4096 --concurrency 1 4 16 --files 8
+    uv run python benchmarks/transfer.py --memory-budget-mb 2048 --output transfer.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from itertools import product
+from pathlib import Path
+
+from loguru import logger
+
+FORMATS = ("tsv", "zip")
+RELEASE_DIR = "pub/databases/gwas/releases/2025/01/01"
+"""Release directory of the generated files, the transfer resolves the release date from it."""
+
+BUCKET = "gwas_catalog_inputs"
+LAG_INTERVAL = 0.01
+"""Interval in seconds of the ticker measuring the event loop lag."""
+
+BLOCK_SIZE = 1024 * 1024
+COLUMNS = (
+    "DATE ADDED TO CATALOG",
+    "PUBMEDID",
+    "FIRST AUTHOR",
+    "DISEASE/TRAIT",
+    "CHR_ID",
+    "CHR_POS",
+    "SNPS",
+    "P-VALUE",
+    "OR or BETA",
+    "95% CI (TEXT)",
+    "MAPPED_TRAIT_URI",
+    "STUDY ACCESSION",
+)
+
+
+def _rows(rng: random.Random, size: int) -> bytes:
+    """Generate associations rows of about `size` bytes."""
+    rows, total = [], 0
+    while total < size:
+        row = "\t".join([
+            f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            str(rng.randint(10_000_000, 40_000_000)),
+            f"Author{rng.randint(1, 50_000)} A",
+            f"Trait {rng.randint(1, 5_000)} measurement",
+            str(rng.randint(1, 22)),
+            str(rng.randint(1, 250_000_000)),
+            f"rs{rng.randint(1, 900_000_000)}",
+            f"{rng.randint(1, 9)}E-{rng.randint(8, 300)}",
+            f"{rng.uniform(0.5, 2.5):.3f}",
+            f"[{rng.uniform(0.1, 1):.2f}-{rng.uniform(1, 3):.2f}]",
+            f"http://www.ebi.ac.uk/efo/EFO_{rng.randint(1, 9_999_999):07d}",
+            f"GCST{rng.randint(1, 99_999_999):09d}",
+        ])
+        rows.append(row)
+        total += len(row) + 1
+    return ("\n".join(rows) + "\n").encode()
+
+
+def _content(size: int, seed: int = 42) -> Iterator[bytes]:
+    """Yield the blocks of an associations TSV of `size` bytes.
+
+    A pool of random blocks is written in random order, the repeats are further apart than the deflate window,
+    so the zipped files compress like the real release files.
+    """
+    rng = random.Random(seed)
+    blocks = [_rows(rng, BLOCK_SIZE) for _ in range(16)]
+    header = ("\t".join(COLUMNS) + "\n").encode()
+    yield header
+    written = len(header)
+    while written < size:
+        block = rng.choice(blocks)[: size - written]
+        yield block
+        written += len(block)
+
+
+def write_release_file(path: Path, size: int, fmt: str) -> None:
+    """Write an associations file of `size` uncompressed bytes, as a plain TSV or a single-member zip."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "zip":
+        with (
+            zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as z,
+            z.open(path.with_suffix(".tsv").name, "w", force_zip64=True) as f,
+        ):
+            for block in _content(size):
+                f.write(block)
+    else:
+        with path.open("wb") as f:
+            for block in _content(size):
+                f.write(block)
+
+
+def _free_port() -> int:
+    """Get a free local port."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def _service(args: list[str], port: int, cwd: Path, timeout: float = 30) -> Generator[None]:
+    """Run the service in a subprocess until the context exits, waiting until it listens on the port."""
+    process = subprocess.Popen(args, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"{args[2]} did not start on port {port}") from None
+                time.sleep(0.1)
+        yield
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@contextmanager
+def ftp_server(root: Path) -> Generator[str]:
+    """Serve the directory over anonymous FTP, yield the `host:port` of the server."""
+    port = _free_port()
+    with _service([sys.executable, "-m", "pyftpdlib", "-i", "127.0.0.1", "-p", str(port), "-d", str(root)], port, root):
+        yield f"127.0.0.1:{port}"
+
+
+@contextmanager
+def gcs_emulator(data_dir: Path) -> Generator[str]:
+    """Run the GCS emulator with the benchmark bucket, yield its endpoint."""
+    port = _free_port()
+    args = [sys.executable, "-m", "gcloud_storage_emulator", "start", "-H", "127.0.0.1", "--port", str(port)]
+    # The emulator stores the objects under its working directory.
+    with _service([*args, "--default-bucket", BUCKET, "-q"], port, data_dir):
+        yield f"http://127.0.0.1:{port}"
+
+
+async def _monitor_lag(lags: list[float]) -> None:
+    """Record how late the ticker wakes up, the time the event loop was blocked."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(time.perf_counter() - start - LAG_INTERVAL)
+
+
+def _measure(
+    ftp: str, endpoint: str, names: list[str], size: int, concurrency: int, memory_budget: int | None
+) -> dict[str, float]:
+    """Transfer the files in the current process and measure the throughput, peak memory and event loop lag."""
+    os.environ["STORAGE_EMULATOR_HOST"] = endpoint
+    os.environ["TQDM_DISABLE"] = "1"
+    logger.remove()
+    import google.cloud.storage.blob
+
+    from gentroutils.io.gcs import gcs_client
+    from gentroutils.io.path import GCSPath
+    from gentroutils.io.transfer import FTPtoGCPTransferableObject, MemoryBudget
+    from gentroutils.transfer import TransferManager
+
+    # The emulator reports wrong checksums for resumable uploads, every upload is sent as a single multipart request.
+    google.cloud.storage.blob._MAX_MULTIPART_SIZE = 2**62
+
+    budget = MemoryBudget(memory_budget) if memory_budget else None
+    transferable_objects = [
+        FTPtoGCPTransferableObject(
+            source=f"ftp://{ftp}/{RELEASE_DIR}/{name}",
+            destination=f"gs://{BUCKET}/{concurrency}/{Path(name).with_suffix('.tsv')}",
+            budget=budget,
+        )
+        for name in names
+    ]
+    gcs_client(pool_size=concurrency)
+
+    async def run() -> tuple[float, list[float]]:
+        lags: list[float] = []
+        monitor = asyncio.create_task(_monitor_lag(lags))
+        start = time.perf_counter()
+        await TransferManager.transfer_ftp_to_gcp(transferable_objects, concurrency)
+        wall = time.perf_counter() - start
+        monitor.cancel()
+        return wall, sorted(lags) or [0.0]
+
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    wall, lags = asyncio.run(run())
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    uploaded = gcs_client().bucket(BUCKET).get_blob(GCSPath(transferable_objects[0].destination).object)
+    if uploaded is None or uploaded.size != size:
+        raise RuntimeError(f"{transferable_objects[0].destination} was not uploaded with {size} bytes")
+    return {
+        "wall_s": round(wall, 3),
+        "mb_per_s": round(size * len(names) / wall / 2**20, 1),
+        "peak_rss_mb": round((peak_rss - baseline_rss) / 1024, 1),
+        "lag_p99_ms": round(lags[int(0.99 * (len(lags) - 1))] * 1000, 1),
+        "lag_max_ms": round(lags[-1] * 1000, 1),
+        "budget_high_water_mark_mb": round(budget.high_water_mark / 2**20, 1) if budget else 0.0,
+    }
+
+
+def main() -> int:
+    """Run the transfer benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 64, 512], help="Uncompressed file sizes.")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--files", type=int, default=8, help="Number of files transferred by each run.")
+    parser.add_argument("--memory-budget-mb", type=int, help="Share a memory budget between the transfers.")
+    parser.add_argument("--work-dir", type=Path, help="Directory of the generated files and the emulator storage.")
+    parser.add_argument("--output", type=Path, help="Write the measurements as JSON.")
+    args = parser.parse_args()
+
+    memory_budget = args.memory_budget_mb * 2**20 if args.memory_budget_mb else None
+    results: dict[str, dict[str, dict[str, dict[str, float]]]] = {}
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(dir=args.work_dir) as tmp:
+        root, storage = Path(tmp) / "ftp", Path(tmp) / "gcs"
+        storage.mkdir()
+        for fmt, size_mb in product(args.formats, args.sizes_mb):
+            source = root / RELEASE_DIR / f"associations_{size_mb}mb.{fmt}"
+            write_release_file(source, size_mb * 2**20, fmt)
+            for i in range(args.files):
+                source.with_stem(f"{source.stem}_{i}").hardlink_to(source)
+
+        print(
+            f"{'format':>6} {'size [MB]':>10} {'files':>6} {'concurrency':>12} {'wall [s]':>9} {'MB/s':>8} "
+            f"{'peak rss [MB]':>14} {'lag p99 [ms]':>13} {'lag max [ms]':>13}"
+        )
+        with ftp_server(root) as ftp, gcs_emulator(storage) as endpoint:
+            for fmt, size_mb, concurrency in product(args.formats, args.sizes_mb, args.concurrency):
+                names = [f"associations_{size_mb}mb_{i}.{fmt}" for i in range(args.files)]
+                with ctx.Pool(1) as pool:
+                    m = pool.apply(_measure, (ftp, endpoint, names, size_mb * 2**20, concurrency, memory_budget))
+                results.setdefault(fmt, {}).setdefault(str(size_mb), {})[str(concurrency)] = m
+                print(
+                    f"{fmt:>6} {size_mb:>10} {args.files:>6} {concurrency:>12} {m['wall_s']:>9.2f} "
+                    f"{m['mb_per_s']:>8.1f} {m['peak_rss_mb']:>14.1f} {m['lag_p99_ms']:>13.1f} "
+                    f"{m['lag_max_ms']:>13.1f}"
+                )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
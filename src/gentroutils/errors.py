@@ -11,6 +11,7 @@ class GentroutilsErrorMessage(Enum):
     FILE_NAME_MISSING = "File name is missing in the URL: {url}"
     GCS_CLIENT_INITIALIZATION_FAILED = "Failed to initialize Google Cloud Storage client: {error}"
     FTP_SERVER_MISSING = "FTP server is missing in the URL: {url}"
+    HOST_MISSING = "Host is missing in the URL: {url}"
     INVALID_TRANSFERABLE_OBJECTS = (
         "Invalid transferable objects provided. Expected FTPtoGCPTransferableObject instances."
     )
@@ -21,6 +22,13 @@ class GentroutilsErrorMessage(Enum):
         "The destination must contain a template for the release date, e.g. some/path/{release_date}/file.txt."
     )
     EMPTY_TRANSFERABLE_OBJECTS = "Transferable objects list cannot be empty."
+    SOURCE_NOT_FOUND = "The source does not exist: {path}"
+    SOURCE_PATTERN_IN_DIRECTORY = "Glob patterns are only supported in the file name of the source: {source}"
+    SOURCE_PATTERN_NO_MATCH = "No file in the release directory matches the source pattern: {source}"
+    DESTINATION_NOT_UNIQUE = (
+        "The source pattern {source} matches {matches} files, "
+        "the destination needs a {{filename}} or {{stem}} placeholder: {destination}"
+    )
 
 
 class GentroutilsError(Exception):
@@ -0,0 +1,106 @@
+"""Local copies of the objects uploaded during an otter run."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from gentroutils.io.files import evict_least_recently_used, write_atomic
+
+DEFAULT_ARTIFACT_CACHE_BYTES = 10 * 1024**3
+"""Default maximum size of the local copies."""
+
+
+@dataclass(frozen=True)
+class ArtifactCache:
+    """Cache of the local copies of uploaded objects, keyed by the object uri and generation.
+
+    Tasks uploading a file register the bytes they already hold in memory, so the tasks that depend on it within
+    the same run can read the local copy instead of downloading the object back. A copy is only returned for the
+    generation it was registered with, so an object that was overwritten afterwards is never served stale.
+
+    Each artifact is a small JSON entry named after the hash of the uri, pointing to the content stored once per
+    SHA-256 digest under `objects/`, so tasks running in separate processes can register artifacts without a shared
+    manifest and the same content uploaded to several uris (a dated release and `latest`) is stored once. When the
+    contents exceed `max_bytes`, the least recently used ones are evicted.
+
+    Examples:
+    ---
+    >>> import tempfile
+    >>> cache = ArtifactCache(Path(tempfile.mkdtemp()))
+    >>> path = cache.register("gs://bucket/studies.tsv", 1, b"studyId")
+    >>> cache.lookup("gs://bucket/studies.tsv", 1) == path
+    True
+    >>> cache.lookup("gs://bucket/studies.tsv", 2) is None
+    True
+    """
+
+    root: Path
+    """Directory holding the artifacts, usually under the otter `work_path`."""
+    max_bytes: int = DEFAULT_ARTIFACT_CACHE_BYTES
+    """Maximum size of the local copies."""
+
+    def _entry_path(self, uri: str) -> Path:
+        """Get the path of the entry of the uri."""
+        return self.root / "entries" / f"{hashlib.sha256(uri.encode()).hexdigest()[:32]}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        """Get the path of the content with the digest."""
+        return self.root / "objects" / digest
+
+    def register(self, uri: str, generation: int | str, content: bytes) -> Path | None:
+        """Store the local copy of the uploaded object.
+
+        Args:
+            uri (str): The uri the content was uploaded to.
+            generation (int | str): The generation of the uploaded object.
+            content (bytes): The uploaded content.
+
+        Returns:
+            Path | None: The path to the local copy, or None when the content is larger than the cache.
+        """
+        if len(content) > self.max_bytes:
+            logger.info("Upload to {} ({} bytes) is larger than the artifact cache, not keeping it.", uri, len(content))
+            return None
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            os.utime(object_path)
+        else:
+            write_atomic(object_path, content)
+        entry = {"uri": uri, "generation": str(generation), "size": len(content), "sha256": digest}
+        write_atomic(self._entry_path(uri), json.dumps(entry))
+        evict_least_recently_used(object_path.parent, self.max_bytes, keep=object_path)
+        logger.debug("Registered local copy of {} (generation {}) at {}.", uri, generation, object_path)
+        return object_path
+
+    def lookup(self, uri: str, generation: int | str) -> Path | None:
+        """Get the local copy of the object, if it was registered with the same generation.
+
+        Args:
+            uri (str): The object uri.
+            generation (int | str): The current generation of the object.
+
+        Returns:
+            Path | None: The path to the local copy, or None when there is no matching copy.
+        """
+        entry_path = self._entry_path(uri)
+        if not entry_path.exists():
+            return None
+        entry = json.loads(entry_path.read_text())
+        if entry["uri"] != uri or entry["generation"] != str(generation):
+            return None
+        object_path = self._object_path(entry["sha256"])
+        if not object_path.exists() or object_path.stat().st_size != entry["size"]:
+            return None
+        # The modification time of the content records its last use for the eviction.
+        os.utime(object_path)
+        return object_path
+
+
+__all__ = ["DEFAULT_ARTIFACT_CACHE_BYTES", "ArtifactCache"]
@@ -0,0 +1,115 @@
+"""Local cache of the files downloaded from the release servers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from gentroutils.io.files import evict_least_recently_used, write_atomic
+
+DEFAULT_DOWNLOAD_CACHE_BYTES = 10 * 1024**3
+"""Default maximum size of the cached downloads."""
+
+
+@dataclass(frozen=True)
+class DownloadCache:
+    """Content-addressed cache of the downloaded files, keyed by the source uri and the remote size and mtime.
+
+    A rerun of a failed release run reads the files it already downloaded from the cache instead of downloading
+    them again from the rate-limited release servers. An entry is only reused while the remote file keeps the size
+    and modification time it was downloaded with, and its content is verified against the stored SHA-256 digest,
+    so a changed or corrupted file is downloaded again.
+
+    The contents are stored once per digest under `objects/`, so the same file reached through different uris
+    (a dated release and `latest`) is stored once. When the contents exceed `max_bytes`, the least recently used
+    ones are evicted.
+
+    Examples:
+    ---
+    >>> import tempfile
+    >>> cache = DownloadCache(Path(tempfile.mkdtemp()), max_bytes=1024)
+    >>> _ = cache.store("ftp://example.com/associations.zip", 7, "20250101", b"content")
+    >>> cache.load("ftp://example.com/associations.zip", 7, "20250101")
+    b'content'
+    >>> cache.load("ftp://example.com/associations.zip", 7, "20250102") is None
+    True
+    """
+
+    root: Path
+    """Directory holding the cache, usually under the otter `work_path`."""
+    max_bytes: int = DEFAULT_DOWNLOAD_CACHE_BYTES
+    """Maximum size of the cached contents."""
+
+    def _entry_path(self, uri: str) -> Path:
+        """Get the path of the entry of the source uri."""
+        return self.root / "entries" / f"{hashlib.sha256(uri.encode()).hexdigest()[:32]}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        """Get the path of the content with the digest."""
+        return self.root / "objects" / digest
+
+    def load(self, uri: str, size: int, mtime: str) -> bytes | None:
+        """Get the cached content of the source, if it was downloaded with the same remote size and mtime.
+
+        Args:
+            uri (str): The source uri.
+            size (int): The current size of the remote file.
+            mtime (str): The current modification time of the remote file.
+
+        Returns:
+            bytes | None: The verified content, or None when there is no matching entry.
+        """
+        entry_path = self._entry_path(uri)
+        if not entry_path.exists():
+            return None
+        entry = json.loads(entry_path.read_text())
+        if entry["uri"] != uri or entry["size"] != size or entry["mtime"] != mtime:
+            return None
+        object_path = self._object_path(entry["sha256"])
+        try:
+            content = object_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(content).hexdigest() != entry["sha256"]:
+            logger.warning(f"Cached download of {uri} does not match its checksum, discarding it.")
+            object_path.unlink(missing_ok=True)
+            entry_path.unlink(missing_ok=True)
+            return None
+        # The modification time of the content records its last use for the eviction.
+        os.utime(object_path)
+        logger.info(f"Reusing the cached download of {uri}.")
+        return content
+
+    def store(self, uri: str, size: int, mtime: str, content: bytes | memoryview) -> Path | None:
+        """Store the downloaded content of the source.
+
+        Args:
+            uri (str): The source uri.
+            size (int): The size of the remote file.
+            mtime (str): The modification time of the remote file.
+            content (bytes | memoryview): The downloaded content.
+
+        Returns:
+            Path | None: The path to the cached content, or None when the content is larger than the cache.
+        """
+        if len(content) > self.max_bytes:
+            logger.info(f"Download of {uri} ({len(content)} bytes) is larger than the cache, not caching it.")
+            return None
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            os.utime(object_path)
+        else:
+            write_atomic(object_path, content)
+        entry = {"uri": uri, "size": size, "mtime": mtime, "sha256": digest}
+        write_atomic(self._entry_path(uri), json.dumps(entry))
+        evict_least_recently_used(object_path.parent, self.max_bytes, keep=object_path)
+        return object_path
+
+
+__all__ = ["DEFAULT_DOWNLOAD_CACHE_BYTES", "DownloadCache"]
@@ -0,0 +1,58 @@
+"""Helpers for the local files of the on-disk caches."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+
+from loguru import logger
+
+TEMPORARY_SUFFIX = ".tmp"
+"""Suffix of the files being written, skipped when the cache is evicted."""
+
+
+def write_atomic(path: Path, content: bytes | memoryview | str) -> None:
+    """Write the file through a temporary file replacing it, so a concurrent reader never sees a partial file.
+
+    The temporary file is unique to the call, so concurrent writers of the same path, in other processes or on
+    the worker threads of the same process, never write to the same temporary file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}{TEMPORARY_SUFFIX}")
+    try:
+        if isinstance(content, str):
+            tmp_path.write_text(content)
+        else:
+            tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def evict_least_recently_used(directory: Path, max_bytes: int, keep: Path | None = None) -> None:
+    """Remove the least recently used files of the directory until they fit in `max_bytes`.
+
+    The modification time of a file records its last use, the `keep` file is never removed.
+    The files removed in the meantime by a concurrent eviction are skipped.
+    """
+    files = []
+    for path in directory.iterdir():
+        if path.name.endswith(TEMPORARY_SUFFIX):
+            continue
+        try:
+            files.append((path, path.stat()))
+        except FileNotFoundError:
+            continue
+    total = sum(stat.st_size for _, stat in files)
+    for path, stat in sorted(files, key=lambda f: f[1].st_mtime):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        path.unlink(missing_ok=True)
+        total -= stat.st_size
+        logger.debug(f"Evicted {path} ({stat.st_size} bytes).")
+
+
+__all__ = ["TEMPORARY_SUFFIX", "evict_least_recently_used", "write_atomic"]
@@ -0,0 +1,26 @@
+"""Module for handling Google Cloud Storage operations in gentroutils."""
+
+from gentroutils.io.gcs.client import GCS_CLIENTS, GCSClientRegistry, gcs_client
+from gentroutils.io.gcs.listing import GCSGlob, GCSGlobLister, ListingShard
+from gentroutils.io.gcs.objects import copy_object, object_metadata, rewrite_blob, set_object_metadata
+from gentroutils.io.gcs.probe import GCSGzipProber, GzipProbe
+from gentroutils.io.gcs.releases import previous_release, release_prefix
+from gentroutils.io.gcs.upload import CompositeUploader
+
+__all__ = [
+    "GCS_CLIENTS",
+    "CompositeUploader",
+    "GCSClientRegistry",
+    "GCSGlob",
+    "GCSGlobLister",
+    "GCSGzipProber",
+    "GzipProbe",
+    "ListingShard",
+    "copy_object",
+    "gcs_client",
+    "object_metadata",
+    "previous_release",
+    "release_prefix",
+    "rewrite_blob",
+    "set_object_metadata",
+]
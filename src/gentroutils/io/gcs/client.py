@@ -0,0 +1,105 @@
+"""Process-wide Google Cloud Storage clients."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Client
+
+DEFAULT_POOL_SIZE = 10
+"""Default number of connections kept open per host, the `requests` default."""
+
+
+class GCSClientRegistry:
+    """Lazily created storage clients shared by every GCS access of the process.
+
+    Creating a `storage.Client` resolves the credentials and opens a new `requests` session, whose connection
+    pool holds 10 connections per host. The registry creates a single client per project on first use and sizes
+    the pool of its session to the concurrency of the callers, so concurrent uploads and reads reuse the open
+    connections instead of waiting for (or discarding) them.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        """Initialize the registry.
+
+        Args:
+            pool_size (int): Number of connections kept open per host by each client.
+        """
+        self.pool_size = pool_size
+        self._clients: dict[str | None, Client] = {}
+        self._lock = threading.Lock()
+
+    def client(self, project: str | None = None) -> Client:
+        """Get the shared client of the project, creating it on first use.
+
+        Args:
+            project (str | None): The project of the client, the project of the default credentials when None.
+
+        Returns:
+            Client: The shared storage client.
+        """
+        with self._lock:
+            if project not in self._clients:
+                from google.cloud import storage
+
+                client = storage.Client(project=project)
+                self._mount(client, self.pool_size)
+                self._clients[project] = client
+            return self._clients[project]
+
+    def resize(self, pool_size: int) -> None:
+        """Grow the connection pool of the existing and future clients to at least `pool_size` connections.
+
+        The pool is never shrunk, so callers with a lower concurrency do not limit the ones running alongside them.
+        """
+        with self._lock:
+            if pool_size <= self.pool_size:
+                return
+            logger.debug("Resizing the GCS connection pool from {} to {}.", self.pool_size, pool_size)
+            self.pool_size = pool_size
+            for client in self._clients.values():
+                self._mount(client, pool_size)
+
+    def clear(self) -> None:
+        """Drop the clients, the following calls create new ones."""
+        with self._lock:
+            self._clients.clear()
+
+    @staticmethod
+    def _mount(client: Client, pool_size: int) -> None:
+        """Mount adapters with `pool_size` connections on the sessions of the client."""
+        from requests.adapters import HTTPAdapter
+
+        # The authorized session refreshes the credentials through a session of its own.
+        sessions = [client._http]
+        if (auth_request := getattr(client._http, "_auth_request", None)) is not None:
+            sessions.append(auth_request.session)
+        for session in sessions:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+
+GCS_CLIENTS = GCSClientRegistry()
+"""The registry shared by the whole process."""
+
+
+def gcs_client(pool_size: int | None = None) -> Client:
+    """Get the shared storage client.
+
+    Args:
+        pool_size (int | None): Minimum number of connections the caller uses concurrently.
+
+    Returns:
+        Client: The shared storage client.
+    """
+    if pool_size is not None:
+        GCS_CLIENTS.resize(pool_size)
+    return GCS_CLIENTS.client()
+
+
+__all__ = ["DEFAULT_POOL_SIZE", "GCS_CLIENTS", "GCSClientRegistry", "gcs_client"]
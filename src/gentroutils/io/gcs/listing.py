@@ -0,0 +1,197 @@
+"""Concurrent listing of Google Cloud Storage objects matching glob patterns."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from loguru import logger
+
+from gentroutils.io.gcs.client import gcs_client
+from gentroutils.io.path import GCSPath
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Client
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+"""Default number of shards listed concurrently."""
+
+LISTING_FIELDS = ("name", "size", "generation", "updated")
+"""Object resource fields requested for every listed object."""
+
+GLOB_WILDCARD = re.compile(r"[*?\[{]")
+"""Characters that start a wildcard expression in the GCS `match_glob` syntax."""
+
+
+@dataclass(frozen=True)
+class GCSGlob:
+    """A glob pattern pointing to objects in a single GCS bucket.
+
+    Examples:
+    ---
+    >>> g = GCSGlob.from_uri("gs://gwas_catalog_inputs/raw_summary_statistics/**.h.tsv.gz")
+    >>> g.bucket
+    'gwas_catalog_inputs'
+    >>> g.pattern
+    'raw_summary_statistics/**.h.tsv.gz'
+    >>> g.prefix
+    'raw_summary_statistics/'
+    >>> g.is_recursive
+    True
+    >>> GCSGlob.from_uri("gs://bucket/dir/*.tsv").is_recursive
+    False
+    """
+
+    bucket: str
+    """The bucket name."""
+    pattern: str
+    """The glob pattern matched against the object names."""
+
+    @classmethod
+    def from_uri(cls, uri: str) -> GCSGlob:
+        """Create the glob from the `gs://bucket/pattern` uri.
+
+        The uri is validated as a `GCSPath`, but the pattern is split off by hand, since a url parser reads
+        the `?` wildcard as the start of a query string and `#` as the start of a fragment.
+        """
+        path = GCSPath(uri)
+        _, _, pattern = uri.removeprefix("gs://").partition("/")
+        return cls(path.bucket, pattern.strip("/"))
+
+    @property
+    def prefix(self) -> str:
+        """The literal part of the pattern preceding the first wildcard."""
+        wildcard = GLOB_WILDCARD.search(self.pattern)
+        return self.pattern[: wildcard.start()] if wildcard else self.pattern
+
+    @property
+    def is_recursive(self) -> bool:
+        """Whether the pattern can match objects nested below the literal prefix."""
+        remainder = self.pattern[len(self.prefix) :]
+        return "/" in remainder or "**" in remainder
+
+    @property
+    def matches_shallow(self) -> bool:
+        """Whether the pattern can match objects placed directly under the literal prefix."""
+        remainder = self.pattern[len(self.prefix) :]
+        return "/" not in remainder or "**" in remainder
+
+    def __str__(self) -> str:
+        """Return the glob as a `gs://` uri."""
+        return f"gs://{self.bucket}/{self.pattern}"
+
+
+@dataclass(frozen=True)
+class ListingShard:
+    """Independent part of the key space that can be listed in parallel with the other shards."""
+
+    glob: GCSGlob
+    """The glob this shard belongs to."""
+    prefix: str
+    """The object prefix covered by the shard."""
+    shallow: bool = False
+    """When set, only the objects directly under the prefix are listed (the `/` delimiter is applied)."""
+
+
+class GCSGlobLister:
+    """List objects matching one or more glob patterns using the server side `match_glob` filter.
+
+    The key space of each glob is split into shards by discovering the sub prefixes directly under the
+    literal prefix of the pattern, for example `raw_summary_statistics/GCST90000001-GCST90001000/`.
+    Each shard is then listed on its own thread, so the total listing time is bound by the largest shard
+    rather than the total number of objects in the bucket.
+    """
+
+    def __init__(
+        self,
+        globs: Sequence[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        client: Client | None = None,
+        fields: Sequence[str] = LISTING_FIELDS,
+    ):
+        """Initialize the lister.
+
+        Args:
+            globs (Sequence[str]): The `gs://` glob patterns to list.
+            max_workers (int): Maximum number of shards listed concurrently.
+            client (Client | None): The storage client to use, the shared client when not provided.
+            fields (Sequence[str]): The object resource fields requested for every listed object.
+        """
+        self.globs = list(dict.fromkeys(GCSGlob.from_uri(g) for g in globs))
+        self.max_workers = max_workers
+        self.client = client or gcs_client(pool_size=max_workers)
+        self.fields = tuple(fields)
+
+    def _discover_prefixes(self, glob: GCSGlob) -> list[str]:
+        """Discover the sub prefixes directly under the literal prefix of the glob."""
+        iterator = self.client.list_blobs(
+            glob.bucket, prefix=glob.prefix, delimiter="/", fields="prefixes,nextPageToken"
+        )
+        for _ in iterator.pages:
+            pass
+        return sorted(iterator.prefixes)
+
+    def shards(self) -> list[ListingShard]:
+        """Split the globs into shards that can be listed independently."""
+        shards: list[ListingShard] = []
+        for glob in self.globs:
+            if glob.matches_shallow:
+                shards.append(ListingShard(glob, glob.prefix, shallow=glob.is_recursive))
+            if glob.is_recursive:
+                shards.extend(ListingShard(glob, prefix) for prefix in self._discover_prefixes(glob))
+        logger.debug("Split {} glob(s) into {} listing shards.", len(self.globs), len(shards))
+        return shards
+
+    def _list_shard(self, shard: ListingShard, start_offset: str | None = None) -> Iterator[list[dict[str, Any]]]:
+        """List a single shard page by page, optionally skipping the objects named before `start_offset`.
+
+        The pages are returned as the raw JSON object resources restricted to the listed `fields`,
+        which avoids building a `Blob` instance for every listed object.
+        """
+        iterator = self.client.list_blobs(
+            shard.glob.bucket,
+            prefix=shard.prefix,
+            delimiter="/" if shard.shallow else None,
+            match_glob=shard.glob.pattern,
+            start_offset=start_offset,
+            fields=f"items({','.join(self.fields)}),nextPageToken",
+        )
+        for page in iterator.pages:
+            yield page.raw_page.get("items", [])
+
+    def map_pages(
+        self,
+        func: Callable[[GCSGlob, list[dict[str, Any]]], T],
+        start_offset: Callable[[ListingShard], str | None] | None = None,
+    ) -> Iterator[T]:
+        """Apply the function to every listing page.
+
+        The function is called on the worker thread that listed the page, so the pages do not need to be
+        collected before being converted. The results are yielded in order of completion.
+
+        Args:
+            func (Callable[[GCSGlob, list[dict[str, Any]]], T]): Function converting the object resources of a single page.
+                Each resource holds the listed `fields` as returned by the JSON API (numbers are encoded as strings).
+            start_offset (Callable[[ListingShard], str | None] | None): Function giving the object name each shard
+                is listed from (inclusive), the whole shard is listed when it returns None.
+
+        Yields:
+            T: Result of the function for each page.
+        """
+
+        def list_shard(shard: ListingShard) -> list[T]:
+            pages = self._list_shard(shard, start_offset(shard) if start_offset is not None else None)
+            return [func(shard.glob, page) for page in pages]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gcs-listing") as executor:
+            futures = [executor.submit(list_shard, shard) for shard in self.shards()]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+__all__ = ["GCSGlob", "GCSGlobLister", "ListingShard"]
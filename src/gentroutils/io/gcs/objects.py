@@ -0,0 +1,66 @@
+"""Metadata lookups and server-side copies of Google Cloud Storage objects."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from gentroutils.io.gcs.client import gcs_client
+from gentroutils.io.path import GCSPath
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Blob
+
+
+def rewrite_blob(blob: Blob, source: Blob) -> None:
+    """Copy the source object to the blob server side, following the rewrite tokens of the large objects."""
+    token, _, _ = blob.rewrite(source)
+    while token is not None:
+        token, _, _ = blob.rewrite(source, token=token)
+
+
+def object_metadata(uri: str) -> dict[str, str] | None:
+    """Get the custom metadata of the object, None when the object does not exist."""
+    path = GCSPath(uri)
+    blob = gcs_client().bucket(path.bucket).get_blob(path.object)
+    return dict(blob.metadata or {}) if blob is not None else None
+
+
+def set_object_metadata(uri: str, metadata: dict[str, str]) -> None:
+    """Add the custom metadata to the object, keeping its content and the other metadata."""
+    blob = GCSPath(uri).blob()
+    blob.metadata = metadata
+    blob.patch()
+
+
+def read_object(uri: str) -> bytes:
+    """Download the content of the object with the shared storage client."""
+    return GCSPath(uri).blob().download_as_bytes()
+
+
+def write_object(uri: str, content: bytes) -> None:
+    """Upload the content to the object with the shared storage client."""
+    GCSPath(uri).blob().upload_from_string(content)
+
+
+def copy_object(source: str, destination: str) -> None:
+    """Copy the object server side, the content is not downloaded.
+
+    Args:
+        source (str): The `gs://` uri of the object to copy.
+        destination (str): The `gs://` uri of the copy.
+
+    Raises:
+        FileNotFoundError: If the source object does not exist.
+    """
+    source_path = GCSPath(source)
+    source_blob = gcs_client().bucket(source_path.bucket).get_blob(source_path.object)
+    if source_blob is None:
+        raise FileNotFoundError(f"The object {source} does not exist.")
+    blob = GCSPath(destination).blob()
+    rewrite_blob(blob, source_blob)
+    logger.info(f"Copied {source} to {destination}.")
+
+
+__all__ = ["copy_object", "object_metadata", "read_object", "rewrite_blob", "set_object_metadata", "write_object"]
@@ -0,0 +1,203 @@
+"""Probing of gzipped TSV objects in Google Cloud Storage with ranged reads."""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from google.api_core.exceptions import GoogleAPICallError
+from loguru import logger
+
+from gentroutils.io.gcs.client import gcs_client
+from gentroutils.io.path import GCSPath
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Client
+
+DEFAULT_HEAD_BYTES = 4 * 1024
+"""Default number of bytes read from the start of the object to decode the TSV header."""
+
+DEFAULT_MAX_PROBES = 16
+"""Default number of objects probed concurrently."""
+
+GZIP_MAGIC = b"\x1f\x8b"
+"""The first two bytes of every gzip member."""
+
+GZIP_TRAILER_SIZE = 8
+"""The size of the gzip trailer, the CRC32 followed by the `ISIZE`."""
+
+GZIP_MIN_SIZE = 18
+"""The size of the gzip header and trailer, no valid gzip file is smaller."""
+
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+"""The empty block closing every BGZF (blocked gzip) file, as written by `bgzip`."""
+
+
+def decode_header(head: bytes, separator: str = "\t") -> list[str] | None:
+    r"""Decompress the start of the gzip file and split its first line into the column names.
+
+    Args:
+        head (bytes): The first bytes of the gzip file.
+        separator (str): The separator of the columns.
+
+    Returns:
+        list[str] | None: The column names, None when the bytes are not gzip compressed or the first line is not
+            complete within them.
+
+    Examples:
+    ---
+    >>> import gzip
+    >>> decode_header(gzip.compress(b"variant_id\tp_value\nrs1\t0.1\n"))
+    ['variant_id', 'p_value']
+    >>> decode_header(b"variant_id\tp_value\n") is None
+    True
+    """
+    if not head.startswith(GZIP_MAGIC):
+        return None
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    try:
+        text = decompressor.decompress(head)
+    except zlib.error:
+        return None
+    line, newline, _ = text.partition(b"\n")
+    # Without a line break the header is only complete when the whole (tiny) file was decompressed.
+    if not newline and not decompressor.eof:
+        return None
+    line = line.rstrip(b"\r")
+    return line.decode("utf-8", errors="replace").split(separator) if line else None
+
+
+def decode_isize(trailer: bytes) -> int | None:
+    """Decode the uncompressed size (modulo 2**32) stored in the last 4 bytes of the gzip trailer.
+
+    Args:
+        trailer (bytes): The last 8 bytes of the gzip file.
+
+    Returns:
+        int | None: The uncompressed size, None when the trailer does not have the size of a gzip trailer.
+
+    Examples:
+    ---
+    >>> import gzip
+    >>> decode_isize(gzip.compress(b"x" * 1000)[-8:])
+    1000
+    """
+    if len(trailer) != GZIP_TRAILER_SIZE:
+        return None
+    return struct.unpack("<I", trailer[4:])[0]
+
+
+def is_bgzf(head: bytes) -> bool:
+    """Whether the gzip header carries the `BC` extra subfield of the BGZF format.
+
+    Args:
+        head (bytes): The first bytes of the gzip file.
+
+    Returns:
+        bool: True when the file is BGZF compressed.
+
+    Examples:
+    ---
+    >>> import gzip
+    >>> is_bgzf(BGZF_EOF), is_bgzf(gzip.compress(b"x"))
+    (True, False)
+    """
+    # FLG.FEXTRA is set and the extra field starts with the `BC` subfield, after the 2 bytes of XLEN.
+    return head.startswith(GZIP_MAGIC) and len(head) >= 14 and bool(head[3] & 0x04) and head[12:14] == b"BC"
+
+
+@dataclass(frozen=True)
+class GzipProbe:
+    """Metadata of a gzipped TSV object decoded from its head and trailer."""
+
+    uri: str
+    """The probed object uri."""
+    columns: list[str] | None
+    """The columns of the TSV header, None when it could not be decoded."""
+    compressed_size: int | None
+    """The size of the object in bytes."""
+    uncompressed_size: int | None
+    """The uncompressed size from the gzip `ISIZE` field, wrapping around for files of 4 GiB and more.
+
+    None for the BGZF files, whose trailer only holds the size of the empty closing block.
+    """
+    is_complete: bool | None
+    """Whether the object is a complete gzip file, None when it cannot be told without decompressing it.
+
+    A BGZF file is complete when it ends with the `BGZF_EOF` block, which `bgzip` writes last, so a truncated
+    upload is caught. The last bytes of a truncated plain gzip file are indistinguishable from a trailer, so
+    its completeness is unknown. Objects that are not gzip compressed, or smaller than an empty gzip file,
+    are never complete.
+    """
+
+
+class GCSGzipProber:
+    """Probe gzipped TSV objects without downloading them.
+
+    For every object two ranged reads are issued: the first `head_bytes` to decode the gzip and TSV headers,
+    and the last 28 bytes, the size of the `BGZF_EOF` block, holding the gzip `ISIZE`. The objects are probed on a bounded thread pool,
+    so at most `max_workers` objects are read at the same time.
+    """
+
+    def __init__(
+        self, max_workers: int = DEFAULT_MAX_PROBES, head_bytes: int = DEFAULT_HEAD_BYTES, client: Client | None = None
+    ):
+        """Initialize the prober.
+
+        Args:
+            max_workers (int): Maximum number of objects probed concurrently.
+            head_bytes (int): Number of bytes read from the start of each object.
+            client (Client | None): The storage client to use, the shared client when not provided.
+        """
+        self.max_workers = max_workers
+        self.head_bytes = head_bytes
+        self.client = client or gcs_client(pool_size=max_workers)
+
+    def probe(self, uri: str, size: int | None = None) -> GzipProbe:
+        """Probe a single object.
+
+        Args:
+            uri (str): The `gs://` uri of the object.
+            size (int | None): The object size from the listing, the tail is read with a suffix range when unknown.
+
+        Returns:
+            GzipProbe: The decoded metadata, with empty fields when the object could not be read.
+        """
+        path = GCSPath(uri)
+        blob = self.client.bucket(path.bucket).blob(path.object)
+        tail_start = max(size - len(BGZF_EOF), 0) if size is not None else -len(BGZF_EOF)
+        try:
+            # The raw download keeps GCS from transcoding objects stored with `Content-Encoding: gzip`,
+            # which would ignore the requested range.
+            head = blob.download_as_bytes(start=0, end=self.head_bytes - 1, raw_download=True, checksum=None)
+            tail = blob.download_as_bytes(start=tail_start, raw_download=True, checksum=None)
+        except GoogleAPICallError as e:
+            logger.warning("Failed to probe {}: {}", uri, e)
+            return GzipProbe(uri, None, size, None, None)
+        columns = decode_header(head)
+        if not head.startswith(GZIP_MAGIC) or (size if size is not None else len(tail)) < GZIP_MIN_SIZE:
+            return GzipProbe(uri, columns, size, None, False)
+        if is_bgzf(head):
+            return GzipProbe(uri, columns, size, None, tail.endswith(BGZF_EOF))
+        return GzipProbe(uri, columns, size, decode_isize(tail[-GZIP_TRAILER_SIZE:]), None)
+
+    def probe_many(self, objects: Iterable[tuple[str, int | None]]) -> list[GzipProbe]:
+        """Probe the objects concurrently.
+
+        Args:
+            objects (Iterable[tuple[str, int | None]]): Pairs of the object uri and its size (when known).
+
+        Returns:
+            list[GzipProbe]: The probes in the order of the objects.
+        """
+        objects = list(objects)
+        logger.debug("Probing {} objects with up to {} concurrent reads.", len(objects), self.max_workers)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gcs-probe") as executor:
+            return list(executor.map(lambda o: self.probe(*o), objects))
+
+
+__all__ = ["BGZF_EOF", "GCSGzipProber", "GzipProbe", "decode_header", "decode_isize", "is_bgzf"]
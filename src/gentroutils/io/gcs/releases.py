@@ -0,0 +1,73 @@
+"""Lookup of the previous releases uploaded under a destination template."""
+
+from __future__ import annotations
+
+import re
+
+from loguru import logger
+
+from gentroutils.io.gcs.client import gcs_client
+
+RELEASE_DIRECTORY = re.compile(r"^\d{8}$")
+"""Name of a release directory, the `%Y%m%d` formatted release date."""
+
+
+def release_prefix(template: str) -> str | None:
+    """Get the prefix holding the release directories of the destination template.
+
+    Args:
+        template (str): The destination template.
+
+    Returns:
+        str | None: The `gs://` prefix preceding the `{release_date}` directory, None when `{release_date}` is not
+            a whole directory of a GCS path.
+
+    Examples:
+    ---
+    >>> release_prefix("gs://gwas_catalog_inputs/gentroutils/{release_date}/{stem}.tsv")
+    'gs://gwas_catalog_inputs/gentroutils/'
+    >>> release_prefix("gs://gwas_catalog_inputs/{release_date}/pending/curation.tsv")
+    'gs://gwas_catalog_inputs/'
+    >>> release_prefix("gs://gwas_catalog_inputs/gentroutils/stats_{release_date}.json") is None
+    True
+    """
+    before, found, after = template.partition("{release_date}")
+    if not found or not before.startswith("gs://") or not before.endswith("/") or not after.startswith("/"):
+        return None
+    return before
+
+
+def previous_release(template: str, release_date: str) -> str | None:
+    """Find the latest release uploaded under the destination template before the release date.
+
+    The release directories are listed with a single delimited listing of the prefix preceding the
+    `{release_date}` directory of the template, the `latest` directory of the promoted releases is skipped.
+
+    Args:
+        template (str): The destination template, `{release_date}` must be a whole directory of the path.
+        release_date (str): The `%Y%m%d` formatted date of the current release.
+
+    Returns:
+        str | None: The `%Y%m%d` formatted date of the previous release, None when there is none.
+    """
+    prefix = release_prefix(template)
+    if prefix is None:
+        logger.debug(f"The release date is not a directory of {template}, previous releases are not looked up.")
+        return None
+    bucket, _, listed = prefix.removeprefix("gs://").partition("/")
+    iterator = gcs_client().list_blobs(bucket, prefix=listed, delimiter="/", fields="prefixes,nextPageToken")
+    for _ in iterator.pages:
+        pass
+    releases = sorted(
+        name
+        for name in (p.removeprefix(listed).rstrip("/") for p in iterator.prefixes)
+        if RELEASE_DIRECTORY.match(name) and name < release_date
+    )
+    if not releases:
+        logger.info(f"No release before {release_date} found under {prefix}.")
+        return None
+    logger.info(f"Found the previous release {releases[-1]} under {prefix}.")
+    return releases[-1]
+
+
+__all__ = ["RELEASE_DIRECTORY", "previous_release", "release_prefix"]
@@ -0,0 +1,152 @@
+"""Parallel composite uploads of large objects to Google Cloud Storage."""
+
+from __future__ import annotations
+
+import io
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Blob
+
+DEFAULT_COMPOSITE_UPLOAD_THRESHOLD = 150 * 1024 * 1024
+"""Default size from which an object is uploaded in parts, the `gsutil` default."""
+
+DEFAULT_COMPOSITE_PART_SIZE = 64 * 1024 * 1024
+"""Default size of the parts of a composite upload."""
+
+DEFAULT_COMPOSITE_PARALLELISM = 8
+"""Default number of parts of an object uploaded at the same time."""
+
+MAX_COMPOSE_SOURCES = 32
+"""Maximum number of objects a single `compose` request concatenates."""
+
+COMPOSITE_PART_PREFIX = "gentroutils-tmp/composite"
+"""Prefix of the temporary part objects, in the bucket of the composed object.
+
+Parts are deleted once composed. gentroutils does not remove the parts left by interrupted uploads, the destination
+buckets need a lifecycle rule deleting the objects under the prefix (see the composite uploads section of the README).
+"""
+
+
+def part_ranges(size: int, part_size: int) -> list[tuple[int, int]]:
+    """Split the object into the byte ranges of its parts, with at most `MAX_COMPOSE_SOURCES` parts.
+
+    The part size is grown when the object would need more parts than a single `compose` request concatenates.
+
+    Args:
+        size (int): The size of the object in bytes.
+        part_size (int): The requested size of the parts in bytes.
+
+    Returns:
+        list[tuple[int, int]]: The start (inclusive) and end (exclusive) offsets of the parts.
+
+    Examples:
+    ---
+    >>> part_ranges(10, 4)
+    [(0, 4), (4, 8), (8, 10)]
+    >>> len(part_ranges(1000, 1))
+    32
+    """
+    part_size = max(part_size, -(-size // MAX_COMPOSE_SOURCES))
+    return [(start, min(start + part_size, size)) for start in range(0, size, part_size)]
+
+
+@dataclass(frozen=True)
+class CompositeUploader:
+    """Upload engine splitting the large objects into parts uploaded concurrently and composed server side.
+
+    A single upload stream is bound by the throughput of one connection. Objects of at least `threshold` bytes
+    are uploaded as temporary part objects of `part_size` bytes, which are then concatenated into the destination
+    with a `compose` request and deleted. Smaller objects are uploaded with a single stream.
+
+    The concurrent uploads of an uploader share its slots, so at most `parallelism` parts are uploaded at the
+    same time across all of them, whatever the number of large objects uploaded concurrently.
+
+    The composed object carries a CRC32C checksum but no MD5 hash, each part is checked against its CRC32C
+    checksum when uploaded.
+
+    Examples:
+    ---
+    >>> uploader = CompositeUploader(threshold=100, part_size=40)
+    >>> uploader.is_composite(99), uploader.is_composite(100)
+    (False, True)
+    """
+
+    threshold: int = DEFAULT_COMPOSITE_UPLOAD_THRESHOLD
+    """Size in bytes from which the objects are uploaded in parts."""
+    part_size: int = DEFAULT_COMPOSITE_PART_SIZE
+    """Size in bytes of the parts."""
+    parallelism: int = DEFAULT_COMPOSITE_PARALLELISM
+    """Number of parts uploaded at the same time, across all the uploads of the uploader."""
+    _slots: threading.BoundedSemaphore = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Create the slots of the part uploads shared by the uploads."""
+        object.__setattr__(self, "_slots", threading.BoundedSemaphore(self.parallelism))
+
+    def is_composite(self, size: int) -> bool:
+        """Whether an object of the size is uploaded in parts."""
+        return size >= self.threshold
+
+    def upload(self, blob: Blob, content: bytes) -> int:
+        """Upload the content to the blob, in parts when it is at least `threshold` bytes long.
+
+        The metadata set on the blob before the call is applied to the uploaded object.
+
+        Args:
+            blob (Blob): The destination object.
+            content (bytes): The content of the object.
+
+        Returns:
+            int: The number of parts the object was uploaded in, 1 for a single stream.
+        """
+        if not self.is_composite(len(content)):
+            blob.upload_from_string(content)
+            return 1
+        ranges = part_ranges(len(content), self.part_size)
+        upload_id = uuid.uuid4().hex
+        parts = [blob.bucket.blob(f"{COMPOSITE_PART_PREFIX}/{upload_id}/{i:02d}") for i in range(len(ranges))]
+
+        def upload_part(index: int) -> None:
+            start, end = ranges[index]
+            # The streams share the buffer of the content, only the bytes read for a request are copied.
+            stream = io.BytesIO(content)
+            stream.seek(start)
+            with self._slots:
+                parts[index].upload_from_file(stream, size=end - start, checksum="crc32c", if_generation_match=0)
+
+        logger.info(f"Uploading {len(content)} bytes to {blob.name} in {len(parts)} parts.")
+        try:
+            with ThreadPoolExecutor(self.parallelism, thread_name_prefix="gentroutils-part") as pool:
+                list(pool.map(upload_part, range(len(parts))))
+            blob.compose(parts)
+        finally:
+            self._delete_parts(blob, parts)
+        return len(parts)
+
+    @staticmethod
+    def _delete_parts(blob: Blob, parts: list[Blob]) -> None:
+        """Delete the temporary parts, the ones that were not uploaded are skipped."""
+        from google.api_core.exceptions import GoogleAPIError
+
+        try:
+            blob.bucket.delete_blobs(parts, on_error=lambda _: None)
+        except GoogleAPIError as e:
+            logger.warning(f"Failed to delete the parts of {blob.name} under {COMPOSITE_PART_PREFIX}: {e}")
+
+
+__all__ = [
+    "COMPOSITE_PART_PREFIX",
+    "DEFAULT_COMPOSITE_PARALLELISM",
+    "DEFAULT_COMPOSITE_PART_SIZE",
+    "DEFAULT_COMPOSITE_UPLOAD_THRESHOLD",
+    "MAX_COMPOSE_SOURCES",
+    "CompositeUploader",
+    "part_ranges",
+]
@@ -0,0 +1,99 @@
+"""Cached listings of the FTP release directories."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import aioftp
+from loguru import logger
+
+from gentroutils.io.files import write_atomic
+from gentroutils.io.mirror import RemoteFile
+from gentroutils.io.path import FTPPath
+
+DEFAULT_LISTING_MAX_AGE = 3600
+"""Default number of seconds a cached directory listing is reused."""
+
+
+async def list_ftp_directory(directory: FTPPath) -> list[RemoteFile]:
+    """List the files directly under the FTP directory with a single `MLSD` (or `LIST`) command.
+
+    Args:
+        directory (FTPPath): The directory to list, the last component of the path is the directory itself.
+
+    Returns:
+        list[RemoteFile]: The files of the directory, sorted by name.
+    """
+    async with aioftp.Client.context(directory.host, directory.port, user="anonymous", password="anonymous") as ftp:  # noqa: S106
+        entries = await ftp.list(directory.path)
+    files = [RemoteFile.from_facts(path.name, info) for path, info in entries if info["type"] == "file"]
+    logger.debug(f"Listed {len(files)} files under {directory}.")
+    return sorted(files, key=lambda f: f.path)
+
+
+@dataclass(frozen=True)
+class FTPListingCache:
+    """Cache of the FTP directory listings, keyed by the directory uri.
+
+    The fetch tasks of a run expand their source patterns against the same release directory, the directory is
+    listed once and the listing is reused by the following tasks for `max_age` seconds.
+
+    Examples:
+    ---
+    >>> import tempfile
+    >>> from datetime import UTC, datetime
+    >>> cache = FTPListingCache(Path(tempfile.mkdtemp()))
+    >>> files = [RemoteFile("studies.tsv", 7, datetime(2025, 1, 1, tzinfo=UTC))]
+    >>> cache.store("ftp://example.com/releases/2025/01/01", files)
+    >>> cache.load("ftp://example.com/releases/2025/01/01") == files
+    True
+    >>> cache.load("ftp://example.com/releases/latest") is None
+    True
+    """
+
+    root: Path
+    """Directory holding the listings, usually under the otter `work_path`."""
+    max_age: float = DEFAULT_LISTING_MAX_AGE
+    """Number of seconds a listing is reused."""
+
+    def _path(self, uri: str) -> Path:
+        """Get the path of the listing of the directory uri."""
+        return self.root / f"{hashlib.sha256(uri.encode()).hexdigest()[:32]}.json"
+
+    def load(self, uri: str) -> list[RemoteFile] | None:
+        """Get the cached listing of the directory, None when it is missing or older than `max_age`."""
+        path = self._path(uri)
+        if not path.exists() or time.time() - path.stat().st_mtime > self.max_age:
+            return None
+        listing = json.loads(path.read_text())
+        if listing["uri"] != uri:
+            return None
+        return [RemoteFile.from_json(f) for f in listing["files"]]
+
+    def store(self, uri: str, files: list[RemoteFile]) -> None:
+        """Store the listing of the directory."""
+        write_atomic(self._path(uri), json.dumps({"uri": uri, "files": [f.to_json() for f in files]}))
+
+    async def list(self, directory: FTPPath) -> list[RemoteFile]:
+        """Get the listing of the directory, listing it on the server when it is not cached.
+
+        Args:
+            directory (FTPPath): The directory to list.
+
+        Returns:
+            list[RemoteFile]: The files of the directory, sorted by name.
+        """
+        files = self.load(str(directory))
+        if files is not None:
+            logger.debug(f"Reusing the cached listing of {directory}.")
+            return files
+        files = await list_ftp_directory(directory)
+        self.store(str(directory), files)
+        return files
+
+
+__all__ = ["DEFAULT_LISTING_MAX_AGE", "FTPListingCache", "list_ftp_directory"]
@@ -0,0 +1,243 @@
+"""Incremental mirror of an FTP directory tree to a Google Cloud Storage prefix."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+import aioftp
+from loguru import logger
+
+from gentroutils.io.gcs.listing import DEFAULT_MAX_WORKERS, GCSGlobLister
+from gentroutils.io.path import FTPPath, GCSPath
+
+DEFAULT_WALK_CONNECTIONS = 4
+"""Default number of FTP connections listing the directories of the tree concurrently."""
+
+MTIME_METADATA_KEY = "goog-reserved-file-mtime"
+"""Custom metadata holding the modification time of the mirrored file, in seconds since the epoch.
+
+This is the key `gsutil rsync` and `gcloud storage rsync` use, so the objects they synced are diffed the same way.
+"""
+
+MIRROR_LISTING_FIELDS = ("name", "size", "updated", "metadata")
+"""Object resource fields requested for every mirrored object."""
+
+
+@dataclass(frozen=True)
+class RemoteFile:
+    """A file listed on the FTP server."""
+
+    path: str
+    """The path of the file relative to the listed directory or the root of the walked tree."""
+    size: int
+    """The size of the file in bytes."""
+    mtime: datetime
+    """The modification time of the file reported by the server."""
+
+    def to_json(self) -> dict[str, Any]:
+        """Get the JSON representation of the file."""
+        return {**asdict(self), "mtime": self.mtime.isoformat()}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> RemoteFile:
+        """Create the file from its JSON representation."""
+        return cls(data["path"], data["size"], datetime.fromisoformat(data["mtime"]))
+
+    @classmethod
+    def from_facts(cls, path: str, facts: Mapping[str, Any]) -> RemoteFile:
+        """Create the file from the facts of its `MLSD` (or `LIST`) entry, as parsed by aioftp."""
+        mtime = datetime.strptime(facts["modify"][:14], "%Y%m%d%H%M%S").replace(tzinfo=UTC)
+        return cls(path, int(facts["size"]), mtime)
+
+
+@dataclass(frozen=True)
+class MirroredObject:
+    """An object found under the mirror prefix."""
+
+    size: int
+    """The size of the object in bytes."""
+    updated: datetime
+    """The time the object was last uploaded."""
+    mtime: datetime | None = None
+    """The modification time of the source file the object was mirrored from, when recorded."""
+
+    def is_current(self, file: RemoteFile) -> bool:
+        """Whether the object mirrors the current version of the file.
+
+        Objects without a recorded modification time are current when they were uploaded after the file was modified.
+        """
+        if self.size != file.size:
+            return False
+        if self.mtime is not None:
+            return self.mtime == file.mtime
+        return self.updated >= file.mtime
+
+
+async def walk_ftp(root: FTPPath, max_connections: int = DEFAULT_WALK_CONNECTIONS) -> list[RemoteFile]:
+    """List every file under the FTP directory, walking its sub directories concurrently.
+
+    The directories are listed with `MLSD` (aioftp falls back to `LIST` when the server does not support it) by
+    `max_connections` anonymous sessions taking the next directory from a shared queue, so the walk is bound by
+    the round trips of the deepest branch divided by the number of connections instead of the number of directories.
+
+    Args:
+        root (FTPPath): The directory to walk, the last component of the path is the directory itself.
+        max_connections (int): The number of FTP connections listing the directories.
+
+    Returns:
+        list[RemoteFile]: The files of the tree, sorted by path.
+    """
+    root_dir = PurePosixPath(root.path)
+    queue: asyncio.Queue[PurePosixPath] = asyncio.Queue()
+    queue.put_nowait(root_dir)
+    files: list[RemoteFile] = []
+
+    async def list_directories() -> None:
+        async with aioftp.Client.context(root.host, root.port, user="anonymous", password="anonymous") as ftp:  # noqa: S106
+            while True:
+                directory = await queue.get()
+                for path, info in await ftp.list(directory):
+                    if info["type"] == "dir":
+                        queue.put_nowait(PurePosixPath(path))
+                    elif info["type"] == "file":
+                        relative = str(PurePosixPath(path).relative_to(root_dir))
+                        files.append(RemoteFile.from_facts(relative, info))
+                # A failed directory is never marked done, so the walk cannot complete before the walker fails.
+                queue.task_done()
+
+    walkers = [asyncio.create_task(list_directories()) for _ in range(max_connections)]
+    walked = asyncio.create_task(queue.join())
+    # A walker only returns when it failed, the walk is then abandoned instead of waiting for its directories.
+    done, _ = await asyncio.wait([walked, *walkers], return_when=asyncio.FIRST_COMPLETED)
+    for task in [walked, *walkers]:
+        task.cancel()
+    await asyncio.gather(*walkers, return_exceptions=True)
+    for task in done:
+        task.result()
+    logger.info(f"Found {len(files)} files under {root}.")
+    return sorted(files, key=lambda f: f.path)
+
+
+def list_mirror(destination: GCSPath, max_workers: int = DEFAULT_MAX_WORKERS) -> dict[str, MirroredObject]:
+    """List the objects under the mirror prefix, keyed by their path relative to the prefix.
+
+    Args:
+        destination (GCSPath): The prefix of the mirror.
+        max_workers (int): Maximum number of listing shards listed concurrently.
+
+    Returns:
+        dict[str, MirroredObject]: The mirrored objects.
+    """
+    prefix = f"{destination.object}/"
+
+    def to_objects(_: Any, items: list[dict[str, Any]]) -> list[tuple[str, MirroredObject]]:
+        objects = []
+        for item in items:
+            mtime = (item.get("metadata") or {}).get(MTIME_METADATA_KEY)
+            objects.append((
+                item["name"].removeprefix(prefix),
+                MirroredObject(
+                    size=int(item["size"]),
+                    updated=datetime.fromisoformat(item["updated"]),
+                    mtime=datetime.fromtimestamp(int(mtime), tz=UTC) if mtime else None,
+                ),
+            ))
+        return objects
+
+    lister = GCSGlobLister([f"gs://{destination.bucket}/{prefix}**"], max_workers, fields=MIRROR_LISTING_FIELDS)
+    mirrored = {path: obj for page in lister.map_pages(to_objects) for path, obj in page}
+    logger.info(f"Found {len(mirrored)} objects under {destination}.")
+    return mirrored
+
+
+def plan_mirror(files: Iterable[RemoteFile], mirrored: dict[str, MirroredObject]) -> list[RemoteFile]:
+    """Get the files that are missing from the mirror or changed since they were mirrored.
+
+    Objects whose source file was removed are kept.
+
+    Args:
+        files (Iterable[RemoteFile]): The files found on the FTP server.
+        mirrored (dict[str, MirroredObject]): The mirrored objects keyed by their path relative to the mirror,
+            see `list_mirror`.
+
+    Returns:
+        list[RemoteFile]: The files to transfer, in the order of `files`.
+
+    Examples:
+    ---
+    >>> t = datetime(2025, 1, 1, tzinfo=UTC)
+    >>> files = [RemoteFile("a.tsv", 1, t), RemoteFile("b.tsv", 2, t), RemoteFile("c.tsv", 3, t)]
+    >>> mirrored = {"a.tsv": MirroredObject(1, t, t), "b.tsv": MirroredObject(1, t, t)}
+    >>> [f.path for f in plan_mirror(files, mirrored)]
+    ['b.tsv', 'c.tsv']
+    """
+    return [f for f in files if f.path not in mirrored or not mirrored[f.path].is_current(f)]
+
+
+@dataclass(frozen=True)
+class MirrorManifest:
+    """Manifest of a mirror run, recording the planned files and the files transferred so far.
+
+    The manifest is a JSON lines file: the run header with the planned files, then one line per transferred
+    file and a last line once the run completed. A run that failed halfway is resumed from the manifest without
+    walking the FTP tree and listing the mirror again, only the planned files that were not transferred are.
+    """
+
+    path: Path
+    """The manifest file, usually under the otter `work_path`."""
+    source: str
+    """The FTP directory being mirrored."""
+    destination: str
+    """The GCS prefix of the mirror."""
+
+    def resume(self) -> list[RemoteFile] | None:
+        """Get the files left to transfer by the interrupted run of the same mirror, None when there is none."""
+        if not self.path.exists():
+            return None
+        records = [json.loads(line) for line in self.path.read_text().splitlines() if line]
+        header = records[0] if records else {}
+        if header.get("source") != self.source or header.get("destination") != self.destination:
+            return None
+        if any(r.get("complete") for r in records):
+            return None
+        transferred = {r["transferred"] for r in records[1:] if "transferred" in r}
+        pending = [RemoteFile.from_json(f) for f in header["files"] if f["path"] not in transferred]
+        logger.info(f"Resuming the mirror run from {self.path}, {len(pending)} files left to transfer.")
+        return pending
+
+    def start(self, files: list[RemoteFile]) -> None:
+        """Record the files planned for the run, replacing the manifest of the previous run."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {"source": self.source, "destination": self.destination, "files": [f.to_json() for f in files]}
+        self.path.write_text(json.dumps(header) + "\n")
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Append the record to the manifest."""
+        with self.path.open("a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def transferred(self, file: RemoteFile) -> None:
+        """Record the transferred file."""
+        self._append({"transferred": file.path})
+
+    def complete(self) -> None:
+        """Record that every planned file was transferred."""
+        self._append({"complete": True})
+
+
+__all__ = [
+    "DEFAULT_WALK_CONNECTIONS",
+    "MTIME_METADATA_KEY",
+    "MirrorManifest",
+    "MirroredObject",
+    "RemoteFile",
+    "list_mirror",
+    "plan_mirror",
+    "walk_ftp",
+]
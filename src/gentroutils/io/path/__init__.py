@@ -2,5 +2,8 @@
 
 from gentroutils.io.path.ftp import FTPPath
 from gentroutils.io.path.gcs import GCSPath
+from gentroutils.io.path.http import HTTPPath
+from gentroutils.io.path.local import LocalPath
+from gentroutils.io.path.uri import URIPath, copy_uri, parse_uri
 
-__all__ = ["FTPPath", "GCSPath"]
+__all__ = ["FTPPath", "GCSPath", "HTTPPath", "LocalPath", "URIPath", "copy_uri", "parse_uri"]
@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING
 
 from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.path.uri import DEFAULT_CHUNK_SIZE, URIPath
 
+if TYPE_CHECKING:
+    import aioftp
 
-class FTPPath:
+FTP_DEFAULT_PORT = 21
+"""The port of the FTP servers whose uri does not set one."""
+
+
+class FTPPath(URIPath):
     """A class to represent a path in a cloud storage system."""
 
+    __slots__ = ("base_dir", "filename", "host", "port", "server")
+
     # Supported URL schemes
     SUPPORTED_SCHEMES = ["ftp"]
 
-    def __init__(self, uri: str) -> None:
-        """Initialize the FTPPath object.
+    server: str
+    """The FTP server."""
+    host: str
+    """The host name of the FTP server."""
+    port: int
+    """The port of the FTP server, 21 when the uri does not set one."""
+    filename: str
+    """The name of the file."""
+    base_dir: str
+    """The directory holding the file."""
+
+    def _parse(self, uri: str) -> None:
+        """Parse the FTP uri.
 
         Args:
             uri (str): The path to object in ftp server.
@@ -22,27 +44,41 @@ class FTPPath:
         Raises:
             GentroutilsError: If the URL scheme is not supported or if the server or filename is missing.
         """
-        self.uri = uri
-        # NOTE: The urlparse matches to following tuple
-        # ('scheme', 'netloc', 'path', 'params', 'query', 'fragment')
-        parsed_url = urlparse(uri)
-
-        if parsed_url.scheme not in self.SUPPORTED_SCHEMES:
-            raise GentroutilsError(GentroutilsErrorMessage.UNSUPPORTED_URL_SCHEME, scheme=parsed_url.scheme)
-
-        self.server = parsed_url.netloc
-        if not self.server:
+        super()._parse(uri)
+        if not self.netloc:
             raise GentroutilsError(GentroutilsErrorMessage.FTP_SERVER_MISSING, url=uri)
+        self._set("server", self.netloc)
+        host, _, port = self.netloc.partition(":")
+        self._set("host", host)
+        self._set("port", int(port) if port else FTP_DEFAULT_PORT)
 
-        self.filename = parsed_url.path.split("/")[-1]
-        if not self.filename:
+        filename = self.path.split("/")[-1]
+        if not filename:
             raise GentroutilsError(GentroutilsErrorMessage.FILE_NAME_MISSING, url=uri)
-        self.base_dir = "/".join(parsed_url.path.split("/")[0:-1])
+        self._set("filename", filename)
+        self._set("base_dir", "/".join(self.path.split("/")[0:-1]))
 
-    def __repr__(self) -> str:
-        """Return the string representation of the CloudPath object.
+    def _client(self) -> AbstractAsyncContextManager[aioftp.Client]:
+        """Get the anonymous FTP client context of the server."""
+        import aioftp
 
-        Returns:
-            str: The string representation of the CloudPath object.
-        """
-        return self.uri
+        return aioftp.Client.context(self.host, self.port, user="anonymous", password="anonymous")  # noqa: S106
+
+    async def read_stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Download the file in chunks over an anonymous FTP session."""
+        async with self._client() as ftp:
+            stream = await ftp.download_stream(self.path)
+            async with stream:
+                async for block in stream.iter_by_block(chunk_size):
+                    yield block
+
+    async def write_stream(self, chunks: AsyncIterable[bytes]) -> int:
+        """Upload the chunks over an anonymous FTP session."""
+        written = 0
+        async with self._client() as ftp:
+            stream = await ftp.upload_stream(self.path)
+            async with stream:
+                async for chunk in chunks:
+                    await stream.write(chunk)
+                    written += len(chunk)
+        return written
@@ -1,18 +1,33 @@
 """Google Cloud Storage (GCS) path representation."""
 
-from urllib.parse import urlparse
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import TYPE_CHECKING
 
 from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.path.uri import DEFAULT_CHUNK_SIZE, URIPath
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Blob
 
 
-class GCSPath:
+class GCSPath(URIPath):
     """A class to represent a path in a cloud storage system."""
 
+    __slots__ = ("bucket", "object")
+
     # Supported URL schemes
     SUPPORTED_SCHEMES = ["gs"]
 
-    def __init__(self, uri: str) -> None:
-        """Initialize the CloudPath object.
+    bucket: str
+    """The bucket name."""
+    object: str
+    """The object name."""
+
+    def _parse(self, uri: str) -> None:
+        """Parse the GCS uri.
 
         Args:
             uri (str): The path to the cloud storage object.
@@ -20,26 +35,56 @@ class GCSPath:
         Raises:
             GentroutilsError: If the URL scheme is not supported or if the bucket or object is missing.
         """
-        self.uri = uri
-        # NOTE: The urlparse matches to following tuple
-        # ('scheme', 'netloc', 'path', 'params', 'query', 'fragment')
-        parsed_url = urlparse(uri)
-
-        if parsed_url.scheme not in self.SUPPORTED_SCHEMES:
-            raise GentroutilsError(GentroutilsErrorMessage.UNSUPPORTED_URL_SCHEME, scheme=parsed_url.scheme)
-
-        self.bucket = parsed_url.netloc
-        if not self.bucket:
+        super()._parse(uri)
+        if not self.netloc:
             raise GentroutilsError(GentroutilsErrorMessage.BUCKET_NAME_MISSING, url=uri)
+        self._set("bucket", self.netloc)
 
-        self.object = parsed_url.path.lstrip("/").rstrip("/")
-        if not self.object:
+        obj = self.path.lstrip("/").rstrip("/")
+        if not obj:
             raise GentroutilsError(GentroutilsErrorMessage.FILE_NAME_MISSING, url=uri)
+        self._set("object", obj)
+
+    def blob(self) -> Blob:
+        """Get the `google.cloud.storage.Blob` of the object, bound to the shared storage client."""
+        from gentroutils.io.gcs import gcs_client
 
-    def __repr__(self) -> str:
-        """Return the string representation of the CloudPath object.
+        return gcs_client().bucket(self.bucket).blob(self.object)
+
+    async def read_stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Read the object in chunks, the blocking reads run on a worker thread."""
+        reader = await asyncio.to_thread(self.blob().open, "rb", chunk_size=chunk_size)
+        try:
+            while chunk := await asyncio.to_thread(reader.read, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(reader.close)
+
+    async def write_stream(self, chunks: AsyncIterable[bytes], metadata: dict[str, str] | None = None) -> int:
+        """Upload the chunks with a resumable upload, the object is only replaced once the upload completes.
+
+        When the chunks fail, the resumable upload is cancelled rather than finalized, so the object is left untouched.
+
+        Args:
+            chunks (AsyncIterable[bytes]): The content to upload.
+            metadata (dict[str, str] | None): The custom metadata set on the uploaded object.
 
         Returns:
-            str: The string representation of the CloudPath object.
+            int: The number of bytes uploaded.
+
+        Raises:
+            BaseException: The error raised by the chunks, once the upload is cancelled.
         """
-        return self.uri
+        blob = self.blob()
+        if metadata:
+            blob.metadata = metadata
+        writer = await asyncio.to_thread(blob.open, "wb")
+        written = 0
+        try:
+            async for chunk in chunks:
+                written += await asyncio.to_thread(writer.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(writer.terminate)
+            raise
+        await asyncio.to_thread(writer.close)
+        return written
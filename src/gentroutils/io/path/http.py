@@ -0,0 +1,58 @@
+"""HTTP(S) path representation."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator
+
+from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.path.uri import DEFAULT_CHUNK_SIZE, URIPath
+
+
+class HTTPPath(URIPath):
+    """A class to represent a resource served over HTTP(S)."""
+
+    __slots__ = ("host",)
+
+    # Supported URL schemes
+    SUPPORTED_SCHEMES = ["http", "https"]
+
+    host: str
+    """The host (with the port, if any) serving the resource."""
+
+    def _parse(self, uri: str) -> None:
+        """Parse the HTTP(S) uri.
+
+        Args:
+            uri (str): The url of the resource.
+
+        Raises:
+            GentroutilsError: If the URL scheme is not supported or if the host is missing.
+        """
+        super()._parse(uri)
+        if not self.netloc:
+            raise GentroutilsError(GentroutilsErrorMessage.HOST_MISSING, url=uri)
+        self._set("host", self.netloc)
+
+    async def read_stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Download the resource in chunks with a GET request."""
+        import aiohttp
+
+        async with aiohttp.ClientSession(raise_for_status=True) as session, session.get(self.uri) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def write_stream(self, chunks: AsyncIterable[bytes]) -> int:
+        """Upload the chunks as the body of a PUT request, sent with the chunked transfer encoding."""
+        import aiohttp
+
+        written = 0
+
+        async def counted() -> AsyncIterator[bytes]:
+            nonlocal written
+            async for chunk in chunks:
+                written += len(chunk)
+                yield chunk
+
+        async with aiohttp.ClientSession(raise_for_status=True) as session, session.put(self.uri, data=counted()):
+            pass
+        return written
@@ -0,0 +1,65 @@
+"""Local file path representation."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+
+from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.path.uri import DEFAULT_CHUNK_SIZE, URIPath
+
+
+class LocalPath(URIPath):
+    """A class to represent a file on the local disk, as a `file://` uri or a plain path."""
+
+    __slots__ = ("local_path",)
+
+    # Supported URL schemes, plain paths have no scheme
+    SUPPORTED_SCHEMES = ["file", ""]
+
+    local_path: Path
+    """The path to the file."""
+
+    def _parse(self, uri: str) -> None:
+        """Parse the file uri.
+
+        Args:
+            uri (str): The `file://` uri or the path to the file.
+
+        Raises:
+            GentroutilsError: If the URL scheme is not supported or if the file name is missing.
+        """
+        super()._parse(uri)
+        if not self.path or self.path.endswith("/"):
+            raise GentroutilsError(GentroutilsErrorMessage.FILE_NAME_MISSING, url=uri)
+        self._set("scheme", "file")
+        self._set("local_path", Path(self.path))
+
+    async def read_stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Read the file in chunks, the blocking reads run on a worker thread."""
+        file = await asyncio.to_thread(self.local_path.open, "rb")
+        try:
+            while chunk := await asyncio.to_thread(file.read, chunk_size):
+                yield chunk
+        finally:
+            file.close()
+
+    async def write_stream(self, chunks: AsyncIterable[bytes]) -> int:
+        """Write the chunks to a temporary file, which replaces the file once the stream is complete."""
+        await asyncio.to_thread(self.local_path.parent.mkdir, parents=True, exist_ok=True)
+        tmp_path = self.local_path.with_name(f".{self.local_path.name}.{uuid.uuid4().hex}.tmp")
+        written = 0
+        file = await asyncio.to_thread(tmp_path.open, "wb")
+        try:
+            async for chunk in chunks:
+                written += await asyncio.to_thread(file.write, chunk)
+        except BaseException:
+            file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        file.close()
+        await asyncio.to_thread(os.replace, tmp_path, self.local_path)
+        return written
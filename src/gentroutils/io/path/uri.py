@@ -0,0 +1,189 @@
+"""Base representation of the uris handled by gentroutils."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, ClassVar, Self, cast
+from urllib.parse import urlparse
+
+from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""Default size of the chunks read from a source stream."""
+
+INTERNED_PATHS = 16384
+"""Maximum number of parsed paths kept by the intern table."""
+
+
+@functools.lru_cache(maxsize=INTERNED_PATHS)
+def _intern(cls: type[URIPath], uri: str) -> URIPath:
+    """Parse the uri once and return the same instance for the following calls."""
+    path = object.__new__(cls)
+    path._parse(uri)
+    return path
+
+
+class URIPath:
+    """A parsed, immutable uri with a streaming reader and writer.
+
+    Paths are interned: constructing the same uri twice returns the same instance, so the uri is only parsed
+    once no matter how many times the path is validated or rebuilt, for example on every transfer retry.
+    Each subclass handles its `SUPPORTED_SCHEMES`, use `parse_uri` to get the path of the matching type.
+
+    Examples:
+    ---
+    >>> from gentroutils.io.path import GCSPath, parse_uri
+    >>> GCSPath("gs://bucket/file.tsv") is GCSPath("gs://bucket/file.tsv")
+    True
+    >>> parse_uri("gs://bucket/file.tsv") is GCSPath("gs://bucket/file.tsv")
+    True
+    >>> parse_uri("/tmp/file.tsv").scheme
+    'file'
+    """
+
+    __slots__ = ("netloc", "path", "scheme", "uri")
+
+    SUPPORTED_SCHEMES: ClassVar[list[str]] = []
+
+    uri: str
+    """The uri the path was created from."""
+    scheme: str
+    """The uri scheme."""
+    netloc: str
+    """The network location (server, host or bucket), empty for local files."""
+    path: str
+    """The path component of the uri."""
+
+    def __new__(cls, uri: str) -> Self:
+        """Get the interned path of the uri."""
+        return cast(Self, _intern(cls, uri))  # type: ignore[arg-type]
+
+    def _parse(self, uri: str) -> None:
+        """Parse the uri into the path attributes.
+
+        Args:
+            uri (str): The uri to parse.
+
+        Raises:
+            GentroutilsError: If the URL scheme is not supported.
+        """
+        # NOTE: The urlparse matches to following tuple
+        # ('scheme', 'netloc', 'path', 'params', 'query', 'fragment')
+        parsed_url = urlparse(uri)
+        if parsed_url.scheme not in self.SUPPORTED_SCHEMES:
+            raise GentroutilsError(GentroutilsErrorMessage.UNSUPPORTED_URL_SCHEME, scheme=parsed_url.scheme)
+        self._set("uri", uri)
+        self._set("scheme", parsed_url.scheme)
+        self._set("netloc", parsed_url.netloc)
+        self._set("path", parsed_url.path)
+
+    def _set(self, name: str, value: Any) -> None:
+        """Set the attribute while the path is parsed."""
+        object.__setattr__(self, name, value)  # noqa: PLC2801
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Paths are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Paths are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        """Paths of the same type are equal when they point to the same uri."""
+        return isinstance(other, URIPath) and type(self) is type(other) and self.uri == other.uri
+
+    def __hash__(self) -> int:
+        """Hash the path by its type and uri."""
+        return hash((type(self), self.uri))
+
+    def __reduce__(self) -> tuple[type[URIPath], tuple[str]]:
+        """Pickle the path as its uri, the copy is interned again when loaded."""
+        return type(self), (self.uri,)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the path.
+
+        Returns:
+            str: The uri of the path.
+        """
+        return self.uri
+
+    def read_stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Read the content of the path as a stream of chunks.
+
+        Args:
+            chunk_size (int): The maximum size of each chunk.
+
+        Returns:
+            AsyncIterator[bytes]: The chunks of the content.
+
+        Raises:
+            NotImplementedError: In the base class, the path types implement the reader of their scheme.
+        """
+        raise NotImplementedError("Implement in derivative class.")
+
+    async def write_stream(self, chunks: AsyncIterable[bytes]) -> int:
+        """Write the stream of chunks to the path, replacing the existing content.
+
+        Args:
+            chunks (AsyncIterable[bytes]): The content to write.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            NotImplementedError: In the base class, the path types implement the writer of their scheme.
+        """
+        raise NotImplementedError("Implement in derivative class.")
+
+
+@functools.cache
+def _path_types() -> dict[str, type[URIPath]]:
+    """Get the path type handling each scheme."""
+    from gentroutils.io.path import FTPPath, GCSPath, HTTPPath, LocalPath
+
+    return {scheme: cls for cls in (FTPPath, GCSPath, HTTPPath, LocalPath) for scheme in cls.SUPPORTED_SCHEMES}
+
+
+def parse_uri(uri: str | URIPath) -> URIPath:
+    """Get the interned path of the uri, with the path type selected by the uri scheme.
+
+    Strings without a scheme are treated as local file paths.
+
+    Args:
+        uri (str | URIPath): The uri, or an already parsed path returned as is.
+
+    Returns:
+        URIPath: The path of the type handling the uri scheme.
+
+    Raises:
+        GentroutilsError: If the URL scheme is not supported.
+    """
+    if isinstance(uri, URIPath):
+        return uri
+    scheme = urlparse(uri).scheme
+    if scheme not in _path_types():
+        raise GentroutilsError(GentroutilsErrorMessage.UNSUPPORTED_URL_SCHEME, scheme=scheme)
+    return _path_types()[scheme](uri)
+
+
+async def copy_uri(source: str | URIPath, destination: str | URIPath, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Stream the content of the source to the destination, for any pair of the supported schemes.
+
+    Only a single chunk is held in memory at a time, the next chunk is read when the destination consumed
+    the previous one.
+
+    Args:
+        source (str | URIPath): The source uri.
+        destination (str | URIPath): The destination uri.
+        chunk_size (int): The maximum size of each chunk.
+
+    Returns:
+        int: The number of bytes copied.
+    """
+    return await parse_uri(destination).write_stream(parse_uri(source).read_stream(chunk_size))
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "URIPath", "copy_uri", "parse_uri"]
@@ -1,6 +1,15 @@
 """Module for handling transfer operations in gentroutils."""
 
+from gentroutils.io.transfer.budget import MemoryBudget
 from gentroutils.io.transfer.ftp_to_gcs import FTPtoGCPTransferableObject
+from gentroutils.io.transfer.mirror import MirrorTransferableObject
 from gentroutils.io.transfer.polars_to_gcs import PolarsDataFrameToGCSTransferableObject
+from gentroutils.io.transfer.stream import StreamTransferableObject
 
-__all__ = ["FTPtoGCPTransferableObject", "PolarsDataFrameToGCSTransferableObject"]
+__all__ = [
+    "FTPtoGCPTransferableObject",
+    "MemoryBudget",
+    "MirrorTransferableObject",
+    "PolarsDataFrameToGCSTransferableObject",
+    "StreamTransferableObject",
+]
@@ -0,0 +1,146 @@
+"""Memory budget shared by the transfers of a batch."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from types import TracebackType
+from typing import Any, Self
+
+from loguru import logger
+
+
+class MemoryBudget:
+    """A budget of bytes the concurrent transfers of a batch can hold in memory at the same time.
+
+    Transfers reserve their buffers before allocating them. When the budget is exhausted the reserving transfer
+    waits (backpressure) until the others release enough bytes, the waiting transfers are served in order.
+
+    A reservation that can not fit, because it is larger than the budget or because every transfer holding memory
+    is itself waiting for more, is granted anyway so the batch keeps going. The budget is then exceeded by the
+    working set of a single transfer, which shows in the `high_water_mark`.
+
+    Examples:
+    ---
+    >>> async def main(budget):
+    ...     async with budget.reservation() as memory:
+    ...         await memory.grow(600)
+    ...         memory.shrink(200)
+    ...     return budget.in_use, budget.high_water_mark
+    >>> asyncio.run(main(MemoryBudget(1000)))
+    (0, 600)
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the budget.
+
+        Args:
+            limit (int): The number of bytes the transfers can hold at the same time.
+        """
+        self.limit = limit
+        self.in_use = 0
+        """The number of bytes currently reserved."""
+        self.high_water_mark = 0
+        """The highest number of bytes reserved at the same time."""
+        self._held: dict[asyncio.Task[Any] | None, int] = {}
+        self._waiters: deque[tuple[asyncio.Task[Any] | None, int, asyncio.Future[None]]] = deque()
+
+    def reservation(self) -> Reservation:
+        """Start a reservation that grows with the buffers of a transfer and is released when it ends."""
+        return Reservation(self)
+
+    async def acquire(self, nbytes: int) -> None:
+        """Reserve the bytes, waiting until they fit in the budget."""
+        task = asyncio.current_task()
+        if not self._waiters and self.in_use + nbytes <= self.limit:
+            self._grant(task, nbytes)
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((task, nbytes, future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(nbytes)
+            raise
+
+    def release(self, nbytes: int) -> None:
+        """Release the reserved bytes and let the waiting transfers in."""
+        task = asyncio.current_task()
+        self.in_use -= nbytes
+        held = self._held.get(task, 0) - nbytes
+        if held > 0:
+            self._held[task] = held
+        else:
+            self._held.pop(task, None)
+        self._wake()
+
+    def _grant(self, task: asyncio.Task[Any] | None, nbytes: int) -> None:
+        """Reserve the bytes for the task."""
+        self.in_use += nbytes
+        self._held[task] = self._held.get(task, 0) + nbytes
+        self.high_water_mark = max(self.high_water_mark, self.in_use)
+
+    def _stalled(self) -> bool:
+        """Whether every task holding memory waits for more, so none of them would ever release it."""
+        waiting = {task for task, _, future in self._waiters if not future.done()}
+        return all(task in waiting for task in self._held)
+
+    def _wake(self) -> None:
+        """Grant the reservations of the waiting transfers, in order, while they fit."""
+        while self._waiters:
+            task, nbytes, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            fits = self.in_use + nbytes <= self.limit
+            if not fits and not self._stalled():
+                return
+            if not fits:
+                logger.debug(f"Memory budget of {self.limit} bytes exceeded to let a transfer reserve {nbytes}.")
+            self._waiters.popleft()
+            self._grant(task, nbytes)
+            future.set_result(None)
+
+
+class Reservation:
+    """The bytes reserved by a transfer, released when the context exits.
+
+    Without a budget the reservation only keeps count of the bytes.
+    """
+
+    def __init__(self, budget: MemoryBudget | None) -> None:
+        """Initialize the reservation.
+
+        Args:
+            budget (MemoryBudget | None): The budget to reserve the bytes from.
+        """
+        self.budget = budget
+        self.held = 0
+
+    async def grow(self, nbytes: int) -> None:
+        """Reserve more bytes, before allocating them."""
+        if self.budget is not None and nbytes > 0:
+            await self.budget.acquire(nbytes)
+        self.held += nbytes
+
+    def shrink(self, nbytes: int) -> None:
+        """Release the bytes of a freed buffer."""
+        nbytes = min(nbytes, self.held)
+        if self.budget is not None and nbytes > 0:
+            self.budget.release(nbytes)
+        self.held -= nbytes
+
+    async def __aenter__(self) -> Self:
+        """Start the reservation."""
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Release all the bytes still held."""
+        self.shrink(self.held)
+
+
+__all__ = ["MemoryBudget", "Reservation"]
@@ -3,15 +3,56 @@
 import asyncio
 import io
 import re
-from typing import Annotated
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Annotated
 
 import aioftp
-from google.cloud import storage
 from loguru import logger
 from pydantic import AfterValidator
 
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.io.downloads import DownloadCache
+from gentroutils.io.gcs import gcs_client, rewrite_blob
 from gentroutils.io.path import FTPPath, GCSPath
+from gentroutils.io.transfer.budget import Reservation
 from gentroutils.io.transfer.model import TransferableObject
+from gentroutils.io.workers import WORK_UNIT_SIZE, WorkerPool, offload
+from gentroutils.tracing import span
+
+if TYPE_CHECKING:
+    from google.cloud.storage import Blob
+
+SOURCE_FILE_METADATA_KEY = "gentroutils-source-file"
+"""Custom metadata holding the name of the FTP file the object was uploaded from."""
+
+SOURCE_SIZE_METADATA_KEY = "gentroutils-source-size"
+"""Custom metadata holding the size of the FTP file the object was uploaded from, in bytes."""
+
+SOURCE_MTIME_METADATA_KEY = "gentroutils-source-mtime"
+"""Custom metadata holding the modification time of the FTP file the object was uploaded from, as reported by `MLST`."""
+
+
+def source_metadata(filename: str, version: tuple[int, str]) -> dict[str, str]:
+    """Get the custom metadata recording the version of the FTP file an object is uploaded from.
+
+    Args:
+        filename (str): The name of the FTP file.
+        version (tuple[int, str]): The size and modification time of the FTP file.
+
+    Returns:
+        dict[str, str]: The custom metadata of the object.
+
+    Examples:
+    ---
+    >>> source_metadata("studies.tsv", (8, "20251212120000"))["gentroutils-source-mtime"]
+    '20251212120000'
+    """
+    size, mtime = version
+    return {
+        SOURCE_FILE_METADATA_KEY: filename,
+        SOURCE_SIZE_METADATA_KEY: str(size),
+        SOURCE_MTIME_METADATA_KEY: mtime,
+    }
 
 
 class FTPtoGCPTransferableObject(TransferableObject):
@@ -19,6 +60,12 @@ class FTPtoGCPTransferableObject(TransferableObject):
 
     source: Annotated[str, AfterValidator(lambda x: str(FTPPath(x)))]
     destination: Annotated[str, AfterValidator(lambda x: str(GCSPath(x)))]
+    artifacts: ArtifactCache | None = None
+    """Optional cache where the local copy of the uploaded content is registered for the dependent tasks."""
+    downloads: DownloadCache | None = None
+    """Optional cache of the downloaded files, consulted before the file is downloaded again."""
+    previous: str | None = None
+    """Optional uri of the object of the previous release, copied server side when the file did not change since."""
 
     async def transfer(self) -> None:
         """Transfer files from FTP to GCP.
@@ -60,55 +107,207 @@ class FTPtoGCPTransferableObject(TransferableObject):
         gcs_obj = GCSPath(self.destination)
         ftp_obj = FTPPath(self.source)
 
-        async with aioftp.Client.context(ftp_obj.server, user="anonymous", password="anonymous") as ftp:  # noqa: S106
-            bucket = storage.Client().bucket(gcs_obj.bucket)
-            blob = bucket.blob(gcs_obj.object)
-            logger.info(f"Searching for the release date in the provided ftp path: {ftp_obj.base_dir}.")
-            dir_match = re.match(r"^.*(?P<release_date>\d{4}\/\d{2}\/\d{2}){1}$", str(ftp_obj.base_dir))
+        with span("transfer", lane=self.destination, source=self.source, destination=self.destination):
+            async with AsyncExitStack() as stack:
+                with span("ftp connect", server=ftp_obj.server):
+                    ftp = await stack.enter_async_context(
+                        aioftp.Client.context(ftp_obj.host, ftp_obj.port, user="anonymous", password="anonymous")  # noqa: S106
+                    )
+                bucket = gcs_client().bucket(gcs_obj.bucket)
+                blob = bucket.blob(gcs_obj.object)
+                logger.info(f"Searching for the release date in the provided ftp path: {ftp_obj.base_dir}.")
+                dir_match = re.match(r"^.*(?P<release_date>\d{4}\/\d{2}\/\d{2}){1}$", str(ftp_obj.base_dir))
+
+                if dir_match:
+                    logger.info(f"Found release date to search in the ftp {dir_match.group('release_date')}.")
+                    release_date = dir_match.group("release_date")
+                    ftp_obj = await self._change_directory(ftp, ftp_obj, release_date)
+                    version = await self._remote_version(ftp, ftp_obj.filename)
+                    if version is not None and await self._copy_previous(blob, ftp_obj.filename, version):
+                        return
+                    await self._upload(ftp, ftp_obj, blob, version)
+
+                else:
+                    logger.error(f"Failed to extract release date from the provided ftp path: {ftp_obj.base_dir}.")
+                    raise ValueError("Release date could not be extracted from the FTP path.")
+
+    async def _change_directory(self, ftp: aioftp.Client, ftp_obj: FTPPath, release_date: str) -> FTPPath:
+        """Change to the release directory of the file, falling back to the `latest` release.
 
-            if dir_match:
-                logger.info(f"Found release date to search in the ftp {dir_match.group('release_date')}.")
-                release_date = dir_match.group("release_date")
+        Args:
+            ftp (aioftp.Client): The connected FTP client.
+            ftp_obj (FTPPath): The path of the file in its release directory.
+            release_date (str): The release date of the directory, replaced by `latest` in the fallback.
+
+        Returns:
+            FTPPath: The path of the file in the directory the client changed to.
+
+        Raises:
+            aioftp.StatusCodeError: If neither the release nor the `latest` directory exist.
+        """
+        with span("directory resolution", directory=ftp_obj.base_dir) as directory_span:
+            try:
+                logger.debug(f"We are in the directory: {await ftp.get_current_directory()}")
+                logger.debug(f"Changing directory to: {ftp_obj.base_dir}")
+                await ftp.change_directory(ftp_obj.base_dir)
+                logger.success(f"Successfully changed directory to: {ftp_obj.base_dir}")
+            except aioftp.StatusCodeError as e:
+                logger.warning(f"Failed to change directory to {ftp_obj.base_dir}: {e}")
+                logger.warning(f"Probably the release date {release_date} is out of sync with the api endpoint.")
                 try:
-                    logger.debug(f"We are in the directory: {await ftp.get_current_directory()}")
-                    logger.debug(f"Changing directory to: {ftp_obj.base_dir}")
+                    logger.warning("Attempting to load the `latest` release.")
+                    ftp_obj = FTPPath(self.source.replace(release_date, "latest"))
                     await ftp.change_directory(ftp_obj.base_dir)
                     logger.success(f"Successfully changed directory to: {ftp_obj.base_dir}")
-                except aioftp.StatusCodeError as e:
-                    logger.warning(f"Failed to change directory to {ftp_obj.base_dir}: {e}")
-                    logger.warning(f"Probably the release date {release_date} is out of sync with the api endpoint.")
-                    try:
-                        logger.warning("Attempting to load the `latest` release.")
-                        ftp_obj = FTPPath(self.source.replace(release_date, "latest"))
-                        await ftp.change_directory(ftp_obj.base_dir)
-                        logger.success(f"Successfully changed directory to: {ftp_obj.base_dir}")
-
-                    except aioftp.StatusCodeError as e:
-                        logger.error(f"Failed to find the latest release under {ftp_obj}")
-                        raise
-
-                logger.debug("Creating in-memory buffer to store downloaded data.")
-                buffer = io.BytesIO()
-                logger.debug(f"Downloading data from FTP path: {ftp_obj.filename}")
-                stream = await ftp.download_stream(ftp_obj.filename)
-                logger.info("Successfully connected to the FTP stream, beginning data transfer to buffer.")
-                async with stream:
-                    async for block in stream.iter_by_block():
-                        buffer.write(block)
-                buffer.seek(0)
-                if ftp_obj.filename.endswith(".zip"):
-                    logger.info("Uploading zipped content to GCS blob.")
-                    logger.info("Unzipping content before upload.")
-                    content = unzip_buffer(buffer)
-                    blob.upload_from_string(content)
-                else:
-                    content = buffer.getvalue()
-                    buffer.close()
-                    blob.upload_from_string(content)
+                    directory_span.set(directory=ftp_obj.base_dir, fallback=True)
+                except aioftp.StatusCodeError:
+                    logger.error(f"Failed to find the latest release under {ftp_obj}")
+                    raise
+        return ftp_obj
+
+    async def _copy_previous(self, blob: "Blob", filename: str, version: tuple[int, str]) -> bool:
+        """Copy the object of the previous release to the blob when it was uploaded from the same version of the file.
+
+        The object is rewritten server side, the file is not downloaded. The file is matched on the name, size and
+        modification time reported by the server only, the content is not compared: the checksum of a server-side
+        copy always matches its source, and the server does not publish checksums of its files.
 
+        Args:
+            blob (Blob): The destination object.
+            filename (str): The name of the FTP file.
+            version (tuple[int, str]): The size and modification time of the FTP file.
+
+        Returns:
+            bool: Whether the previous object was copied.
+        """
+        if self.previous is None:
+            return False
+        previous = GCSPath(self.previous)
+        expected = source_metadata(filename, version)
+        with span("previous release lookup", previous=self.previous) as lookup_span:
+            previous_bucket = gcs_client().bucket(previous.bucket)
+            previous_blob = await asyncio.to_thread(previous_bucket.get_blob, previous.object)
+            metadata = (previous_blob.metadata or {}) if previous_blob is not None else {}
+            unchanged = all(metadata.get(key) == value for key, value in expected.items())
+            lookup_span.set(unchanged=unchanged)
+        if previous_blob is None or not unchanged:
+            logger.info(f"{self.source} changed since {self.previous}, transferring it from the server.")
+            return False
+        with span("gcs copy", source=self.previous, destination=self.destination, bytes=previous_blob.size):
+            await asyncio.to_thread(rewrite_blob, blob, previous_blob)
+        logger.info(f"{self.source} did not change since {self.previous}, copied it to {self.destination}.")
+        return True
+
+    async def _upload(
+        self, ftp: aioftp.Client, ftp_obj: FTPPath, blob: "Blob", version: tuple[int, str] | None = None
+    ) -> None:
+        """Download the file from the current directory, unzip it when zipped and upload it to the blob.
+
+        The download, the unzipped content and the uploaded copy are reserved against the memory budget. The
+        version of the file is recorded in the metadata of the blob, so the next release can copy it.
+        """
+        filename = ftp_obj.filename
+        if version is not None:
+            blob.metadata = source_metadata(filename, version)
+        async with self.reservation() as memory:
+            buffer = await self._fetch(ftp, ftp_obj, memory, version)
+            downloaded_size = buffer.getbuffer().nbytes
+            if filename.endswith(".zip"):
+                logger.info("Uploading zipped content to GCS blob.")
+                logger.info("Unzipping content before upload.")
+                await memory.grow(unzipped_size(buffer))
+                with span("unzip", compressed_bytes=downloaded_size) as unzip_span:
+                    content = await unzip_buffer_offloaded(buffer, self.workers)
+                    unzip_span.set(bytes=len(content))
             else:
-                logger.error(f"Failed to extract release date from the provided ftp path: {ftp_obj.base_dir}.")
-                raise ValueError("Release date could not be extracted from the FTP path.")
+                await memory.grow(downloaded_size)
+                content = buffer.getvalue()
+            buffer.close()
+            memory.shrink(downloaded_size)
+            with span("gcs upload", destination=self.destination, bytes=len(content)) as upload_span:
+                parts = await asyncio.to_thread(self.upload_engine().upload, blob, content)
+                upload_span.set(parts=parts)
+            if self.artifacts is not None:
+                try:
+                    await asyncio.to_thread(self.artifacts.register, self.destination, blob.generation, content)
+                except OSError as e:
+                    logger.warning(f"Failed to keep the local copy of {self.destination}: {e}")
+
+    async def _fetch(
+        self, ftp: aioftp.Client, ftp_obj: FTPPath, memory: Reservation, version: tuple[int, str] | None
+    ) -> io.BytesIO:
+        """Read the file from the download cache, or download it from the current directory and cache it.
+
+        The cache entry is keyed by the size and modification time of the remote file, so the file is only
+        downloaded again when it changed on the server (or when the server does not report them).
+        """
+        if self.downloads is None or version is None:
+            return await self._download(ftp, ftp_obj.filename, memory)
+        uri = str(ftp_obj)
+        await memory.grow(version[0])
+        with span("cache lookup", source=uri) as lookup_span:
+            content = await offload(self.workers, self.downloads.load, uri, *version)
+            lookup_span.set(hit=content is not None)
+        if content is not None:
+            return io.BytesIO(content)
+        memory.shrink(version[0])
+        buffer = await self._download(ftp, ftp_obj.filename, memory)
+        with span("cache store", source=uri), buffer.getbuffer() as view:
+            try:
+                await offload(self.workers, self.downloads.store, uri, *version, view)
+            except OSError as e:
+                logger.warning(f"Failed to cache the download of {uri}: {e}")
+        return buffer
+
+    @staticmethod
+    async def _remote_version(ftp: aioftp.Client, filename: str) -> tuple[int, str] | None:
+        """Get the size and modification time of the file in the current directory, None when not reported."""
+        try:
+            info = await ftp.stat(filename)
+        except aioftp.StatusCodeError as e:
+            logger.warning(f"Failed to get the size and modification time of {filename}: {e}")
+            return None
+        if "size" not in info or "modify" not in info:
+            return None
+        return int(info["size"]), str(info["modify"])
+
+    @staticmethod
+    async def _download(ftp: aioftp.Client, filename: str, memory: Reservation) -> io.BytesIO:
+        """Download the file from the current directory into an in-memory buffer.
+
+        Every block is reserved against the memory budget before it is buffered, so the download waits
+        while the budget is exhausted.
+        """
+        logger.debug("Creating in-memory buffer to store downloaded data.")
+        buffer = io.BytesIO()
+        logger.debug(f"Downloading data from FTP path: {filename}")
+        with span("download", file=filename) as download_span:
+            stream = await ftp.download_stream(filename)
+            logger.info("Successfully connected to the FTP stream, beginning data transfer to buffer.")
+            async with stream:
+                async for block in stream.iter_by_block():
+                    await memory.grow(len(block))
+                    buffer.write(block)
+                    download_span.add("bytes", len(block))
+        buffer.seek(0)
+        return buffer
+
+
+def unzipped_size(buffer: io.BytesIO) -> int:
+    """Get the total uncompressed size of the files in the zipped buffer, read from the zip central directory.
+
+    Args:
+        buffer (io.BytesIO): The in-memory buffer containing zipped data.
+
+    Returns:
+        int: The uncompressed size in bytes.
+    """
+    import zipfile
+
+    with zipfile.ZipFile(buffer) as z:
+        size = sum(file_info.file_size for file_info in z.infolist())
+    buffer.seek(0)
+    return size
 
 
 def unzip_buffer(buffer: io.BytesIO) -> bytes:
@@ -141,3 +340,38 @@ def unzip_buffer(buffer: io.BytesIO) -> bytes:
     logger.info(f"Unzipped file: {keys[0]} with size {len(unzipped_files[keys[0]])} bytes.")
 
     return unzipped_files[keys[0]]
+
+
+async def unzip_buffer_offloaded(
+    buffer: io.BytesIO, workers: WorkerPool | None, unit_size: int = WORK_UNIT_SIZE
+) -> bytes:
+    """Unzip the single file of the zipped buffer on the worker pool, `unit_size` uncompressed bytes at a time.
+
+    Args:
+        buffer (io.BytesIO): The in-memory buffer containing zipped data.
+        workers (WorkerPool | None): The pool decompressing the units, the default executor when None.
+        unit_size (int): The number of uncompressed bytes of each unit of work.
+
+    Returns:
+        bytes: The unzipped content of the single file.
+
+    Raises:
+        ValueError: If multiple files are found in the zipped buffer or if no files are found.
+    """
+    import zipfile
+
+    with zipfile.ZipFile(buffer) as z:
+        members = z.infolist()
+        if len(members) == 0:
+            logger.error("No files were found in the zipped buffer.")
+            raise ValueError("No files were found in the zipped buffer.")
+        if len(members) != 1:
+            logger.error("Multiple files were found in the zipped buffer.")
+            raise ValueError("Multiple files were found in the zipped buffer.")
+        # The value of a BytesIO is handed over without a copy, unlike a joined list or a bytearray.
+        content = io.BytesIO()
+        with z.open(members[0]) as unzipped_file:
+            while unit := await offload(workers, unzipped_file.read, unit_size):
+                content.write(unit)
+    logger.info(f"Unzipped file: {members[0].filename} with size {content.tell()} bytes.")
+    return content.getvalue()
@@ -0,0 +1,40 @@
+"""Mirror files from FTP to Google Cloud Storage (GCS)."""
+
+from typing import Annotated
+
+from loguru import logger
+from pydantic import AfterValidator
+
+from gentroutils.io.mirror import MTIME_METADATA_KEY, MirrorManifest, RemoteFile
+from gentroutils.io.path import FTPPath, GCSPath
+from gentroutils.io.transfer.stream import StreamTransferableObject
+from gentroutils.tracing import span
+
+
+class MirrorTransferableObject(StreamTransferableObject):
+    """A StreamTransferableObject mirroring a file of an FTP tree to GCS.
+
+    The modification time of the `file` is recorded in the object metadata, so the next run of the mirror can
+    tell whether the file changed since, and the file is recorded in the run `manifest` once uploaded.
+    """
+
+    source: Annotated[str, AfterValidator(lambda x: str(FTPPath(x)))]
+    destination: Annotated[str, AfterValidator(lambda x: str(GCSPath(x)))]
+    file: RemoteFile
+    """The mirrored file, as found by the walk of the FTP tree."""
+    manifest: MirrorManifest | None = None
+    """Optional manifest of the mirror run."""
+
+    async def transfer(self) -> None:
+        """Stream the file to the destination and record it in the manifest."""
+        logger.info(f"Mirroring {self.source} to {self.destination}.")
+        metadata = {MTIME_METADATA_KEY: str(int(self.file.mtime.timestamp()))}
+        with span("mirror", lane=self.destination, source=self.source, destination=self.destination) as s:
+            async with self.reservation() as memory:
+                await memory.grow(self.chunk_size)
+                size = await GCSPath(self.destination).write_stream(
+                    FTPPath(self.source).read_stream(self.chunk_size), metadata=metadata
+                )
+            s.set(bytes=size)
+        if self.manifest is not None:
+            self.manifest.transferred(self.file)
@@ -4,6 +4,10 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from gentroutils.io.gcs.upload import CompositeUploader
+from gentroutils.io.transfer.budget import MemoryBudget, Reservation
+from gentroutils.io.workers import WorkerPool
+
 
 class TransferableObject(BaseModel):
     """Base class for transferable objects in gentroutils.
@@ -13,10 +17,20 @@ class TransferableObject(BaseModel):
 
         - `source`: The source location of the object.
         - `destination`: The destination location where the object will be transferred.
+
+    The buffers held by the transfer are reserved against the `budget` shared by the transfers of the batch,
+    and the CPU-bound stages (decompression, serialization) run on the `workers` pool, off the event loop.
+    The objects are uploaded to GCS by the `uploader` of the batch, in parallel parts when they are large.
     """
 
     source: Any
     destination: Any
+    budget: MemoryBudget | None = None
+    """Optional memory budget shared by the transfers of the batch, set by the `TransferManager`."""
+    workers: WorkerPool | None = None
+    """Optional pool running the CPU-bound stages of the transfers of the batch, set by the `TransferManager`."""
+    uploader: CompositeUploader | None = None
+    """Optional engine uploading the objects of the batch to GCS, set by the `TransferManager`."""
 
     def __repr__(self) -> str:
         """Return a string representation of the transferable object."""
@@ -30,6 +44,14 @@ class TransferableObject(BaseModel):
         """Transfer the object to the destination."""
         raise NotImplementedError("Implement in derivative class.")
 
+    def reservation(self) -> Reservation:
+        """Start the reservation of the transfer buffers against the `budget`."""
+        return Reservation(self.budget)
+
+    def upload_engine(self) -> CompositeUploader:
+        """Get the `uploader` of the batch, the default engine when the object is transferred on its own."""
+        return self.uploader or CompositeUploader()
+
     class Config:
         """Configuration that ensures that the derivative classes can have arbitrary types."""
 
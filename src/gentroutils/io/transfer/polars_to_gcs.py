@@ -1,9 +1,14 @@
 """Module for transferring Polars DataFrames to Google Cloud Storage (GCS)."""
 
+import io
+
 import polars as pl
 from loguru import logger
 
+from gentroutils.io.path import GCSPath
 from gentroutils.io.transfer.model import TransferableObject
+from gentroutils.io.workers import offload
+from gentroutils.tracing import span
 
 
 class PolarsDataFrameToGCSTransferableObject(TransferableObject):
@@ -11,10 +16,31 @@ class PolarsDataFrameToGCSTransferableObject(TransferableObject):
 
     source: pl.DataFrame
     destination: str
+    metadata: dict[str, str] | None = None
+    """Optional custom metadata added to the uploaded object."""
 
     async def transfer(self) -> None:
         """Transfer the Polars DataFrame to the specified GCS destination."""
         # Convert Polars DataFrame to CSV and upload to GCS
         logger.info(f"Transferring Polars DataFrame to {self.destination}.")
-        self.source.write_csv(self.destination, separator="\t", include_header=True)
+        with span(
+            "gcs upload", lane=self.destination, destination=self.destination, rows=self.source.height
+        ) as upload_span:
+            # The serialized CSV is buffered before the upload, about the size of the frame.
+            async with self.reservation() as memory:
+                await memory.grow(int(self.source.estimated_size()))
+                upload_span.set(parts=await offload(self.workers, self._write_csv))
         logger.info(f"Uploading DataFrame to {self.destination}")
+
+    def _write_csv(self) -> int:
+        """Serialize the DataFrame as a TSV and upload it to the destination, together with the metadata.
+
+        Returns:
+            int: The number of parts the object was uploaded in.
+        """
+        buffer = io.BytesIO()
+        self.source.write_csv(buffer, separator="\t", include_header=True)
+        blob = GCSPath(self.destination).blob()
+        if self.metadata:
+            blob.metadata = self.metadata
+        return self.upload_engine().upload(blob, buffer.getvalue())
@@ -0,0 +1,35 @@
+"""Stream objects between any pair of the supported uri schemes."""
+
+from typing import Annotated
+
+from loguru import logger
+from pydantic import AfterValidator
+
+from gentroutils.io.path import copy_uri, parse_uri
+from gentroutils.io.path.uri import DEFAULT_CHUNK_SIZE
+from gentroutils.io.transfer.model import TransferableObject
+from gentroutils.tracing import span
+
+
+class StreamTransferableObject(TransferableObject):
+    """A TransferableObject streaming the source to the destination chunk by chunk.
+
+    The source and destination can be any `gs://`, `ftp://`, `http(s)://` or `file://` uri (or a local path),
+    for example to stage a remote file on the local disk.
+    """
+
+    source: Annotated[str, AfterValidator(lambda x: str(parse_uri(x)))]
+    destination: Annotated[str, AfterValidator(lambda x: str(parse_uri(x)))]
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    """The maximum size of the chunks held in memory."""
+
+    async def transfer(self) -> None:
+        """Stream the source to the destination."""
+        logger.info(f"Streaming {self.source} to {self.destination}.")
+        with span("stream", lane=self.destination, source=self.source, destination=self.destination) as s:
+            # Only the chunk in flight is held in memory.
+            async with self.reservation() as memory:
+                await memory.grow(self.chunk_size)
+                size = await copy_uri(self.source, self.destination, self.chunk_size)
+            s.set(bytes=size)
+        logger.info(f"Streamed {size} bytes to {self.destination}.")
@@ -0,0 +1,78 @@
+"""Worker pool running the CPU-bound stages of the transfers off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Self, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CPU_WORKERS = min(4, os.cpu_count() or 1)
+"""Default number of threads running the CPU-bound stages of a batch."""
+
+WORK_UNIT_SIZE = 4 * 1024 * 1024
+"""Number of bytes processed by a single unit of work submitted to the pool."""
+
+
+class WorkerPool:
+    """Thread pool shared by the transfers of a batch for their decompression, serialization and upload stages.
+
+    The transfers run on a single event loop, so a stage computing in the loop thread, such as unzipping a large
+    release file, stops every other transfer. The stages run on the pool instead, split in units of
+    `WORK_UNIT_SIZE` bytes where the codec allows it, so the loop keeps serving the network of the other
+    transfers between the units. `zlib`, the checksums of the uploads and Polars release the GIL while they
+    compute, so the threads run the stages of several transfers in parallel.
+
+    Examples:
+    ---
+    >>> async def main():
+    ...     with WorkerPool(2) as workers:
+    ...         return await workers.run(sum, range(10))
+    >>> asyncio.run(main())
+    45
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_CPU_WORKERS) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers (int): The number of threads of the pool.
+        """
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run the function on the pool and wait for its result without blocking the event loop."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gentroutils-cpu")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def shutdown(self) -> None:
+        """Stop the threads of the pool once the submitted units completed."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> Self:
+        """Use the pool for the batch."""
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Stop the pool at the end of the batch."""
+        self.shutdown()
+
+
+async def offload(workers: WorkerPool | None, fn: Callable[..., T], *args: Any) -> T:  # noqa: UP047
+    """Run the function on the worker pool, or on the default executor of the loop when there is no pool."""
+    if workers is None:
+        return await asyncio.to_thread(fn, *args)
+    return await workers.run(fn, *args)
+
+
+__all__ = ["DEFAULT_CPU_WORKERS", "WORK_UNIT_SIZE", "WorkerPool", "offload"]
@@ -0,0 +1,107 @@
+"""Module to handle the GWAS Catalog associations release file."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from pathlib import Path
+
+import polars as pl
+from loguru import logger
+
+DEFAULT_STUDY_BUCKETS = 64
+"""Default number of study id buckets in the partitioned associations dataset."""
+
+DEFAULT_ROW_GROUP_SIZE = 100_000
+"""Default number of rows in each row group of the partitioned associations dataset."""
+
+
+class AssociationsSchema(StrEnum):
+    """Enum to define the associations columns used to partition the dataset."""
+
+    CHR_ID = "CHR_ID"
+    """The chromosome of the variant, multiple values are separated by `;` or `x` for the haplotypes."""
+    STUDY_ACCESSION = "STUDY ACCESSION"
+    """The GWAS Catalog study accession, e.g. `GCST000123`."""
+
+
+class AssociationsPartition(StrEnum):
+    """Enum to define the hive partition keys of the associations dataset."""
+
+    CHROMOSOME = "chromosome"
+    """The chromosome of the variant, `NA` when the association maps to none or to multiple chromosomes."""
+    STUDY_BUCKET = "studyBucket"
+    """The numeric part of the study accession modulo the number of study buckets."""
+
+    @classmethod
+    def columns(cls) -> list[str]:
+        """Get the list of partition keys in the dataset directory order."""
+        return [member.value for member in cls]
+
+
+def study_bucket(study_id: pl.Expr | str, buckets: int = DEFAULT_STUDY_BUCKETS) -> pl.Expr:
+    """Get the study id bucket used to partition the associations dataset.
+
+    The bucket only depends on the numeric part of the accession, so readers can compute the partition
+    of a study without reading the dataset. The bucket of a null (or numberless) `STUDY ACCESSION` is null,
+    so those rows land in the null partition, written as `studyBucket=__HIVE_DEFAULT_PARTITION__`.
+
+    Args:
+        study_id (pl.Expr | str): The study accession expression, or the name of its column.
+        buckets (int): The number of study buckets.
+
+    Returns:
+        pl.Expr: The `studyBucket` expression.
+
+    Examples:
+    ---
+    >>> pl.select(study_bucket(pl.lit("GCST000130"), 64)).item()
+    2
+    """
+    study_id = pl.col(study_id) if isinstance(study_id, str) else study_id
+    return (study_id.str.extract(r"(\d+)", 1).cast(pl.Int64) % buckets).alias(AssociationsPartition.STUDY_BUCKET)
+
+
+def chromosome(chr_id: pl.Expr | str) -> pl.Expr:
+    """Normalise the `CHR_ID` into the chromosome partition key."""
+    chr_id = pl.col(chr_id) if isinstance(chr_id, str) else chr_id
+    return (
+        chr_id.str.strip_chars()
+        .str.extract(r"^(\d{1,2}|X|Y|MT)$", 1)
+        .fill_null("NA")
+        .alias(AssociationsPartition.CHROMOSOME)
+    )
+
+
+def partition_associations(
+    source: str | Path,
+    destination: str | Path,
+    study_buckets: int = DEFAULT_STUDY_BUCKETS,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> None:
+    """Stream the associations TSV into a hive partitioned Parquet dataset.
+
+    The dataset is partitioned by the `chromosome` and the `studyBucket` keys, for example
+    `destination/chromosome=1/studyBucket=2/00000000.parquet`, and each file holds the row group statistics,
+    so the lookups of a study or a region only read a small subset of the files.
+    All columns are kept as strings, as in the source file.
+
+    Args:
+        source (str | Path): Path to the associations TSV file.
+        destination (str | Path): Directory of the partitioned dataset.
+        study_buckets (int): Number of study id buckets.
+        row_group_size (int): Number of rows in each row group.
+    """
+    logger.info("Partitioning associations {} into {}.", source, destination)
+    (
+        pl.scan_csv(source, separator="\t", quote_char=None, infer_schema=False)
+        .with_columns(
+            chromosome(AssociationsSchema.CHR_ID),
+            study_bucket(AssociationsSchema.STUDY_ACCESSION, study_buckets),
+        )
+        .sink_parquet(
+            pl.PartitionByKey(destination, by=AssociationsPartition.columns(), include_key=False),
+            statistics=True,
+            row_group_size=row_group_size,
+            mkdir=True,
+        )
+    )
@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata
+import io
+import json
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
+from functools import cached_property
+from pathlib import Path
+from typing import Any
 
 import polars as pl
-from google.cloud.storage import Client
 from loguru import logger
 
 from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.io.gcs.client import gcs_client
+from gentroutils.io.gcs.listing import DEFAULT_MAX_WORKERS, LISTING_FIELDS, GCSGlob, GCSGlobLister, ListingShard
+from gentroutils.io.gcs.objects import read_object, write_object
+from gentroutils.io.gcs.probe import DEFAULT_MAX_PROBES, GCSGzipProber
+from gentroutils.io.path import GCSPath
+
+CURATION_FINGERPRINT_METADATA_KEY = "gentroutils-curation-fingerprint"
+"""Custom metadata holding the fingerprint of the inputs the curation outputs were built from."""
+
+INDEX_FULL_LISTING_METADATA_KEY = "gentroutils-full-listing"
+"""Parquet metadata of the summary statistics index holding the time of its last full listing."""
+
+DEFAULT_INDEX_REFRESH_DAYS = 7
+"""Default number of days after which the summary statistics index is rebuilt from a full listing."""
+
+STUDY_ID_PATTERN = r"\/(GCST\d+)\/"
+"""Pattern extracting the study id from the path of a summary statistics file."""
+
+CURATION_VERSION = 1
+"""Version of the curation logic, bump it when the same inputs produce a different curation."""
+
+UNKNOWN_VERSION = "unknown"
+"""Version fingerprinted when gentroutils runs from a source tree that is not installed."""
 
 
 class CurationSchema(StrEnum):
@@ -41,6 +74,16 @@ class CurationSchema(StrEnum):
         """Get the list of columns defined in the schema, including additional metadata."""
         return [*cls.columns(), "status"]
 
+    @classmethod
+    def delta_columns(cls) -> list[str]:
+        """Get the list of columns of the curation delta, including the status from the previous curation."""
+        return [*cls.extended_columns(), "previousStatus"]
+
+    @classmethod
+    def categorical_columns(cls) -> list[str]:
+        """Get the list of low cardinality curation columns stored as categoricals."""
+        return [cls.STUDY_TYPE, cls.ANALYSIS_FLAG, cls.QUALITY_CONTROL]
+
 
 class DownloadStudiesSchema(StrEnum):
     """Enum to define the columns for the download studies task."""
@@ -98,39 +141,295 @@ class CuratedStudyStatus(StrEnum):
     NO_SUMSTATS = "no_summary_statistics"
     """The study has no associated summary statistics."""
 
+    @classmethod
+    def dtype(cls) -> pl.Enum:
+        """Get the polars enum dtype holding the statuses."""
+        return pl.Enum([member.value for member in cls])
+
+
+class SummaryStatisticsIndexSchema(StrEnum):
+    """Enum to define the columns of the persisted summary statistics listing index."""
+
+    FILE_PATH = "filePath"
+    """The GCS file path of the summary statistics file."""
+    STUDY_ID = "studyId"
+    """The unique identifier for a study."""
+    SIZE = "size"
+    """The size of the object in bytes."""
+    GENERATION = "generation"
+    """The GCS generation of the object."""
+    UPDATED = "updated"
+    """The time the object metadata was last updated."""
+
+    @classmethod
+    def schema(cls) -> pl.Schema:
+        """Get the polars schema of the index."""
+        schema: dict[str, pl.DataType] = {
+            cls.FILE_PATH: pl.String(),
+            cls.STUDY_ID: pl.String(),
+            cls.SIZE: pl.Int64(),
+            cls.GENERATION: pl.Int64(),
+            cls.UPDATED: pl.Datetime("us", "UTC"),
+        }
+        return pl.Schema(schema)
+
+
+class SummaryStatisticsProbeSchema(StrEnum):
+    """Enum to define the columns added to the curation by probing the summary statistics files."""
+
+    STUDY_ID = "studyId"
+    """The unique identifier for a study."""
+    COLUMNS = "summaryStatisticsColumns"
+    """The comma separated columns of the summary statistics header."""
+    COMPRESSED_SIZE = "summaryStatisticsCompressedSize"
+    """The size of the gzipped summary statistics file in bytes."""
+    UNCOMPRESSED_SIZE = "summaryStatisticsUncompressedSize"
+    """The uncompressed size from the gzip trailer (modulo 4 GiB), null for the BGZF files."""
+    IS_COMPLETE = "hasCompleteSummaryStatistics"
+    """Flag indicating whether the file is a complete gzip file, null when it cannot be told from its tail."""
+
+    @classmethod
+    def schema(cls) -> pl.Schema:
+        """Get the polars schema of the probed summary statistics."""
+        schema: dict[str, pl.DataType] = {
+            cls.STUDY_ID: pl.String(),
+            cls.COLUMNS: pl.String(),
+            cls.COMPRESSED_SIZE: pl.Int64(),
+            cls.UNCOMPRESSED_SIZE: pl.Int64(),
+            cls.IS_COMPLETE: pl.Boolean(),
+        }
+        return pl.Schema(schema)
+
+    @classmethod
+    def columns(cls) -> list[str]:
+        """Get the list of columns added to the curation output."""
+        return [member.value for member in cls if member is not cls.STUDY_ID]
+
+
+def _gentroutils_version() -> str:
+    """Get the installed gentroutils version, `UNKNOWN_VERSION` when the package is not installed."""
+    try:
+        return importlib.metadata.version("gentroutils")
+    except importlib.metadata.PackageNotFoundError:
+        return UNKNOWN_VERSION
+
+
+def _path_exists(path: str) -> bool:
+    """Check if the local path or GCS object exists."""
+    if path.startswith("gs://"):
+        gcs_path = GCSPath(path)
+        return gcs_client().bucket(gcs_path.bucket).blob(gcs_path.object).exists()
+    return Path(path).exists()
+
+
+def _source_generation(path: str) -> str | None:
+    """Get the token identifying the current content of the local file or GCS object.
+
+    For GCS objects this is the object generation, for local files the modification time and size.
+    Returns None when the source does not exist.
+    """
+    if path.startswith("gs://"):
+        gcs_path = GCSPath(path)
+        blob = gcs_client().bucket(gcs_path.bucket).get_blob(gcs_path.object)
+        return str(blob.generation) if blob is not None else None
+    local = Path(path)
+    if not local.exists():
+        return None
+    stat = local.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _read_source(path: str) -> str | bytes:
+    """Get the local path, or the content of the GCS object downloaded with the shared storage client."""
+    return read_object(path) if path.startswith("gs://") else path
+
+
+def _read_parquet(path: str) -> pl.DataFrame:
+    """Read the local or GCS Parquet file."""
+    return pl.read_parquet(_read_source(path))
+
+
+def _write_parquet(data: pl.DataFrame, path: str, metadata: dict[str, str] | None = None) -> None:
+    """Write the Parquet file, with the optional key-value metadata, locally or to GCS with the shared storage client."""
+    if not path.startswith("gs://"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        data.write_parquet(path, metadata=metadata)
+        return
+    buffer = io.BytesIO()
+    data.write_parquet(buffer, metadata=metadata)
+    write_object(path, buffer.getvalue())
+
+
+def _read_through_cache(
+    path: str,
+    read: Callable[[str], pl.DataFrame],
+    cache_path: str | None,
+    artifacts: ArtifactCache | None = None,
+) -> pl.DataFrame:
+    """Read the parsed source from its Parquet sidecar, or parse it and store the sidecar.
+
+    The sidecar name is derived from the source path and the source generation, so a sidecar is only
+    reused while the source is unchanged. When the source has to be parsed and a local copy of the same
+    generation was registered in the `artifacts` (for example by the fetch task of the same run),
+    the local copy is parsed instead of downloading the object.
+
+    Args:
+        path (str): The source path (local or `gs://`).
+        read (Callable[[str], pl.DataFrame]): Function parsing the source.
+        cache_path (str | None): Directory (local or `gs://`) holding the sidecars, caching is disabled when None.
+        artifacts (ArtifactCache | None): Local copies of the objects uploaded during the run.
+
+    Returns:
+        pl.DataFrame: The parsed source.
+    """
+    generation = _source_generation(path) if cache_path or artifacts else None
+    if generation is None:
+        return read(path)
+    local_copy = artifacts.lookup(path, generation) if artifacts is not None else None
+    source = local_copy.as_posix() if local_copy is not None else path
+    if cache_path is None:
+        return _read_local_copy(path, source, read)
+    key = hashlib.sha256(f"{path}:{read.__qualname__}".encode()).hexdigest()[:16]
+    sidecar = f"{cache_path.rstrip('/')}/{key}-{generation}.parquet"
+    if _path_exists(sidecar):
+        logger.debug("Reading {} from the cached {}.", path, sidecar)
+        return _read_parquet(sidecar)
+    data = _read_local_copy(path, source, read)
+    _write_parquet(data, sidecar)
+    logger.debug("Cached {} as {}.", path, sidecar)
+    return data
+
+
+def _read_local_copy(path: str, source: str, read: Callable[[str], pl.DataFrame]) -> pl.DataFrame:
+    """Parse the source, logging when a local copy is used in place of the path."""
+    if source != path:
+        logger.info("Reading {} from the local copy {}.", path, source)
+    return read(source)
+
+
+def _listing_page_to_frame(glob: GCSGlob, items: list[dict[str, Any]]) -> pl.DataFrame:
+    """Convert a page of listed object resources into a batch following the `SummaryStatisticsIndexSchema`."""
+    return pl.DataFrame(items, schema=dict.fromkeys(LISTING_FIELDS, pl.String)).select(
+        (pl.lit(f"gs://{glob.bucket}/") + pl.col("name")).alias(SummaryStatisticsIndexSchema.FILE_PATH),
+        pl.col("name").str.extract(STUDY_ID_PATTERN, 1).alias(SummaryStatisticsIndexSchema.STUDY_ID),
+        pl.col("size").cast(pl.Int64).alias(SummaryStatisticsIndexSchema.SIZE),
+        pl.col("generation").cast(pl.Int64).alias(SummaryStatisticsIndexSchema.GENERATION),
+        pl.col("updated").str.to_datetime(time_unit="us", time_zone="UTC").alias(SummaryStatisticsIndexSchema.UPDATED),
+    )
+
 
 class GCSSummaryStatisticsFileCrawler:
-    """Class to crawl GCS for summary statistics files."""
-
-    def __init__(self, gcs_glob: str):
-        """Initialize the GCSSummaryStatisticsFileCrawler with a GCS glob pattern."""
-        self.gcs_glob = gcs_glob
-        logger.debug("Initialized GCSSummaryStatisticsFileCrawler with glob: {}", gcs_glob)
-
-    def _fetch_paths(self) -> list[str]:
-        """Fetch file paths from GCS based on the glob pattern."""
-        # Implementation to fetch file paths from GCS
-        c = Client()
-        bucket_name = self.gcs_glob.split("/")[2]
-        prefix = "/".join(self.gcs_glob.split("/")[3:-1])
-        suffix = self.gcs_glob.split("/")[-1].replace("*", "")
-        logger.debug("Crawling GCS bucket: {}, prefix: {}, suffix: {}", bucket_name, prefix, suffix)
-        bucket = c.bucket(bucket_name)
-        blobs = bucket.list_blobs(prefix=prefix)
-        return [f"gs://{bucket_name}/{blob.name}" for blob in blobs if blob.name.endswith(suffix)]
+    """Class to crawl GCS for summary statistics files.
+
+    When the `index_path` is provided, the listing is persisted as a Parquet index (see `SummaryStatisticsIndexSchema`)
+    and the following runs only list each shard from its last indexed object (its watermark). The GWAS Catalog
+    accessions are assigned in increasing order, so the new studies land after the watermarks and the listing
+    follows the number of new files rather than the size of the bucket. The files synced late below a watermark,
+    rewritten or removed are only picked up by a full listing, which rebuilds the index once it is older than
+    `refresh_days` days (or with `full_refresh`).
+    """
+
+    def __init__(
+        self,
+        gcs_glob: str | Sequence[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        index_path: str | None = None,
+        full_refresh: bool = False,
+        refresh_days: int = DEFAULT_INDEX_REFRESH_DAYS,
+    ):
+        """Initialize the GCSSummaryStatisticsFileCrawler with one or more GCS glob patterns."""
+        self.gcs_globs = [gcs_glob] if isinstance(gcs_glob, str) else list(gcs_glob)
+        self.max_workers = max_workers
+        self.index_path = index_path
+        self.full_refresh = full_refresh
+        self.refresh_days = refresh_days
+        self.index: pl.DataFrame | None = None
+        self.synced: pl.DataFrame | None = None
+        logger.debug("Initialized GCSSummaryStatisticsFileCrawler with globs: {}", self.gcs_globs)
+
+    def _read_index(self) -> tuple[pl.DataFrame, str] | None:
+        """Read the listing index persisted by the previous run, with the time of its last full listing.
+
+        Returns None when the index has to be rebuilt from a full listing.
+        """
+        if self.index_path is None or self.full_refresh:
+            return None
+        if not _path_exists(self.index_path):
+            logger.info("Summary statistics index {} does not exist, listing all objects.", self.index_path)
+            return None
+        source = _read_source(self.index_path)
+        listed_at = pl.read_parquet_metadata(source).get(INDEX_FULL_LISTING_METADATA_KEY)
+        if listed_at is None or datetime.now(UTC) - datetime.fromisoformat(listed_at) >= timedelta(self.refresh_days):
+            logger.info("Summary statistics index was fully listed at {}, listing all objects.", listed_at)
+            return None
+        index = pl.read_parquet(source).cast(SummaryStatisticsIndexSchema.schema())
+        logger.debug("Loaded summary statistics index with {} files, fully listed at {}.", index.height, listed_at)
+        return index, listed_at
+
+    def _write_index(self, index: pl.DataFrame, listed_at: str) -> None:
+        """Persist the listing index for the next run."""
+        assert self.index_path is not None
+        _write_parquet(index, self.index_path, metadata={INDEX_FULL_LISTING_METADATA_KEY: listed_at})
+        logger.info("Summary statistics index with {} files written to {}.", index.height, self.index_path)
+
+    @staticmethod
+    def _watermarks(index: pl.DataFrame) -> Callable[[ListingShard], str | None]:
+        """Get the function finding the last indexed object name of a listing shard."""
+        paths = index[SummaryStatisticsIndexSchema.FILE_PATH]
+
+        def watermark(shard: ListingShard) -> str | None:
+            root = f"gs://{shard.glob.bucket}/"
+            names = paths.filter(paths.str.starts_with(root + shard.prefix)).str.strip_prefix(root)
+            if shard.shallow:
+                names = names.filter(~names.str.slice(len(shard.prefix)).str.contains("/", literal=True))
+            last = names.max()
+            return str(last) if last is not None else None
+
+        return watermark
+
+    def _fetch_index(self, start_offset: Callable[[ListingShard], str | None] | None = None) -> pl.DataFrame:
+        """Fetch the file paths and their metadata from GCS based on the glob patterns.
+
+        Each listing page is converted into a record batch on the thread that listed it, so only the
+        columnar batches are kept in memory while the remaining shards are being listed.
+
+        Args:
+            start_offset (Callable[[ListingShard], str | None] | None): Function giving the object name each shard
+                is listed from, all the objects are listed when None.
+
+        Returns:
+            pl.DataFrame: The listed files following the `SummaryStatisticsIndexSchema`.
+        """
+        lister = GCSGlobLister(self.gcs_globs, max_workers=self.max_workers)
+        batches = list(lister.map_pages(_listing_page_to_frame, start_offset))
+        if not batches:
+            return pl.DataFrame(schema=SummaryStatisticsIndexSchema.schema())
+        return pl.concat(batches, how="vertical", rechunk=True)
 
     def crawl(self) -> pl.DataFrame:
         """Crawl GCS and return a DataFrame of summary statistics files."""
-        # Implementation to crawl GCS and return a DataFrame
-        file_paths = self._fetch_paths()
-        logger.debug("Found {} summary statistics files.", len(file_paths))
-        data = pl.DataFrame({
-            SyncedSummaryStatisticsSchema.FILE_PATH: file_paths,
-            SyncedSummaryStatisticsSchema.SYNCED: [True] * len(file_paths),
-        }).with_columns(
-            pl.col(SyncedSummaryStatisticsSchema.FILE_PATH)
-            .str.extract(r"\/(GCST\d+)\/", 1)
-            .alias(SyncedSummaryStatisticsSchema.STUDY_ID)
+        previous = self._read_index()
+        if previous is None:
+            listed_at = datetime.now(UTC).isoformat()
+            listed = self._fetch_index()
+        else:
+            index, listed_at = previous
+            new = self._fetch_index(self._watermarks(index))
+            # The last indexed object of each shard is listed again, the listed entries replace the indexed ones.
+            listed = (
+                pl.concat([index, new], how="vertical")
+                .unique(subset=SummaryStatisticsIndexSchema.FILE_PATH, keep="last")
+                .sort(SummaryStatisticsIndexSchema.FILE_PATH)
+            )
+            logger.info("{} summary statistics files added since the index was written.", listed.height - index.height)
+        logger.debug("Found {} summary statistics files.", listed.height)
+        if self.index_path is not None:
+            self._write_index(listed, listed_at)
+        self.index = listed
+        data = listed.select(
+            SyncedSummaryStatisticsSchema.FILE_PATH,
+            pl.lit(True).alias(SyncedSummaryStatisticsSchema.SYNCED),
+            SyncedSummaryStatisticsSchema.STUDY_ID,
         )
         # Post check to find if there are any studies with multiple files.
         multi_files = data.group_by(SyncedSummaryStatisticsSchema.STUDY_ID).len().filter(pl.col("len") > 1)
@@ -142,12 +441,72 @@ class GCSSummaryStatisticsFileCrawler:
             logger.warning("Synced data after deduplication:\n{}", data.shape)
         return data
 
+    def crawled(self) -> pl.DataFrame:
+        """Get the summary statistics found by the crawl, crawling them on the first call."""
+        if self.synced is None:
+            self.synced = self.crawl()
+        return self.synced
+
+    def listing_digest(self) -> str:
+        """Get the digest of the paths and generations of the summary statistics files found by the last crawl."""
+        assert self.index is not None, "The summary statistics have to be crawled before they are digested."
+        digest = hashlib.sha256()
+        files = self.index.sort(SummaryStatisticsIndexSchema.FILE_PATH).select(
+            SummaryStatisticsIndexSchema.FILE_PATH, SummaryStatisticsIndexSchema.GENERATION
+        )
+        for path, generation in files.iter_rows():
+            digest.update(f"{path}\t{generation}\n".encode())
+        return digest.hexdigest()
+
+    def probe(self, study_ids: Sequence[str], max_workers: int = DEFAULT_MAX_PROBES) -> pl.DataFrame:
+        """Probe the summary statistics files of the studies found by the last crawl.
+
+        Only the head and the trailer of each file are read (see `GCSGzipProber`), so probing the new studies
+        of a release costs two small ranged reads per study.
+
+        Args:
+            study_ids (Sequence[str]): The studies to probe, usually the new studies of the release.
+            max_workers (int): Maximum number of files probed concurrently.
+
+        Returns:
+            pl.DataFrame: The probed files following the `SummaryStatisticsProbeSchema`.
+        """
+        assert self.index is not None, "The summary statistics have to be crawled before probing."
+        files = (
+            self.index.filter(pl.col(SummaryStatisticsIndexSchema.STUDY_ID).is_in(list(study_ids)))
+            .sort(SummaryStatisticsIndexSchema.FILE_PATH)
+            .unique(subset=SummaryStatisticsIndexSchema.STUDY_ID, keep="first", maintain_order=True)
+        )
+        logger.info("Probing {} summary statistics files.", files.height)
+        probes = GCSGzipProber(max_workers=max_workers).probe_many(
+            files.select(SummaryStatisticsIndexSchema.FILE_PATH, SummaryStatisticsIndexSchema.SIZE).iter_rows()
+        )
+        return pl.DataFrame(
+            {
+                SummaryStatisticsProbeSchema.STUDY_ID: files[SummaryStatisticsIndexSchema.STUDY_ID],
+                SummaryStatisticsProbeSchema.COLUMNS: [",".join(p.columns) if p.columns else None for p in probes],
+                SummaryStatisticsProbeSchema.COMPRESSED_SIZE: [p.compressed_size for p in probes],
+                SummaryStatisticsProbeSchema.UNCOMPRESSED_SIZE: [p.uncompressed_size for p in probes],
+                SummaryStatisticsProbeSchema.IS_COMPLETE: [p.is_complete for p in probes],
+            },
+            schema=SummaryStatisticsProbeSchema.schema(),
+        )
+
 
 class GWASCatalogCuration:
     """Class to handle the curation of GWAS Catalog data."""
 
-    def __init__(self, previous_curation: pl.DataFrame, studies: pl.DataFrame, synced: pl.DataFrame):
-        """Initialize the GWASCatalogCuration with previous curation and studies data."""
+    def __init__(
+        self,
+        previous_curation: pl.DataFrame,
+        studies: pl.DataFrame,
+        synced: pl.DataFrame,
+        probes: pl.DataFrame | None = None,
+    ):
+        """Initialize the GWASCatalogCuration with previous curation and studies data.
+
+        The optional `probes` (see `SummaryStatisticsProbeSchema`) are added to the result as extra columns.
+        """
         logger.debug("Initializing GWASCatalogCuration with previous curation and studies data.")
         self.previous_curation = previous_curation
         logger.debug("Previous curation data loaded with shape: {}", previous_curation.shape)
@@ -155,94 +514,252 @@ class GWASCatalogCuration:
         logger.debug("Studies data loaded with shape: {}", studies.shape)
         self.synced = synced
         logger.debug("Synced summary statistics data loaded with shape: {}", synced.shape)
+        self.probes = probes
+
+    @staticmethod
+    def read_previous_curation(path: str) -> pl.DataFrame:
+        """Read the previous curation, keeping its status column when present."""
+        # The status is kept when the previous curation was built by this task, so the delta can track its changes
+        source = _read_source(path)
+        header = pl.read_csv(source, separator="\t", has_header=True, n_rows=0).columns
+        return pl.read_csv(
+            source,
+            separator="\t",
+            has_header=True,
+            columns=CurationSchema.extended_columns() if "status" in header else CurationSchema.columns(),
+        )
+
+    @staticmethod
+    def read_studies(path: str) -> pl.DataFrame:
+        """Read the studies from the GWAS Catalog download studies file."""
+        studies = pl.read_csv(
+            _read_source(path),
+            separator="\t",
+            quote_char="`",
+            has_header=True,
+            columns=list(DownloadStudiesSchema.mapping().keys()),
+        )
+        return studies.rename(mapping=DownloadStudiesSchema.mapping())
+
+    @staticmethod
+    def fingerprint(
+        previous_curation_path: str,
+        download_studies_path: str,
+        crawler: GCSSummaryStatisticsFileCrawler,
+        probe: bool = False,
+    ) -> str | None:
+        """Fingerprint the inputs of the curation, the curation of the inputs with the same fingerprint is the same.
+
+        The fingerprint covers the generations of the previous curation and studies, the digest of the summary
+        statistics listing, whether the new studies are probed, the output columns, the `CURATION_VERSION` and the
+        installed gentroutils version, so the outputs of an older curation logic are rebuilt. The summary statistics
+        are crawled concurrently with the generation lookups, the crawl is reused by `from_prev_curation`.
+
+        Args:
+            previous_curation_path (str): The path to the previous curation file.
+            download_studies_path (str): The path to the studies file.
+            crawler (GCSSummaryStatisticsFileCrawler): The crawler of the summary statistics.
+            probe (bool): Whether the summary statistics files of the new studies are probed.
+
+        Returns:
+            str | None: The hex digest of the inputs, None when the previous curation or the studies do not exist.
+        """
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="curation-fingerprint") as executor:
+            crawled_future = executor.submit(crawler.crawled)
+            previous_future = executor.submit(_source_generation, previous_curation_path)
+            studies_future = executor.submit(_source_generation, download_studies_path)
+            crawled_future.result()
+            previous_generation = previous_future.result()
+            studies_generation = studies_future.result()
+        if previous_generation is None or studies_generation is None:
+            return None
+        inputs = {
+            "previous_curation": [previous_curation_path, previous_generation],
+            "studies": [download_studies_path, studies_generation],
+            "summary_statistics": crawler.listing_digest(),
+            "probe": probe,
+            "columns": CurationSchema.extended_columns(),
+            "curation_version": CURATION_VERSION,
+            "gentroutils_version": _gentroutils_version(),
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
 
     @classmethod
     def from_prev_curation(
         cls,
         previous_curation_path: str,
         download_studies_path: str,
-        summary_statistics_glob: str,
+        summary_statistics_glob: str | Sequence[str],
+        summary_statistics_index: str | None = None,
+        full_refresh: bool = False,
+        refresh_days: int = DEFAULT_INDEX_REFRESH_DAYS,
+        cache_path: str | None = None,
+        artifacts: ArtifactCache | None = None,
+        probe: bool = False,
+        max_concurrent_probes: int = DEFAULT_MAX_PROBES,
+        crawler: GCSSummaryStatisticsFileCrawler | None = None,
     ) -> GWASCatalogCuration:
-        """Create a GWASCatalogCuration instance from previous curation and studies."""
-        crawled_summary_statistics = GCSSummaryStatisticsFileCrawler(summary_statistics_glob).crawl()
+        """Create a GWASCatalogCuration instance from previous curation and studies.
+
+        The summary statistics crawl and the reads of the previous curation and studies are independent,
+        so they run concurrently and the loading time follows the slowest of the three.
+        When the `cache_path` is provided, the parsed previous curation and studies are stored there as Parquet
+        and reused by the following runs for as long as the source files keep the same generation.
+        The `artifacts` hold the local copies of the files uploaded earlier in the same run, which are read
+        in place of the GCS objects when their generation matches.
+        When `probe` is set, the summary statistics files of the new studies are probed
+        (see `GCSSummaryStatisticsFileCrawler.probe`) and the probed fields are added to the result.
+        The summary statistics found by the `crawler` are reused when it already crawled them (see `fingerprint`).
+        """
+        if crawler is None:
+            crawler = GCSSummaryStatisticsFileCrawler(
+                summary_statistics_glob,
+                index_path=summary_statistics_index,
+                full_refresh=full_refresh,
+                refresh_days=refresh_days,
+            )
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="curation-inputs") as executor:
+            crawled_future = executor.submit(crawler.crawled)
+            previous_future = executor.submit(
+                _read_through_cache, previous_curation_path, cls.read_previous_curation, cache_path, artifacts
+            )
+            studies_future = executor.submit(
+                _read_through_cache, download_studies_path, cls.read_studies, cache_path, artifacts
+            )
+            crawled_summary_statistics = crawled_future.result()
+            previous_curation_df = previous_future.result()
+            studies_df = studies_future.result()
 
-        previous_curation_df = pl.read_csv(
-            previous_curation_path,
-            separator="\t",
-            has_header=True,
-            columns=CurationSchema.columns(),
-        )
         if previous_curation_df.is_empty():
             raise GentroutilsError(GentroutilsErrorMessage.PREVIOUS_CURATION_EMPTY, path=previous_curation_path)
-        studies_df = pl.read_csv(
-            download_studies_path,
-            separator="\t",
-            quote_char="`",
-            has_header=True,
-            columns=list(DownloadStudiesSchema.mapping().keys()),
-        )
         if studies_df.is_empty():
             raise GentroutilsError(GentroutilsErrorMessage.DOWNLOAD_STUDIES_EMPTY, path=download_studies_path)
-        studies_df = studies_df.rename(mapping=DownloadStudiesSchema.mapping())
-        return cls(previous_curation_df, studies_df, crawled_summary_statistics)
-
-    @property
+        probes = None
+        if probe:
+            new_studies = studies_df.join(previous_curation_df, on=CurationSchema.STUDY_ID, how="anti").join(
+                crawled_summary_statistics, on=CurationSchema.STUDY_ID, how="semi"
+            )
+            probes = crawler.probe(new_studies[CurationSchema.STUDY_ID].to_list(), max_workers=max_concurrent_probes)
+        return cls(previous_curation_df, studies_df, crawled_summary_statistics, probes)
+
+    @cached_property
     def result(self) -> pl.DataFrame:
-        """Curate the GWAS Catalog data."""
-        # Studies that are curated but were removed from the GWAS Catalog
-        removed_studies = self.previous_curation.join(self.studies, on=CurationSchema.STUDY_ID, how="anti").select(
-            CurationSchema.STUDY_ID, pl.lit(CuratedStudyStatus.REMOVED).alias("status")
+        """Curate the GWAS Catalog data.
+
+        The status of each study is assigned in a single full outer join between the previous curation
+        and the studies from the latest release, with indicator columns marking the side the study was found on:
+
+            * present in both - `curated`, the fields are kept from the previous curation. Studies that were
+              still `to_curate` or `no_summary_statistics` in the previous curation get their status from the
+              synced summary statistics again, like the new studies.
+            * present only in the previous curation - `removed`.
+            * present only in the studies - `to_curate` when the summary statistics are synced,
+              otherwise `no_summary_statistics`, the fields are taken from the studies.
+
+        When the summary statistics were probed, the `SummaryStatisticsProbeSchema` columns are added
+        and are only filled for the probed (new) studies.
+        """
+        in_previous, in_studies, previous_status = "_inPreviousCuration", "_inStudies", "_previousStatus"
+        previous = (
+            self.previous_curation.lazy()
+            .select(
+                *CurationSchema.columns(),
+                (
+                    pl.col("status").cast(pl.String)
+                    if "status" in self.previous_curation.columns
+                    else pl.lit(None, dtype=pl.String)
+                ).alias(previous_status),
+            )
+            .with_columns(pl.lit(True).alias(in_previous))
         )
-        logger.debug("Removed studies identified: {}", removed_studies.shape[0])
-
-        # studies that are curated and still in the GWAS Catalog
-        curated_studies = self.previous_curation.join(self.studies, on=CurationSchema.STUDY_ID, how="inner").select(
-            CurationSchema.STUDY_ID, pl.lit(CuratedStudyStatus.CURATED).alias("status")
+        synced = (
+            self.synced.lazy()
+            .select(SyncedSummaryStatisticsSchema.STUDY_ID, SyncedSummaryStatisticsSchema.SYNCED)
+            .unique(subset=SyncedSummaryStatisticsSchema.STUDY_ID)
+        )
+        studies = (
+            self.studies.lazy()
+            .select(DownloadStudiesSchema.columns())
+            .with_columns(pl.lit(True).alias(in_studies))
+            .join(synced, on=CurationSchema.STUDY_ID, how="left")
         )
-        logger.debug("Curated studies identified: {}", curated_studies.shape[0])
-
-        # Combine all previous studies with updated status information.
-        prev_studies = pl.concat([removed_studies, curated_studies], how="vertical")
-        logger.debug("Previous studies after combining removed and curated: {}", prev_studies.shape[0])
 
-        # Bring back the information from the previous curation
-        prev_studies = (
-            prev_studies.join(self.previous_curation, on=CurationSchema.STUDY_ID, how="full", coalesce=True)
-            .with_columns(pl.coalesce(CurationSchema.IS_CURATED, pl.lit(False)).alias(CurationSchema.IS_CURATED))
-            .select(*CurationSchema.extended_columns())
+        def previous_or_studies(column: str) -> pl.Expr:
+            """Keep the field from the previous curation, unless the study is new."""
+            return (
+                pl.when(pl.col(in_previous)).then(pl.col(column)).otherwise(pl.col(f"{column}_studies")).alias(column)
+            )
+
+        # Studies not curated yet keep following their summary statistics, they are not `curated` by being kept.
+        not_curated_yet = (
+            pl.col(previous_status)
+            .is_in([CuratedStudyStatus.TO_CURATE, CuratedStudyStatus.NO_SUMSTATS])
+            .fill_null(False)
         )
-        logger.debug("Previous studies after bringing previous curation data: {}", prev_studies.shape[0])
-
-        assert all(prev_studies.select(CurationSchema.STUDY_ID).is_unique()), "Study IDs must be unique after merging."
-
-        # Studies that are new in the GWAS Catalog
-        new_studies = self.studies.join(self.previous_curation, on=CurationSchema.STUDY_ID, how="anti")
-        # Annotate new studies with info if they have summary statistics synced to the GCS bucket
-        new_studies_annotated = new_studies.join(self.synced, on=CurationSchema.STUDY_ID, how="left")
-        # Assign status NO_SUMSTATS to new studies without synced summary statistics (left join to drop info about already curated studies)
-        new_studies_annotated = new_studies_annotated.select(
-            CurationSchema.STUDY_ID,
-            pl.lit(None).alias(CurationSchema.STUDY_TYPE),
-            pl.lit(None).alias(CurationSchema.ANALYSIS_FLAG),
-            pl.lit(None).alias(CurationSchema.QUALITY_CONTROL),
-            pl.lit(False).alias(CurationSchema.IS_CURATED),
-            CurationSchema.PUBMED_ID,
-            CurationSchema.PUBLICATION_TITLE,
-            CurationSchema.TRAIT_FROM_SOURCE,
-            pl.when(pl.col(SyncedSummaryStatisticsSchema.SYNCED).is_null())
-            .then(pl.lit(CuratedStudyStatus.NO_SUMSTATS))
-            .otherwise(pl.lit(CuratedStudyStatus.TO_CURATE))
-            .alias("status"),
+        status = (
+            pl.when(pl.col(in_previous) & pl.col(in_studies) & not_curated_yet.not_())
+            .then(pl.lit(CuratedStudyStatus.CURATED))
+            .when(pl.col(in_previous) & pl.col(in_studies).not_())
+            .then(pl.lit(CuratedStudyStatus.REMOVED))
+            .when(pl.col(SyncedSummaryStatisticsSchema.SYNCED))
+            .then(pl.lit(CuratedStudyStatus.TO_CURATE))
+            .otherwise(pl.lit(CuratedStudyStatus.NO_SUMSTATS))
+            .cast(CuratedStudyStatus.dtype())
+            .alias("status")
         )
-        logger.debug("New studies identified: {}", new_studies.shape[0])
 
-        # Union of new studies and previously curated studies
-        all_studies = pl.concat([prev_studies, new_studies_annotated], how="vertical")
-
-        logger.debug("All studies after combining new and previous: {}", all_studies.shape[0])
+        all_studies = (
+            previous.join(
+                studies,
+                on=CurationSchema.STUDY_ID,
+                how="full",
+                coalesce=True,
+                suffix="_studies",
+                maintain_order="left_right",
+            )
+            .with_columns(pl.col(in_previous, in_studies).fill_null(False))
+            .select(
+                CurationSchema.STUDY_ID,
+                *(pl.col(c).cast(pl.Categorical) for c in CurationSchema.categorical_columns()),
+                pl.col(CurationSchema.IS_CURATED).fill_null(False),
+                previous_or_studies(CurationSchema.PUBMED_ID),
+                previous_or_studies(CurationSchema.PUBLICATION_TITLE),
+                previous_or_studies(CurationSchema.TRAIT_FROM_SOURCE),
+                status,
+            )
+            .collect()
+        )
+        logger.debug("All studies after merging the previous curation and the studies: {}", all_studies.shape[0])
 
         # Ensure the contract on the output dataframe
         assert all(all_studies.select(CurationSchema.STUDY_ID).is_unique()), "Study IDs must be unique after merging."
-        assert all_studies.shape[0] == all_studies.shape[0], "The number of studies must match after merging."
 
-        return all_studies.select(CurationSchema.extended_columns())
+        if self.probes is not None:
+            all_studies = all_studies.join(self.probes, on=CurationSchema.STUDY_ID, how="left", maintain_order="left")
+        return all_studies.select(*CurationSchema.extended_columns(), *self._probe_columns())
+
+    def _probe_columns(self) -> list[str]:
+        """Get the probed summary statistics columns added to the outputs."""
+        return SummaryStatisticsProbeSchema.columns() if self.probes is not None else []
+
+    @cached_property
+    def delta(self) -> pl.DataFrame:
+        """Studies added, removed or with a changed status compared to the previous curation.
+
+        The `previousStatus` column holds the status found in the previous curation and is null for the studies
+        added in the latest release. When the previous curation does not carry the status column,
+        all of its studies are assumed to be `curated`.
+        """
+        previous_status = (
+            pl.col("status").cast(pl.String)
+            if "status" in self.previous_curation.columns
+            else pl.lit(CuratedStudyStatus.CURATED.value)
+        )
+        previous = self.previous_curation.select(
+            CurationSchema.STUDY_ID, previous_status.alias("previousStatus")
+        ).unique(subset=CurationSchema.STUDY_ID)
+        delta = self.result.join(previous, on=CurationSchema.STUDY_ID, how="left", maintain_order="left").filter(
+            pl.col("previousStatus").is_null() | (pl.col("previousStatus") != pl.col("status").cast(pl.String))
+        )
+        logger.debug("Studies changed since the previous curation: {}", delta.shape[0])
+        return delta.select(*CurationSchema.delta_columns(), *self._probe_columns())
@@ -0,0 +1,191 @@
+"""Opt-in CPU and memory profiling of the gentroutils tasks."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import re
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType, TracebackType
+from typing import Any, Self, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+DEFAULT_SAMPLING_INTERVAL = 0.005
+"""Default time in seconds between two stack samples."""
+
+DEFAULT_TOP_ALLOCATIONS = 25
+"""Default number of allocation sites listed in the memory summary."""
+
+
+def _fold(thread_name: str, frame: FrameType | None) -> str:
+    """Collapse the stack of the frame into a single `thread;outer;...;inner` line."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join([thread_name, *reversed(stack)])
+
+
+class TaskProfiler:
+    """Profile the code run inside the context with a sampling CPU profiler and `tracemalloc`.
+
+    A background thread samples the stacks of all other threads every `interval` seconds, so the samples show
+    where the time goes whether a thread computes (Polars joins, decompression) or waits (network).
+    The samples are written in the collapsed stack format (`cpu.folded`), which opens in speedscope
+    or `flamegraph.pl`.
+
+    The memory summary (`memory.txt`) reports the peak of the Python allocations traced by `tracemalloc`,
+    the peak resident set size of the process (which also covers the native Polars and Arrow buffers)
+    and the top sites of the Python allocations still alive when the run ends.
+
+    Examples:
+    ---
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     with TaskProfiler(Path(tmp)) as profiler:
+    ...         _ = sorted(range(1000), reverse=True)
+    ...     sorted(p.name for p in profiler.files)
+    ['cpu.folded', 'memory.txt']
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        interval: float = DEFAULT_SAMPLING_INTERVAL,
+        top_allocations: int = DEFAULT_TOP_ALLOCATIONS,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            output_dir (Path): Directory where the profile files are written.
+            interval (float): Time in seconds between two stack samples.
+            top_allocations (int): Number of allocation sites listed in the memory summary.
+        """
+        self.output_dir = output_dir
+        self.interval = interval
+        self.top_allocations = top_allocations
+        self.samples: Counter[str] = Counter()
+        self.files: list[Path] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_tracing = False
+        self._start_time = 0.0
+
+    def __enter__(self) -> Self:
+        """Start tracing the allocations and sampling the stacks."""
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._sample, name="gentroutils-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Stop the profiler and write the profile files, also when the profiled code failed."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        elapsed = time.perf_counter() - self._start_time
+        current, peak = tracemalloc.get_traced_memory()
+        # A snapshot takes time proportional to the number of live blocks, so it is only taken once at the end.
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.files = [self._write_cpu_profile(), self._write_memory_summary(snapshot, current, peak, elapsed)]
+        logger.info(f"Profile written to {self.output_dir}.")
+
+    def _sample(self) -> None:
+        """Sample the stacks of the other threads."""
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self.samples[_fold(names.get(ident, str(ident)), frame)] += 1
+
+    def _write_cpu_profile(self) -> Path:
+        """Write the stack samples in the collapsed stack format."""
+        path = self.output_dir / "cpu.folded"
+        with path.open("w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def _write_memory_summary(self, snapshot: tracemalloc.Snapshot, current: int, peak: int, elapsed: float) -> Path:
+        """Write the memory peaks and the top sites of the allocations still alive at the end of the run."""
+        # On Linux `ru_maxrss` is reported in KiB.
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        lines = [
+            f"Wall time: {elapsed:.2f} s ({sum(self.samples.values())} stack samples)",
+            f"Peak traced Python memory: {peak / 2**20:.1f} MiB",
+            f"Peak resident set size: {max_rss / 2**20:.1f} MiB",
+            f"Top {self.top_allocations} allocation sites of the {current / 2**20:.1f} MiB alive at the end:",
+        ]
+        statistics = snapshot.filter_traces([tracemalloc.Filter(False, __file__)]).statistics("lineno")
+        lines.extend(f"  {s}" for s in statistics[: self.top_allocations])
+        path = self.output_dir / "memory.txt"
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+
+def task_slug(name: str) -> str:
+    """Turn the task name into a file name."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "task"
+
+
+def _upload_profile(files: list[Path], destination: str) -> None:
+    """Upload the profile files under the directory of the destination."""
+    from gentroutils.io.path import copy_uri
+
+    async def upload() -> None:
+        await asyncio.gather(*(copy_uri(str(f), f"{destination}/{f.name}") for f in files))
+
+    asyncio.run(upload())
+    logger.info(f"Profile uploaded to {destination}.")
+
+
+def profiled(run: Callable[..., T]) -> Callable[..., T]:  # noqa: UP047
+    """Profile the `run` method of a task when the `profile` field of its spec is set.
+
+    The profile is written to `<work_path>/profiles/<task name>/` and, when the task registered its output
+    `artifacts`, uploaded to the `profiles/<task name>/` directory next to the first artifact.
+    The decorator goes below `@report`, so a failed run is still profiled and reported.
+    """
+
+    @functools.wraps(run)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        if not getattr(self.spec, "profile", False):
+            return run(self, *args, **kwargs)
+        name = task_slug(self.spec.name)
+        profiler = TaskProfiler(Path(self.context.config.work_path) / "profiles" / name)
+        try:
+            with profiler:
+                return run(self, *args, **kwargs)
+        finally:
+            if self.artifacts:
+                destination = f"{self.artifacts[0].destination.rstrip('/').rsplit('/', 1)[0]}/profiles/{name}"
+                try:
+                    _upload_profile(profiler.files, destination)
+                except Exception as e:
+                    logger.warning(f"Failed to upload the profile to {destination}: {e}")
+
+    return wrapper
+
+
+__all__ = ["TaskProfiler", "profiled", "task_slug"]
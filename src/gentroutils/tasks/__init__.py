@@ -7,11 +7,19 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
 
-import aiohttp
 from loguru import logger
+from otter.task.model import Spec
 from pydantic import AliasPath, BaseModel, Field
 
 from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.gcs.upload import (
+    DEFAULT_COMPOSITE_PARALLELISM,
+    DEFAULT_COMPOSITE_PART_SIZE,
+    DEFAULT_COMPOSITE_UPLOAD_THRESHOLD,
+    CompositeUploader,
+)
+from gentroutils.io.workers import DEFAULT_CPU_WORKERS
+from gentroutils.tracing import span
 
 
 class KeepMissing(defaultdict[str, str]):
@@ -26,6 +34,11 @@ def destination_validator(path: str) -> str:
     return path
 
 
+def optional_destination_validator(path: str | None) -> str | None:
+    """Ensure that the optional destination path contains a template for the release date."""
+    return path if path is None else destination_validator(path)
+
+
 @dataclass
 class TemplateDestination:
     """A destination that can be formatted with a release date."""
@@ -43,6 +56,55 @@ class TemplateDestination:
         return TemplateDestination(self.destination.format_map(KeepMissing(**substitutions)), True)
 
 
+class ProfiledSpec(Spec):
+    """Base of the specs of the tasks that can be profiled."""
+
+    profile: bool = False
+    """Whether to profile the task run.
+
+    The CPU samples and the memory summary are written to `<work_path>/profiles/<task name>/` and uploaded
+    to the `profiles/<task name>/` directory next to the task output.
+    """
+
+
+class TransferSpec(ProfiledSpec):
+    """Base of the specs of the tasks transferring files with the `TransferManager`."""
+
+    memory_budget: int | None = Field(default=None, gt=0)
+    """Optional number of bytes the concurrent transfers may hold in memory at the same time.
+
+    Transfers wait for memory when the budget is exhausted, the high-water mark is logged once they complete.
+    """
+
+    cpu_workers: int = Field(default=DEFAULT_CPU_WORKERS, gt=0)
+    """The number of threads running the CPU-bound stages of the transfers (unzipping, serialization)."""
+
+
+class UploadSpec(TransferSpec):
+    """Base of the specs of the tasks uploading large objects to Google Cloud Storage."""
+
+    composite_upload_threshold: int = Field(default=DEFAULT_COMPOSITE_UPLOAD_THRESHOLD, gt=0)
+    """The size in bytes from which the uploaded objects are split into parts uploaded concurrently.
+
+    The parts are uploaded as temporary objects under `gentroutils-tmp/composite/` in the destination bucket,
+    composed into the object and deleted. Smaller objects are uploaded with a single stream.
+    """
+
+    composite_upload_part_size: int = Field(default=DEFAULT_COMPOSITE_PART_SIZE, gt=0)
+    """The size in bytes of the parts of the composite uploads, grown to keep at most 32 parts per object."""
+
+    composite_upload_parallelism: int = Field(default=DEFAULT_COMPOSITE_PARALLELISM, gt=0)
+    """The number of parts uploaded at the same time, across all the objects uploaded by the task."""
+
+    def uploader(self) -> CompositeUploader:
+        """Get the upload engine configured by the spec."""
+        return CompositeUploader(
+            threshold=self.composite_upload_threshold,
+            part_size=self.composite_upload_part_size,
+            parallelism=self.composite_upload_parallelism,
+        )
+
+
 class GwasCatalogReleaseInfo(BaseModel):
     """Model to hold GWAS Catalog release information."""
 
@@ -80,15 +142,21 @@ class GwasCatalogReleaseInfo(BaseModel):
     @staticmethod
     async def _get_release_info(uri: str) -> GwasCatalogReleaseInfo:
         """Get the release information from the specified URI."""
+        import aiohttp
+
         headers = {"Accept": "application/json"}
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(uri) as response:
-                release_info = await response.json()
-                return GwasCatalogReleaseInfo(**release_info)
+        with span("release lookup", uri=uri) as s:
+            async with aiohttp.ClientSession(headers=headers) as session:
+                async with session.get(uri) as response:
+                    release_info = await response.json()
+                    s.set(bytes=response.content_length)
+                    return GwasCatalogReleaseInfo(**release_info)
 
     @classmethod
     def from_uri(cls, uri: str) -> GwasCatalogReleaseInfo:
         """Fetch the release information from the specified URI."""
+        import aiohttp
+
         logger.debug(f"Fetching release info from {uri}")
         try:
             return asyncio.run(cls._get_release_info(uri))
@@ -1,20 +1,21 @@
 """Module to handle the crawling of GWAS Catalog release information."""
 
 import tempfile
-from pathlib import Path
 from typing import Annotated, Any, Self
 
 from loguru import logger
-from otter.storage import get_remote_storage
-from otter.task.model import Spec, Task, TaskContext
+from otter.manifest.model import Artifact
+from otter.task.model import Task, TaskContext
 from otter.task.task_reporter import report
 from pydantic import AfterValidator
 
 from gentroutils.io.path import GCSPath
-from gentroutils.tasks import GwasCatalogReleaseInfo, TemplateDestination, destination_validator
+from gentroutils.profiling import profiled
+from gentroutils.tasks import GwasCatalogReleaseInfo, ProfiledSpec, TemplateDestination, destination_validator
+from gentroutils.tracing import span, traced
 
 
-class CrawlSpec(Spec):
+class CrawlSpec(ProfiledSpec):
     """Configuration fields for the release crawler task.
 
     The `CrawlSpec` defines the parameters needed to crawl the GWAS Catalog release information.
@@ -130,26 +131,33 @@ class Crawl(Task):
 
     def _write_release_info(self, release_info: GwasCatalogReleaseInfo) -> Self:
         """Write the release information to the specified GCP blob."""
+        content = release_info.model_dump_json(indent=2, by_alias=False)
         with tempfile.NamedTemporaryFile() as source:
             logger.info(f"Writing release information to {source.name}")
             with open(source.name, "w") as source_file:
-                source_file.write(release_info.model_dump_json(indent=2, by_alias=False))
+                source_file.write(content)
                 source_file.flush()
                 destinations = self.spec.substituted_destinations(release_info)
                 logger.info(f"Destinations for release information: {destinations}")
                 for destination in destinations:
-                    storage = get_remote_storage(destination)
                     assert "gs://" in destination, f"Invalid GCS path in destination template: {destination}"
-                    storage.upload(Path(source.name), destination)
+                    with span("gcs upload", destination=destination, bytes=len(content.encode())):
+                        GCSPath(destination).blob().upload_from_filename(source.name)
                     logger.info(f"Release information written to {destination}")
         return self
 
     @report
+    @traced
+    @profiled
     def run(self) -> Self:
         """Crawl the release information."""
         logger.info(f"Crawling release information from {self.spec.stats_uri}")
         release_info = GwasCatalogReleaseInfo.from_uri(self.spec.stats_uri)
         logger.info("Crawling completed successfully.")
+        self.artifacts = [
+            Artifact(source=self.spec.stats_uri, destination=d)
+            for d in self.spec.substituted_destinations(release_info)
+        ]
         self._write_release_info(release_info)
         logger.info("Writing release information completed successfully.")
         return self
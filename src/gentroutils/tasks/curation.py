@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from typing import Annotated, Any, Self
 
 from loguru import logger
-from otter.task.model import Spec, Task, TaskContext
+from otter.manifest.model import Artifact
+from otter.task.model import Task, TaskContext
 from otter.task.task_reporter import report
-from pydantic import AfterValidator
+from pydantic import AfterValidator, Field
 
-from gentroutils.io.transfer.polars_to_gcs import PolarsDataFrameToGCSTransferableObject
-from gentroutils.parsers.curation import GWASCatalogCuration
-from gentroutils.tasks import TemplateDestination, destination_validator
-from gentroutils.transfer import TransferManager
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.io.gcs.probe import DEFAULT_MAX_PROBES
+from gentroutils.profiling import profiled
+from gentroutils.tasks import TemplateDestination, UploadSpec, destination_validator, optional_destination_validator
+from gentroutils.tracing import span, traced
 
 
-class CurationSpec(Spec):
+class CurationSpec(UploadSpec):
     """Configuration fields for the curation task.
 
     The `CurationSpec` defines the parameters needed to curate GWAS Catalog data.
@@ -56,15 +58,69 @@ class CurationSpec(Spec):
     destination_template: Annotated[str, AfterValidator(destination_validator)]
     """The destination path for the curation data."""
 
-    summary_statistics_glob: str
-    """The glob pattern to locate summary statistics files."""
+    summary_statistics_glob: str | list[str]
+    """The glob pattern (or list of glob patterns) to locate summary statistics files.
+
+    The patterns follow the GCS `match_glob` syntax, for example `gs://bucket/raw_summary_statistics/**.h.tsv.gz`.
+    """
+
+    summary_statistics_index: str | None = None
+    """Optional path to the Parquet index of the listed summary statistics files.
+
+    The index can point to an object in the bucket or to a file under the otter `work_path`.
+    When the index exists, each shard of the listing is only listed from its last indexed file, which picks up the
+    studies published since the previous run. The files synced late for older accessions, rewritten or removed are
+    picked up when the index is rebuilt from a full listing, every `summary_statistics_refresh_days` days.
+    """
+
+    summary_statistics_full_refresh: bool = False
+    """Whether to ignore the existing `summary_statistics_index` and list the metadata of all summary statistics files."""
+
+    summary_statistics_refresh_days: int = Field(default=7, ge=0)
+    """The number of days after which the `summary_statistics_index` is rebuilt from a full listing, 0 to always."""
+
+    summary_statistics_probe: bool = False
+    """Whether to probe the summary statistics files of the new studies.
+
+    Each file is probed with two ranged reads, the start of the file (gzip and TSV headers) and the gzip trailer.
+    The header columns, the compressed and uncompressed sizes and a validity flag are added to the curation output.
+    """
+
+    summary_statistics_probe_concurrency: int = Field(default=DEFAULT_MAX_PROBES, gt=0)
+    """The maximum number of summary statistics files probed concurrently."""
+
+    input_cache_path: str | None = None
+    """Optional directory for the Parquet copies of the parsed `previous_curation` and `studies`.
+
+    The directory can be in the bucket or under the otter `work_path`. A copy is reused for as long as the source
+    keeps the same GCS generation (or modification time for local files), which skips parsing the unchanged TSVs.
+    """
+
+    delta_destination_template: Annotated[str | None, AfterValidator(optional_destination_validator)] = None
+    """Optional destination path for the curation delta.
+
+    The delta holds only the studies added, removed or with a changed status compared to the previous curation,
+    with the previous status in the `previousStatus` column.
+    """
 
     promote: bool = False
     """Whether to promote the curation data to the latest version."""
 
-    def destinations(self) -> list[TemplateDestination]:
+    skip_unchanged: bool = True
+    """Whether to skip the curation when its inputs did not change since the outputs were built.
+
+    The inputs are fingerprinted by the generations of the `previous_curation` and `studies` and the digest of the
+    summary statistics listing, the fingerprint is recorded in the metadata of the outputs. When the outputs (of
+    this release, `latest` or the previous release) hold the same fingerprint, the curation is not built again and
+    the missing outputs are copied from them server side.
+    """
+
+    def destinations(self, template: str | None = None) -> list[TemplateDestination]:
         """Get the list of destinations templates where the release information will be saved.
 
+        Args:
+            template (str | None): The destination template, defaults to the `destination_template`.
+
         Returns:
             list[TemplateDestination]: A list of TemplateDestination objects with the formatted destination paths.
 
@@ -74,17 +130,18 @@ class CurationSpec(Spec):
                 1. The destination template with the release date substituted.
                 2. The destination with the release date substituted to `latest`.
         """
-        d1 = TemplateDestination(self.destination_template, False)
+        d1 = TemplateDestination(template or self.destination_template, False)
         if self.promote:
             d2 = d1.format({"release_date": "latest"})
             return [d1, d2]
         return [d1]
 
-    def substituted_destinations(self, release_date: date) -> list[str]:
+    def substituted_destinations(self, release_date: date, template: str | None = None) -> list[str]:
         """Safely parse the destination name to ensure it is valid."""
         substitutions = {"release_date": release_date.strftime("%Y%m%d")}
         return [
-            d.format(substitutions).destination if not d.is_substituted else d.destination for d in self.destinations()
+            d.format(substitutions).destination if not d.is_substituted else d.destination
+            for d in self.destinations(template)
         ]
 
     def model_post_init(self, __context: Any) -> None:
@@ -100,21 +157,131 @@ class Curation(Task):
         super().__init__(spec, context)
         self.spec: CurationSpec
 
+    def _reused_outputs(self, fingerprint: str, release_date: date) -> list[tuple[str, str]] | None:
+        """Get the copies reusing the outputs built from the same inputs, None when an output has to be built.
+
+        Each output is reused from one of its destinations (for example `latest` when the dated output is missing)
+        or from the output of the previous release, when it holds the same fingerprint.
+
+        Args:
+            fingerprint (str): The fingerprint of the curation inputs.
+            release_date (date): The release date substituted in the destinations.
+
+        Returns:
+            list[tuple[str, str]] | None: The source and destination of the copies, empty when every output exists.
+        """
+        from gentroutils.io.gcs import object_metadata, previous_release
+        from gentroutils.parsers.curation import CURATION_FINGERPRINT_METADATA_KEY
+
+        templates = [self.spec.destination_template]
+        if self.spec.delta_destination_template:
+            templates.append(self.spec.delta_destination_template)
+        copies: list[tuple[str, str]] = []
+        for template in templates:
+            destinations = self.spec.substituted_destinations(release_date, template)
+            if not all(d.startswith("gs://") for d in destinations):
+                return None
+            candidates = list(destinations)
+            previous_date = previous_release(template, release_date.strftime("%Y%m%d"))
+            if previous_date is not None:
+                previous = datetime.strptime(previous_date, "%Y%m%d").date()
+                candidates.append(self.spec.substituted_destinations(previous, template)[0])
+            built = [
+                c
+                for c in candidates
+                if (object_metadata(c) or {}).get(CURATION_FINGERPRINT_METADATA_KEY) == fingerprint
+            ]
+            if not built:
+                return None
+            copies.extend((built[0], d) for d in destinations if d not in built)
+        return copies
+
     @report
+    @traced
+    @profiled
     def run(self) -> Self:
         """Run the curation task."""
+        # polars and the transfer stack are imported when the task runs, not when otter registers it.
+        from google.api_core.exceptions import GoogleAPIError
+
+        from gentroutils.io.gcs import copy_object
+        from gentroutils.io.transfer.polars_to_gcs import PolarsDataFrameToGCSTransferableObject
+        from gentroutils.parsers.curation import (
+            CURATION_FINGERPRINT_METADATA_KEY,
+            GCSSummaryStatisticsFileCrawler,
+            GWASCatalogCuration,
+        )
+        from gentroutils.transfer import TransferManager
+
         logger.info("Starting curation task.")
         release_date = date.today()
         logger.debug(f"Using release date: {release_date}")
         destinations = self.spec.substituted_destinations(release_date)
         logger.debug(f"Destinations for curation data: {destinations}")
-        curation = GWASCatalogCuration.from_prev_curation(
-            self.spec.previous_curation, self.spec.studies, self.spec.summary_statistics_glob
+        self.artifacts = [Artifact(source=self.spec.studies, destination=d) for d in destinations]
+        crawler = GCSSummaryStatisticsFileCrawler(
+            self.spec.summary_statistics_glob,
+            index_path=self.spec.summary_statistics_index,
+            full_refresh=self.spec.summary_statistics_full_refresh,
+            refresh_days=self.spec.summary_statistics_refresh_days,
         )
+        fingerprint = None
+        if self.spec.skip_unchanged:
+            with span("fingerprint inputs") as s:
+                fingerprint = GWASCatalogCuration.fingerprint(
+                    self.spec.previous_curation, self.spec.studies, crawler, probe=self.spec.summary_statistics_probe
+                )
+                try:
+                    reused = self._reused_outputs(fingerprint, release_date) if fingerprint is not None else None
+                except GoogleAPIError as e:
+                    logger.warning(f"Failed to look up the outputs of the previous curation: {e}")
+                    reused = None
+                s.set(unchanged=reused is not None)
+            if reused is not None:
+                with span("copy outputs", objects=len(reused)):
+                    for source, destination in reused:
+                        copy_object(source, destination)
+                logger.success(
+                    f"The curation inputs did not change since the outputs were built (fingerprint {fingerprint}), "
+                    f"skipped the curation and copied {len(reused)} outputs."
+                )
+                return self
+        with span("load inputs"):
+            curation = GWASCatalogCuration.from_prev_curation(
+                self.spec.previous_curation,
+                self.spec.studies,
+                self.spec.summary_statistics_glob,
+                summary_statistics_index=self.spec.summary_statistics_index,
+                full_refresh=self.spec.summary_statistics_full_refresh,
+                refresh_days=self.spec.summary_statistics_refresh_days,
+                cache_path=self.spec.input_cache_path,
+                artifacts=ArtifactCache(self.context.config.work_path / "artifacts"),
+                probe=self.spec.summary_statistics_probe,
+                max_concurrent_probes=self.spec.summary_statistics_probe_concurrency,
+                crawler=crawler,
+            )
+        with span("build result") as s:
+            s.set(rows=curation.result.height)
         logger.debug(f"Curation result preview:\n{curation.result.head()}")
+        # The fingerprint is recorded on the outputs, so the following runs with the same inputs can skip the curation.
+        metadata = {CURATION_FINGERPRINT_METADATA_KEY: fingerprint} if fingerprint is not None else None
         transfer_objects = [
-            PolarsDataFrameToGCSTransferableObject(source=curation.result, destination=d) for d in destinations
+            PolarsDataFrameToGCSTransferableObject(source=curation.result, destination=d, metadata=metadata)
+            for d in destinations
         ]
-        TransferManager().transfer(transfer_objects)
+        if self.spec.delta_destination_template:
+            delta_destinations = self.spec.substituted_destinations(release_date, self.spec.delta_destination_template)
+            logger.debug(f"Destinations for curation delta: {delta_destinations}")
+            with span("build delta") as s:
+                s.set(rows=curation.delta.height)
+            transfer_objects.extend(
+                PolarsDataFrameToGCSTransferableObject(source=curation.delta, destination=d, metadata=metadata)
+                for d in delta_destinations
+            )
+        TransferManager(
+            memory_budget=self.spec.memory_budget,
+            cpu_workers=self.spec.cpu_workers,
+            uploader=self.spec.uploader(),
+        ).transfer(transfer_objects)
 
         return self
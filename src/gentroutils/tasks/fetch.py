@@ -1,20 +1,48 @@
 """Module to handle the fetching of GWAS Catalog release files."""
 
-from typing import Annotated, Any, Self
+import asyncio
+import re
+from collections.abc import Sequence
+from fnmatch import fnmatchcase
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Annotated, Any, Self
 
 from loguru import logger
-from otter.task.model import Spec, Task, TaskContext
+from otter.manifest.model import Artifact
+from otter.task.model import Task, TaskContext
 from otter.task.task_reporter import report
-from pydantic import AfterValidator
+from pydantic import AfterValidator, Field
 
-from gentroutils.io.transfer import FTPtoGCPTransferableObject
-from gentroutils.tasks import GwasCatalogReleaseInfo, TemplateDestination, destination_validator
-from gentroutils.transfer import TransferManager
+from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.artifacts import DEFAULT_ARTIFACT_CACHE_BYTES, ArtifactCache
+from gentroutils.io.downloads import DEFAULT_DOWNLOAD_CACHE_BYTES, DownloadCache
+from gentroutils.profiling import profiled
+from gentroutils.tasks import (
+    GwasCatalogReleaseInfo,
+    KeepMissing,
+    TemplateDestination,
+    UploadSpec,
+    destination_validator,
+)
+from gentroutils.tracing import span, traced
+
+if TYPE_CHECKING:
+    from gentroutils.io.mirror import RemoteFile
 
 MAX_CONCURRENT_CONNECTIONS = 10
 
+GLOB_PATTERN = re.compile(r"[*?\[]")
+"""Characters that make the source file name a glob pattern."""
+
+
+def source_pattern_validator(path: str) -> str:
+    """Ensure that the glob pattern of the source is limited to its file name."""
+    if GLOB_PATTERN.search(path.rsplit("/", 1)[0]):
+        raise GentroutilsError(GentroutilsErrorMessage.SOURCE_PATTERN_IN_DIRECTORY, source=path)
+    return path
 
-class FetchSpec(Spec):
+
+class FetchSpec(UploadSpec):
     """Configuration fields for the fetch task.
 
     The task downloads single file based on the `source_template` and uploads it to the `destination_template`.
@@ -56,11 +84,20 @@ class FetchSpec(Spec):
     stats_uri: str = "https://www.ebi.ac.uk/gwas/api/search/stats"
     """The URI to crawl the release statistics information from."""
 
-    source_template: Annotated[str, AfterValidator(destination_validator)]
-    """The template URI of the file to download."""
+    source_template: Annotated[str, AfterValidator(destination_validator), AfterValidator(source_pattern_validator)]
+    """The template URI of the file to download.
+
+    The file name can be a glob pattern (`*`, `?`, `[...]`), for example `gwas-catalog-download-studies-v*.txt`
+    to follow the version bumps of the file. The pattern is expanded against a single, cached listing of the
+    release directory and all the matching files are transferred in one concurrent batch.
+    """
 
     destination_template: Annotated[str, AfterValidator(destination_validator)]
-    """The template URI to upload the file to."""
+    """The template URI to upload the file to.
+
+    The `{filename}` and `{stem}` placeholders are substituted with the name of the source file, with and
+    without its extension. They are required when the source pattern matches more than one file.
+    """
 
     promote: bool = False
     """Whether to promote the release information as the latest release.
@@ -77,6 +114,28 @@ class FetchSpec(Spec):
         promoting the release as the latest release.
     """
 
+    download_cache_max_bytes: int = Field(default=DEFAULT_DOWNLOAD_CACHE_BYTES, ge=0)
+    """The maximum size of the downloaded files kept under `<work_path>/downloads`, 0 disables the cache.
+
+    A rerun of a failed run reuses the cached files that did not change on the server instead of downloading
+    them again, the least recently used files are evicted beyond the maximum size.
+    """
+
+    artifact_cache_max_bytes: int = Field(default=DEFAULT_ARTIFACT_CACHE_BYTES, ge=0)
+    """The maximum size of the local copies of the uploaded files kept under `<work_path>/artifacts`, 0 disables them.
+
+    The dependent tasks of the run read the local copies instead of downloading the objects back, the least
+    recently used copies are evicted beyond the maximum size.
+    """
+
+    copy_unchanged: bool = True
+    """Whether to copy the files that did not change since the previous release from its objects, server side.
+
+    The previous release is the latest `%Y%m%d` directory found next to the `{release_date}` directory of the
+    destination. A file is copied when its name, size and modification time on the server match the ones recorded
+    on the object of the previous release, instead of being downloaded from the server again.
+    """
+
     def destinations(self) -> list[TemplateDestination]:
         """Get the list of destinations templates where the release information will be saved.
 
@@ -109,6 +168,61 @@ class FetchSpec(Spec):
             return [self.source_template.format(**substitutions)] * 2
         return [self.source_template.format(**substitutions)]
 
+    @property
+    def is_pattern(self) -> bool:
+        """Whether the file name of the source is a glob pattern."""
+        return GLOB_PATTERN.search(self.source_template) is not None
+
+    def substituted_transfers(
+        self, release_info: GwasCatalogReleaseInfo, filenames: Sequence[str] | None = None
+    ) -> list[tuple[str, str]]:
+        """Get the source and destination of every transfer of the release.
+
+        Args:
+            release_info (GwasCatalogReleaseInfo): The release to fetch.
+            filenames (Sequence[str] | None): The files of the release directory the source pattern is matched
+                against, the literal source file when None.
+
+        Returns:
+            list[tuple[str, str]]: The source and destination pairs, the destinations of each source in order.
+
+        Raises:
+            GentroutilsError: If no file matches the source pattern, or several files match and the destination
+                does not depend on the file name.
+
+        Examples:
+        ---
+        >>> rs = GwasCatalogReleaseInfo(
+        ...     date="2023-10-01", associations=1, studies=1, sumstats=1, snps=1,
+        ...     ensemblbuild="114.0", dbsnpbuild="1.0.0", efoversion="1.0.0", genebuild="GRCh38",
+        ... )
+        >>> fs = FetchSpec(
+        ...     source_template="ftp://example.com/{release_date}/gwas-catalog-download-*-v1.0.3.1.txt",
+        ...     destination_template="gs://bucket/{release_date}/{stem}.tsv",
+        ... )
+        >>> for t in fs.substituted_transfers(rs, ["gwas-catalog-download-studies-v1.0.3.1.txt", "README"]):
+        ...     print(*t)
+        ftp://example.com/2023/10/01/gwas-catalog-download-studies-v1.0.3.1.txt gs://bucket/20231001/gwas-catalog-download-studies-v1.0.3.1.tsv
+        """
+        source = self.substituted_sources(release_info)[0]
+        directory, pattern = source.rsplit("/", 1)
+        matches = [f for f in filenames if fnmatchcase(f, pattern)] if filenames is not None else [pattern]
+        destinations = self.substituted_destinations(release_info)
+        if not matches:
+            raise GentroutilsError(GentroutilsErrorMessage.SOURCE_PATTERN_NO_MATCH, source=source)
+        if len(matches) > 1 and not all("{filename}" in d or "{stem}" in d for d in destinations):
+            raise GentroutilsError(
+                GentroutilsErrorMessage.DESTINATION_NOT_UNIQUE,
+                source=source,
+                matches=str(len(matches)),
+                destination=destinations[0],
+            )
+        return [
+            (f"{directory}/{f}", d.format_map(KeepMissing(filename=f, stem=PurePosixPath(f).stem)))
+            for f in matches
+            for d in destinations
+        ]
+
     def model_post_init(self, __context: Any) -> None:
         """Method to ensure the scratchpad is set to ignore missing replacements."""
         self.scratchpad_ignore_missing = True
@@ -121,18 +235,92 @@ class Fetch(Task):
         super().__init__(spec, context)
         self.spec: FetchSpec
 
+    async def _list_release_directory(self, source: str, release_date: str) -> list["RemoteFile"]:
+        """List the directory of the source, falling back to the `latest` release like the transfers do."""
+        import aioftp
+
+        from gentroutils.io.listings import FTPListingCache
+        from gentroutils.io.path import FTPPath
+
+        listings = FTPListingCache(self.context.config.work_path / "listings")
+        directory = source.rsplit("/", 1)[0]
+        try:
+            return await listings.list(FTPPath(directory))
+        except aioftp.StatusCodeError as e:
+            logger.warning(f"Failed to list {directory}: {e}, listing the `latest` release instead.")
+            files = await listings.list(FTPPath(directory.replace(release_date, "latest")))
+            # The following tasks resolve the release directory to the same listing without a failed attempt.
+            listings.store(directory, files)
+            return files
+
+    def _previous_objects(self, release_info: GwasCatalogReleaseInfo, destinations: list[str]) -> dict[str, str]:
+        """Get the object of the previous release of every destination, an empty mapping when there is none."""
+        from google.api_core.exceptions import GoogleAPIError
+
+        from gentroutils.io.gcs import previous_release, release_prefix
+
+        prefix = release_prefix(self.spec.destination_template)
+        if prefix is None:
+            return {}
+        try:
+            previous_date = previous_release(self.spec.destination_template, release_info.strfmt("%Y%m%d"))
+        except GoogleAPIError as e:
+            logger.warning(f"Failed to look up the previous release under {prefix}: {e}")
+            return {}
+        if previous_date is None:
+            return {}
+        # The destinations only differ from the previous objects by their release directory, dated or `latest`.
+        return {d: f"{prefix}{previous_date}/{d.removeprefix(prefix).partition('/')[2]}" for d in destinations}
+
     @report
+    @traced
+    @profiled
     def run(self) -> Self:
         """Fetch the file from the remote to local."""
+        # The transfer stack (aioftp, polars, tqdm) is imported when the task runs, not when otter registers it.
+        from gentroutils.io.transfer import FTPtoGCPTransferableObject
+        from gentroutils.transfer import TransferManager
+
         logger.info(f"Fetching file from {self.spec.source_template}")
         release_info = GwasCatalogReleaseInfo.from_uri(self.spec.stats_uri)
         logger.info(f"Release information: {release_info}")
-        destinations = self.spec.substituted_destinations(release_info)
-        sources = self.spec.substituted_sources(release_info)
+        filenames = None
+        if self.spec.is_pattern:
+            source = self.spec.substituted_sources(release_info)[0]
+            with span("source expansion", source=source) as expansion_span:
+                listing = asyncio.run(self._list_release_directory(source, release_info.strfmt("%Y/%m/%d")))
+                filenames = [f.path for f in listing]
+                expansion_span.set(files=len(filenames))
+        transfers = self.spec.substituted_transfers(release_info, filenames)
+        logger.info(f"Transferring {len(transfers)} files: {transfers}")
+        self.artifacts = [Artifact(source=s, destination=d) for s, d in transfers]
+        artifacts = (
+            ArtifactCache(self.context.config.work_path / "artifacts", self.spec.artifact_cache_max_bytes)
+            if self.spec.artifact_cache_max_bytes
+            else None
+        )
+        downloads = (
+            DownloadCache(self.context.config.work_path / "downloads", self.spec.download_cache_max_bytes)
+            if self.spec.download_cache_max_bytes
+            else None
+        )
+        previous: dict[str, str] = {}
+        if self.spec.copy_unchanged:
+            with span("previous release lookup") as lookup_span:
+                previous = self._previous_objects(release_info, [d for _, d in transfers])
+                lookup_span.set(objects=len(previous))
         transferable_objects = [
-            FTPtoGCPTransferableObject(source=s, destination=d) for s, d in zip(sources, destinations, strict=True)
+            FTPtoGCPTransferableObject(
+                source=s, destination=d, artifacts=artifacts, downloads=downloads, previous=previous.get(d)
+            )
+            for s, d in transfers
         ]
         logger.info(f"Transferable objects: {transferable_objects}")
-        TransferManager().transfer(transferable_objects)
+        TransferManager(
+            max_concurrency=MAX_CONCURRENT_CONNECTIONS,
+            memory_budget=self.spec.memory_budget,
+            cpu_workers=self.spec.cpu_workers,
+            uploader=self.spec.uploader(),
+        ).transfer(transferable_objects)
         logger.success("File transferred successfully.")
         return self
@@ -0,0 +1,131 @@
+"""Module to mirror the GWAS Catalog summary statistics from the FTP server to GCS."""
+
+import asyncio
+from fnmatch import fnmatch
+from typing import Annotated, Self
+
+from loguru import logger
+from otter.manifest.model import Artifact
+from otter.task.model import Task, TaskContext
+from otter.task.task_reporter import report
+from pydantic import AfterValidator, Field
+
+from gentroutils.io.path import FTPPath, GCSPath
+from gentroutils.profiling import profiled, task_slug
+from gentroutils.tasks import TransferSpec
+from gentroutils.tracing import span, traced
+
+MAX_CONCURRENT_TRANSFERS = 16
+"""Default number of files transferred at the same time."""
+
+WALK_CONNECTIONS = 4
+"""Default number of FTP connections walking the source tree, kept low for the shared EBI server."""
+
+
+class MirrorSpec(TransferSpec):
+    """Configuration fields for the mirror task.
+
+    The task keeps the `destination` GCS prefix in sync with the `source` FTP directory. The source tree is walked
+    concurrently and diffed against the objects under the destination by size and modification time, only the
+    files that are new or changed since the previous run are transferred. Objects whose source file was removed
+    are kept.
+
+    The run is recorded in a manifest under `<work_path>/mirror/`, a run that failed halfway is resumed
+    from it without walking the source tree again.
+
+    Examples:
+    ---
+    >>> ms = MirrorSpec(
+    ...     name="mirror summary statistics",
+    ...     source="ftp://ftp.ebi.ac.uk/pub/databases/gwas/summary_statistics/",
+    ...     destination="gs://gwas_catalog_inputs/raw_summary_statistics",
+    ...     pattern="*.h.tsv.gz",
+    ... )
+    >>> ms.source
+    'ftp://ftp.ebi.ac.uk/pub/databases/gwas/summary_statistics'
+    >>> ms.destination
+    'gs://gwas_catalog_inputs/raw_summary_statistics'
+    >>> ms.destination_uri("GCST1-GCST1000/GCST1/GCST1.h.tsv.gz")
+    'gs://gwas_catalog_inputs/raw_summary_statistics/GCST1-GCST1000/GCST1/GCST1.h.tsv.gz'
+    """
+
+    name: str = "mirror summary statistics"
+    """The name of the task."""
+
+    source: Annotated[str, AfterValidator(lambda x: str(FTPPath(x.rstrip("/"))))]
+    """The FTP directory to mirror."""
+
+    destination: Annotated[str, AfterValidator(lambda x: str(GCSPath(x.rstrip("/"))))]
+    """The GCS prefix the files are mirrored to, under their path relative to the `source`."""
+
+    pattern: str = "*"
+    """The `fnmatch` pattern the relative path of the mirrored files match, `*` also matches the `/` separators."""
+
+    max_concurrency: int = Field(default=MAX_CONCURRENT_TRANSFERS, gt=0)
+    """The number of files transferred at the same time."""
+
+    walk_connections: int = Field(default=WALK_CONNECTIONS, gt=0)
+    """The number of FTP connections listing the directories of the source tree at the same time."""
+
+    def source_uri(self, path: str) -> str:
+        """Get the uri of the source file at the relative path."""
+        return f"{self.source}/{path}"
+
+    def destination_uri(self, path: str) -> str:
+        """Get the uri the source file at the relative path is mirrored to."""
+        return f"{self.destination}/{path}"
+
+
+class Mirror(Task):
+    """Task to mirror an FTP directory tree to a GCS prefix incrementally."""
+
+    def __init__(self, spec: MirrorSpec, context: TaskContext) -> None:
+        super().__init__(spec, context)
+        self.spec: MirrorSpec
+
+    @report
+    @traced
+    @profiled
+    def run(self) -> Self:
+        """Transfer the new and changed files of the source tree to the destination."""
+        # The transfer stack (aioftp, polars, tqdm) is imported when the task runs, not when otter registers it.
+        from gentroutils.io.mirror import MirrorManifest, list_mirror, plan_mirror, walk_ftp
+        from gentroutils.io.transfer import MirrorTransferableObject
+        from gentroutils.transfer import TransferManager
+
+        self.artifacts = [Artifact(source=self.spec.source, destination=self.spec.destination)]
+        manifest = MirrorManifest(
+            self.context.config.work_path / "mirror" / f"{task_slug(self.spec.name)}.jsonl",
+            self.spec.source,
+            self.spec.destination,
+        )
+        pending = manifest.resume()
+        if pending is None:
+            with span("ftp walk", source=self.spec.source) as walk_span:
+                files = asyncio.run(walk_ftp(FTPPath(self.spec.source), self.spec.walk_connections))
+                files = [f for f in files if fnmatch(f.path, self.spec.pattern)]
+                walk_span.set(files=len(files))
+            with span("gcs listing", destination=self.spec.destination) as listing_span:
+                mirrored = list_mirror(GCSPath(self.spec.destination))
+                listing_span.set(objects=len(mirrored))
+            pending = plan_mirror(files, mirrored)
+            logger.info(f"{len(pending)} of {len(files)} files are new or changed since the last mirror run.")
+            manifest.start(pending)
+
+        if pending:
+            TransferManager(
+                max_concurrency=self.spec.max_concurrency,
+                memory_budget=self.spec.memory_budget,
+                cpu_workers=self.spec.cpu_workers,
+            ).transfer([
+                MirrorTransferableObject(
+                    source=self.spec.source_uri(f.path),
+                    destination=self.spec.destination_uri(f.path),
+                    file=f,
+                    manifest=manifest,
+                )
+                for f in pending
+            ])
+        manifest.complete()
+        logger.success(f"Mirrored {len(pending)} files to {self.spec.destination}.")
+        return self
@@ -0,0 +1,166 @@
+"""Module to handle the partitioning of the GWAS Catalog associations release file."""
+
+from __future__ import annotations
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated, Any, Self
+
+from loguru import logger
+from otter.manifest.model import Artifact
+from otter.storage import get_remote_storage
+from otter.task.model import Task, TaskContext
+from otter.task.task_reporter import report
+from pydantic import AfterValidator, Field
+
+from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.io.gcs import gcs_client
+from gentroutils.io.path import GCSPath
+from gentroutils.profiling import profiled
+from gentroutils.tasks import GwasCatalogReleaseInfo, ProfiledSpec, TemplateDestination, destination_validator
+from gentroutils.tracing import span, traced
+
+MAX_CONCURRENT_UPLOADS = 16
+
+
+class PartitionSpec(ProfiledSpec):
+    """Configuration fields for the associations partition task.
+
+    The task reads the associations file uploaded by the `fetch associations` task and writes it back as a
+    hive partitioned Parquet dataset under the `destination_template`, partitioned by the `chromosome` and
+    the `studyBucket` (see `gentroutils.parsers.associations.study_bucket`).
+
+    Examples:
+    ---
+    >>> ps = PartitionSpec(
+    ...     name="partition associations",
+    ...     source_template="gs://gwas_catalog_inputs/gentroutils/{release_date}/gwas_catalog_associations_ontology_annotated.tsv",
+    ...     destination_template="gs://gwas_catalog_inputs/gentroutils/{release_date}/gwas_catalog_associations",
+    ...     promote=True,
+    ... )
+    >>> ps.study_buckets
+    64
+    >>> [d.destination for d in ps.destinations()]
+    ['gs://gwas_catalog_inputs/gentroutils/{release_date}/gwas_catalog_associations', 'gs://gwas_catalog_inputs/gentroutils/latest/gwas_catalog_associations']
+    """
+
+    name: str = "partition associations"
+    """The name of the task."""
+
+    stats_uri: str = "https://www.ebi.ac.uk/gwas/api/search/stats"
+    """The URI to crawl the release statistics information from."""
+
+    source_template: Annotated[str, AfterValidator(destination_validator)]
+    """The template URI of the fetched associations TSV file."""
+
+    destination_template: Annotated[str, AfterValidator(destination_validator)]
+    """The template URI of the directory holding the partitioned Parquet dataset."""
+
+    # The defaults follow `gentroutils.parsers.associations`, which is not imported here to keep polars out of
+    # the task registration.
+    study_buckets: int = Field(default=64, gt=0)
+    """The number of study id buckets."""
+
+    row_group_size: int = Field(default=100_000, gt=0)
+    """The number of rows in each Parquet row group."""
+
+    promote: bool = False
+    """Whether to also upload the dataset to the destination with the `latest` release date."""
+
+    def destinations(self) -> list[TemplateDestination]:
+        """Get the list of destinations templates where the dataset will be saved.
+
+        Returns:
+            list[TemplateDestination]: A list of TemplateDestination objects with the formatted destination paths.
+        """
+        d1 = TemplateDestination(self.destination_template, False)
+        if self.promote:
+            d2 = d1.format({"release_date": "latest"})
+            return [d1, d2]
+        return [d1]
+
+    def substituted_destinations(self, release_info: GwasCatalogReleaseInfo) -> list[str]:
+        """Safely parse the destination name to ensure it is valid."""
+        substitutions = {"release_date": release_info.strfmt("%Y%m%d")}
+        return [
+            d.format(substitutions).destination if not d.is_substituted else d.destination for d in self.destinations()
+        ]
+
+    def substituted_source(self, release_info: GwasCatalogReleaseInfo) -> str:
+        """Get the source path of the associations fetched for the release."""
+        return self.source_template.format(release_date=release_info.strfmt("%Y%m%d"))
+
+    def model_post_init(self, __context: Any) -> None:
+        """Method to ensure the scratchpad is set to ignore missing replacements."""
+        self.scratchpad_ignore_missing = True
+
+
+class Partition(Task):
+    """Task to partition the GWAS Catalog associations into a hive partitioned Parquet dataset."""
+
+    def __init__(self, spec: PartitionSpec, context: TaskContext) -> None:
+        super().__init__(spec, context)
+        self.spec: PartitionSpec
+
+    def _local_source(self, source: str, work_dir: Path) -> Path:
+        """Get the local copy of the source, downloading it when it was not fetched earlier in the run."""
+        if not source.startswith("gs://"):
+            return Path(source)
+        gcs_path = GCSPath(source)
+        blob = gcs_client().bucket(gcs_path.bucket).get_blob(gcs_path.object)
+        if blob is None:
+            raise GentroutilsError(GentroutilsErrorMessage.SOURCE_NOT_FOUND, path=source)
+        artifacts = ArtifactCache(self.context.config.work_path / "artifacts")
+        local_copy = artifacts.lookup(source, blob.generation)
+        if local_copy is not None:
+            logger.info(f"Reading {source} from the local copy {local_copy}.")
+            return local_copy
+        local_path = work_dir / Path(gcs_path.object).name
+        logger.info(f"Downloading {source} to {local_path}.")
+        with span("download", source=source, bytes=blob.size):
+            blob.download_to_filename(local_path)
+        return local_path
+
+    @staticmethod
+    def _upload(dataset: Path, destination: str) -> None:
+        """Upload all files of the dataset under the destination directory."""
+        remote = get_remote_storage(destination)
+        files = sorted(p for p in dataset.rglob("*") if p.is_file())
+        logger.info(f"Uploading {len(files)} files to {destination}.")
+        with (
+            span("gcs upload", destination=destination, files=len(files), bytes=sum(f.stat().st_size for f in files)),
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_UPLOADS) as executor,
+        ):
+            uploads = [
+                executor.submit(remote.upload, f, f"{destination.rstrip('/')}/{f.relative_to(dataset).as_posix()}")
+                for f in files
+            ]
+            for upload in uploads:
+                upload.result()
+
+    @report
+    @traced
+    @profiled
+    def run(self) -> Self:
+        """Partition the associations and upload the dataset."""
+        from gentroutils.parsers.associations import partition_associations
+
+        release_info = GwasCatalogReleaseInfo.from_uri(self.spec.stats_uri)
+        logger.info(f"Release information: {release_info}")
+        work_dir = self.context.config.work_path / "partition" / release_info.strfmt("%Y%m%d")
+        work_dir.mkdir(parents=True, exist_ok=True)
+        self.artifacts = [
+            Artifact(source=self.spec.substituted_source(release_info), destination=d)
+            for d in self.spec.substituted_destinations(release_info)
+        ]
+        source = self._local_source(self.spec.substituted_source(release_info), work_dir)
+        dataset = work_dir / "associations"
+        shutil.rmtree(dataset, ignore_errors=True)
+        with span("partition", source=source.as_posix()):
+            partition_associations(source, dataset, self.spec.study_buckets, self.spec.row_group_size)
+        for destination in self.spec.substituted_destinations(release_info):
+            self._upload(dataset, destination)
+        logger.success("Associations partitioned successfully.")
+        return self
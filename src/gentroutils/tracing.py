@@ -0,0 +1,195 @@
+"""Lightweight tracing of the task phases in the Chrome trace event format."""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, TypeVar
+
+from loguru import logger
+
+from gentroutils.profiling import task_slug
+
+T = TypeVar("T")
+
+_current_span: ContextVar[Span | None] = ContextVar("gentroutils_span", default=None)
+
+
+class Span:
+    """A timed phase of a task, with the attributes (such as byte counts) recorded while it runs."""
+
+    __slots__ = ("args", "end", "lane", "name", "start", "tracer")
+
+    def __init__(self, tracer: Tracer | None, name: str, lane: int, args: dict[str, Any]) -> None:
+        """Start the span.
+
+        Args:
+            tracer (Tracer | None): The tracer recording the span, the span is not recorded when None.
+            name (str): The name of the phase.
+            lane (int): The lane (trace viewer track) of the span.
+            args (dict[str, Any]): The attributes of the span.
+        """
+        self.tracer = tracer
+        self.name = name
+        self.lane = lane
+        self.args = args
+        self.start = time.perf_counter_ns()
+        self.end: int | None = None
+
+    def set(self, **args: Any) -> None:
+        """Set the attributes of the span, for example `span.set(bytes=size)`."""
+        self.args.update(args)
+
+    def add(self, key: str, value: int) -> None:
+        """Add the value to a counter attribute of the span, for example the bytes of every downloaded block."""
+        self.args[key] = self.args.get(key, 0) + value
+
+
+class Tracer:
+    """Collect the spans of a task run and write them as a Chrome trace (`chrome://tracing`, Perfetto, speedscope).
+
+    Spans started while another span is open are its children. Concurrent work, such as the transfers of a batch,
+    opens its spans on a `lane` of its own, so the phases of every file are shown on a separate track.
+
+    Examples:
+    ---
+    >>> tracer = Tracer("fetch")
+    >>> with tracer.activate(), span("release lookup") as s:
+    ...     s.set(bytes=512)
+    >>> [(e["name"], e["args"]) for e in tracer.events() if e["ph"] == "X"]
+    [('release lookup', {'bytes': 512})]
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the tracer.
+
+        Args:
+            name (str): The name of the traced process, shown by the trace viewers.
+        """
+        self.name = name
+        self.spans: list[Span] = []
+        self.lanes: dict[int, str] = {0: name}
+        self._lane_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    @contextmanager
+    def activate(self) -> Generator[Tracer]:
+        """Record the spans started in the context (and the tasks and threads it spawns) with this tracer."""
+        root = Span(self, self.name, 0, {})
+        token = _current_span.set(root)
+        try:
+            yield self
+        finally:
+            _current_span.reset(token)
+
+    def new_lane(self, name: str) -> int:
+        """Allocate a new lane."""
+        with self._lock:
+            lane = next(self._lane_ids)
+            self.lanes[lane] = name
+        return lane
+
+    def record(self, span: Span) -> None:
+        """Record the finished span."""
+        with self._lock:
+            self.spans.append(span)
+
+    def events(self) -> list[dict[str, Any]]:
+        """Get the recorded spans as Chrome trace events."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.name}},
+            *(
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": lane, "args": {"name": name}}
+                for lane, name in self.lanes.items()
+            ),
+        ]
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        for s in spans:
+            end = s.end if s.end is not None else s.start
+            events.append({
+                "name": s.name,
+                "cat": "gentroutils",
+                "ph": "X",
+                "ts": (s.start - self._origin) / 1000,
+                "dur": (end - s.start) / 1000,
+                "pid": pid,
+                "tid": s.lane,
+                "args": s.args,
+            })
+        return events
+
+    def write(self, path: Path) -> Path:
+        """Write the trace to the JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": self.events(), "displayTimeUnit": "ms"}, default=str))
+        return path
+
+
+@contextmanager
+def span(name: str, lane: str | None = None, **args: Any) -> Generator[Span]:
+    """Time the phase run inside the context as a child of the current span.
+
+    Outside of an active tracer the span is not recorded, so the instrumented code runs the same
+    with or without tracing.
+
+    Args:
+        name (str): The name of the phase.
+        lane (str | None): Open the span on a new lane with this name, the span inherits the lane of its parent when None.
+        **args (Any): The attributes of the span.
+
+    Yields:
+        Span: The span, to set the attributes known once the phase ran.
+
+    Raises:
+        BaseException: The error raised inside the context, once recorded on the span.
+    """
+    parent = _current_span.get()
+    if parent is None or parent.tracer is None:
+        yield Span(None, name, 0, args)
+        return
+    tracer = parent.tracer
+    current = Span(tracer, name, tracer.new_lane(lane) if lane else parent.lane, args)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.set(error=repr(e))
+        raise
+    finally:
+        current.end = time.perf_counter_ns()
+        _current_span.reset(token)
+        tracer.record(current)
+
+
+def traced(run: Callable[..., T]) -> Callable[..., T]:  # noqa: UP047
+    """Trace the `run` method of a task, with the run itself as the root span.
+
+    The trace is written to `<work_path>/traces/<task name>.json`, also when the run failed.
+    The decorator goes below `@report`, so a failed run is still traced and reported.
+    """
+
+    @functools.wraps(run)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        tracer = Tracer(self.spec.name)
+        try:
+            with tracer.activate(), span(self.spec.name, task=type(self).__name__):
+                return run(self, *args, **kwargs)
+        finally:
+            path = tracer.write(Path(self.context.config.work_path) / "traces" / f"{task_slug(self.spec.name)}.json")
+            logger.info(f"Trace written to {path}.")
+
+    return wrapper
+
+
+__all__ = ["Span", "Tracer", "span", "traced"]
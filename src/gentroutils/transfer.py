@@ -2,14 +2,26 @@
 
 import asyncio
 from collections.abc import Sequence
-from typing import cast
+from typing import Any, TypeVar, cast
 
 import tqdm
 from loguru import logger
 
 from gentroutils.errors import GentroutilsError, GentroutilsErrorMessage
-from gentroutils.io.transfer import FTPtoGCPTransferableObject, PolarsDataFrameToGCSTransferableObject
+from gentroutils.io.gcs import GCS_CLIENTS, CompositeUploader
+from gentroutils.io.transfer import (
+    FTPtoGCPTransferableObject,
+    MemoryBudget,
+    PolarsDataFrameToGCSTransferableObject,
+    StreamTransferableObject,
+)
 from gentroutils.io.transfer.model import TransferableObject
+from gentroutils.io.workers import DEFAULT_CPU_WORKERS, WorkerPool
+
+T = TypeVar("T", bound=TransferableObject)
+
+DEFAULT_MAX_CONCURRENCY = 10
+"""Default number of objects transferred at the same time."""
 
 
 class TransferManager:
@@ -20,11 +32,62 @@ class TransferManager:
 
         - FTP to Google Cloud Storage (GCP) transfers using `FTPtoGCPTransferableObject`.
         - Polars DataFrame to GCS transfers using `PolarsDataFrameToGCSTransferableObject`.
+        - Streaming between any pair of the supported uris using `StreamTransferableObject`, and its
+          `MirrorTransferableObject` subclass mirroring FTP trees to GCS.
+
+    At most `max_concurrency` objects are transferred at the same time. The objects are uploaded by the `uploader`
+    shared by the batch, which uploads the large objects in parts, at most `uploader.parallelism` parts at a time
+    across the whole batch. The connection pool of the shared GCS client holds `max_concurrency` plus
+    `uploader.parallelism` connections, so every transfer and every part uploaded at the same time gets a
+    connection of its own.
 
+    With a `memory_budget`, the transfers of a batch share a `MemoryBudget` of that many bytes. Each transfer
+    reserves its buffers against it and waits while the budget is exhausted, the highest number of bytes held
+    at the same time is logged and kept in the `budget` once the batch completes.
+
+    The CPU-bound stages of the transfers (unzipping, serialization) run on a `WorkerPool` of `cpu_workers`
+    threads shared by the batch, so the event loop keeps serving the network of the other transfers.
     """
 
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        memory_budget: int | None = None,
+        cpu_workers: int = DEFAULT_CPU_WORKERS,
+        uploader: CompositeUploader | None = None,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            max_concurrency (int): Maximum number of objects transferred at the same time.
+            memory_budget (int | None): Maximum number of bytes the transfers of a batch hold in memory, unbounded when None.
+            cpu_workers (int): Number of threads running the CPU-bound stages of the transfers of a batch.
+            uploader (CompositeUploader | None): The engine uploading the objects to GCS, the default engine when None.
+        """
+        self.max_concurrency = max_concurrency
+        self.memory_budget = memory_budget
+        self.cpu_workers = cpu_workers
+        self.uploader = uploader or CompositeUploader()
+        self.budget: MemoryBudget | None = None
+        """The budget of the last transferred batch."""
+
     @staticmethod
-    async def transfer_ftp_to_gcp(transferable_objects: Sequence[FTPtoGCPTransferableObject]) -> None:
+    async def _bounded(transferable_objects: Sequence[TransferableObject], max_concurrency: int, desc: str) -> None:
+        """Run the transfers concurrently, with at most `max_concurrency` of them in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def transfer(transferable_object: TransferableObject) -> None:
+            async with semaphore:
+                await transferable_object.transfer()
+
+        transfer_tasks = [asyncio.create_task(transfer(x)) for x in transferable_objects]
+        for f in tqdm.tqdm(asyncio.as_completed(transfer_tasks), total=len(transfer_tasks), desc=desc):
+            await f
+
+    @staticmethod
+    async def transfer_ftp_to_gcp(
+        transferable_objects: Sequence[FTPtoGCPTransferableObject], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> None:
         """Update GWAS Catalog metadata directly to cloud bucket.
 
         This method transfers files from FTP to Google Cloud Storage (GCS) using the provided
@@ -34,16 +97,18 @@ class TransferManager:
 
         Args:
             transferable_objects (Sequence[FTPtoGCPTransferableObject]): A sequence of FTPtoGCPTransferableObject instances.
+            max_concurrency (int): Maximum number of objects transferred at the same time.
 
         """
         # we always want to have the logs from this command uploaded to the target bucket
-        transfer_tasks = [asyncio.create_task(x.transfer()) for x in transferable_objects]
-        for f in tqdm.tqdm(asyncio.as_completed(transfer_tasks), total=len(transfer_tasks), desc="Downloading"):
-            await f
+        await TransferManager._bounded(transferable_objects, max_concurrency, "Downloading")
         logger.info("gwas_curation_update step completed.")
 
     @staticmethod
-    async def transfer_polars_to_gcs(transferable_objects: Sequence[PolarsDataFrameToGCSTransferableObject]) -> None:
+    async def transfer_polars_to_gcs(
+        transferable_objects: Sequence[PolarsDataFrameToGCSTransferableObject],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
         """Transfer Polars DataFrames to Google Cloud Storage.
 
         This method transfers Polars DataFrames to GCS using the provided
@@ -51,13 +116,34 @@ class TransferManager:
 
         Args:
             transferable_objects (Sequence[PolarsDataFrameToGCSTransferableObject]): A sequence of PolarsDataFrameToGCSTransferableObject instances.
+            max_concurrency (int): Maximum number of objects transferred at the same time.
 
         """
-        transfer_tasks = [asyncio.create_task(x.transfer()) for x in transferable_objects]
-        for f in tqdm.tqdm(asyncio.as_completed(transfer_tasks), total=len(transfer_tasks), desc="Uploading"):
-            await f
+        await TransferManager._bounded(transferable_objects, max_concurrency, "Uploading")
         logger.info("Polars DataFrame transfer to GCS completed.")
 
+    @staticmethod
+    async def transfer_streams(
+        transferable_objects: Sequence[StreamTransferableObject], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> None:
+        """Stream the sources to the destinations concurrently.
+
+        Args:
+            transferable_objects (Sequence[StreamTransferableObject]): A sequence of StreamTransferableObject instances.
+            max_concurrency (int): Maximum number of objects transferred at the same time.
+
+        """
+        await TransferManager._bounded(transferable_objects, max_concurrency, "Streaming")
+        logger.info("Stream transfers completed.")
+
+    @staticmethod
+    def _join_batch(transferable_object: T, batch: dict[str, Any]) -> T:
+        """Get a copy of the object sharing the resources of the batch it does not set itself."""
+        if not isinstance(transferable_object, TransferableObject):
+            return transferable_object
+        update = {k: v for k, v in batch.items() if getattr(transferable_object, k, None) is None}
+        return transferable_object.model_copy(update=update) if update else transferable_object
+
     def transfer(self, transferable_objects: Sequence[TransferableObject]) -> None:
         """Transfer method that handles different types of transferable objects.
 
@@ -71,11 +157,26 @@ class TransferManager:
         """
         if not transferable_objects:
             raise GentroutilsError(GentroutilsErrorMessage.EMPTY_TRANSFERABLE_OBJECTS)
-        elif all(isinstance(c, FTPtoGCPTransferableObject) for c in transferable_objects):
-            ftp_objects = cast(Sequence[FTPtoGCPTransferableObject], transferable_objects)
-            asyncio.run(self.transfer_ftp_to_gcp(ftp_objects))
-        elif all(isinstance(c, PolarsDataFrameToGCSTransferableObject) for c in transferable_objects):
-            polars_objects = cast(Sequence[PolarsDataFrameToGCSTransferableObject], transferable_objects)
-            asyncio.run(self.transfer_polars_to_gcs(polars_objects))
-        else:
-            raise GentroutilsError(GentroutilsErrorMessage.INVALID_TRANSFERABLE_OBJECTS)
+        GCS_CLIENTS.resize(self.max_concurrency + self.uploader.parallelism)
+        with WorkerPool(self.cpu_workers) as workers:
+            batch: dict[str, Any] = {"workers": workers, "uploader": self.uploader}
+            if self.memory_budget is not None:
+                self.budget = MemoryBudget(self.memory_budget)
+                batch["budget"] = self.budget
+            transferable_objects = [self._join_batch(x, batch) for x in transferable_objects]
+            if all(isinstance(c, FTPtoGCPTransferableObject) for c in transferable_objects):
+                ftp_objects = cast(Sequence[FTPtoGCPTransferableObject], transferable_objects)
+                asyncio.run(self.transfer_ftp_to_gcp(ftp_objects, self.max_concurrency))
+            elif all(isinstance(c, PolarsDataFrameToGCSTransferableObject) for c in transferable_objects):
+                polars_objects = cast(Sequence[PolarsDataFrameToGCSTransferableObject], transferable_objects)
+                asyncio.run(self.transfer_polars_to_gcs(polars_objects, self.max_concurrency))
+            elif all(isinstance(c, StreamTransferableObject) for c in transferable_objects):
+                stream_objects = cast(Sequence[StreamTransferableObject], transferable_objects)
+                asyncio.run(self.transfer_streams(stream_objects, self.max_concurrency))
+            else:
+                raise GentroutilsError(GentroutilsErrorMessage.INVALID_TRANSFERABLE_OBJECTS)
+        if self.budget is not None:
+            logger.info(
+                f"Memory budget high-water mark: {self.budget.high_water_mark} of {self.budget.limit} bytes "
+                f"({self.budget.high_water_mark / self.budget.limit:.0%})."
+            )
@@ -0,0 +1,15 @@
+"""Fixtures shared by all tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from gentroutils.io.gcs import GCS_CLIENTS
+
+
+@pytest.fixture(autouse=True)
+def gcs_clients() -> Iterator[None]:
+    """Drop the shared storage clients, so every test sees the `google.cloud.storage.Client` it patched."""
+    GCS_CLIENTS.clear()
+    yield
+    GCS_CLIENTS.clear()
@@ -0,0 +1,31 @@
+"""Fixtures for the io tests."""
+
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pyftpdlib.authorizers import DummyAuthorizer
+from pyftpdlib.handlers import FTPHandler
+from pyftpdlib.servers import FTPServer
+
+
+@pytest.fixture
+def ftp_server(tmp_path: Path) -> Iterator[tuple[str, Path]]:
+    """Anonymous FTP server serving the temporary directory.
+
+    Yields:
+        tuple[str, Path]: The `host:port` of the server and the served directory.
+    """
+    root = tmp_path / "ftp"
+    root.mkdir()
+    authorizer = DummyAuthorizer()
+    authorizer.add_anonymous(str(root), perm="elradfmwMT")
+    handler = type("Handler", (FTPHandler,), {"authorizer": authorizer})
+    server = FTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"timeout": 0.1}, daemon=True)
+    thread.start()
+    host, port = server.socket.getsockname()[:2]
+    yield f"{host}:{port}", root
+    server.close_all()
+    thread.join(timeout=5)
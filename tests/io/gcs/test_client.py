@@ -0,0 +1,81 @@
+"""Test the shared storage clients."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gentroutils.io.gcs import GCS_CLIENTS, GCSClientRegistry, gcs_client
+
+
+@pytest.fixture
+def storage_client():
+    """Patched storage client with a session per instance."""
+    with patch("google.cloud.storage.Client", side_effect=lambda project=None: MagicMock(project=project)) as client:
+        yield client
+
+
+def pool_size(client: MagicMock) -> int:
+    """The pool size of the adapter mounted last on the authorized session of the client."""
+    adapter = client._http.mount.call_args.args[1]
+    return adapter._pool_maxsize
+
+
+class TestGCSClientRegistry:
+    def test_client_shared(self, storage_client):
+        registry = GCSClientRegistry()
+        assert registry.client() is registry.client()
+        assert registry.client("project") is not registry.client()
+        assert storage_client.call_count == 2
+
+    def test_client_thread_safe(self, storage_client):
+        registry = GCSClientRegistry()
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def get():
+            barrier.wait()
+            clients.append(registry.client())
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(c) for c in clients}) == 1
+        storage_client.assert_called_once()
+
+    def test_pool_size(self, storage_client):
+        client = GCSClientRegistry(pool_size=32).client()
+        assert pool_size(client) == 32
+        mounted = [c.args[0] for c in client._http.mount.call_args_list]
+        assert mounted == ["https://", "http://"]
+        # The session refreshing the credentials gets a pool of the same size
+        client._http._auth_request.session.mount.assert_called()
+
+    def test_resize(self, storage_client):
+        registry = GCSClientRegistry(pool_size=10)
+        client = registry.client()
+        registry.resize(64)
+        assert pool_size(client) == 64
+        assert pool_size(registry.client("project")) == 64
+
+    def test_resize_never_shrinks(self, storage_client):
+        registry = GCSClientRegistry(pool_size=64)
+        client = registry.client()
+        client._http.mount.reset_mock()
+        registry.resize(8)
+        assert registry.pool_size == 64
+        client._http.mount.assert_not_called()
+
+    def test_clear(self, storage_client):
+        registry = GCSClientRegistry()
+        client = registry.client()
+        registry.clear()
+        assert registry.client() is not client
+
+
+def test_gcs_client(storage_client):
+    assert gcs_client() is gcs_client(pool_size=1)
+    gcs_client(pool_size=GCS_CLIENTS.pool_size + 1)
+    assert pool_size(gcs_client()) == GCS_CLIENTS.pool_size
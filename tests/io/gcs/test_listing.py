@@ -0,0 +1,120 @@
+"""Test GCS glob listing."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from gentroutils.errors import GentroutilsError
+from gentroutils.io.gcs.listing import GCSGlob, GCSGlobLister, ListingShard
+
+
+class FakeBlobIterator:
+    """Minimal stand-in for the `google.api_core.page_iterator.HTTPIterator`."""
+
+    def __init__(self, names: list[str], prefixes: set[str] | None = None, page_size: int = 2):
+        self.names = names
+        self.prefixes: set[str] = set()
+        self._prefixes = prefixes or set()
+        self.page_size = page_size
+
+    @property
+    def pages(self):
+        """Blobs in pages, the prefixes are exposed once the listing is consumed."""
+        for i in range(0, len(self.names), self.page_size):
+            yield SimpleNamespace(raw_page={"items": [{"name": n} for n in self.names[i : i + self.page_size]]})
+        self.prefixes = self._prefixes
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """Storage client listing two shards of summary statistics."""
+    objects = {
+        "raw/GCST1-GCST2/": ["raw/GCST1-GCST2/GCST1/GCST1.h.tsv.gz", "raw/GCST1-GCST2/GCST2/GCST2.h.tsv.gz"],
+        "raw/GCST3-GCST4/": ["raw/GCST3-GCST4/GCST3/GCST3.h.tsv.gz"],
+    }
+
+    def list_blobs(bucket, prefix=None, delimiter=None, match_glob=None, fields=None, start_offset=None):
+        if fields == "prefixes,nextPageToken":
+            return FakeBlobIterator([], prefixes=set(objects))
+        if delimiter == "/":
+            return FakeBlobIterator([])
+        return FakeBlobIterator([n for n in objects[prefix] if start_offset is None or n >= start_offset])
+
+    mock = MagicMock()
+    mock.list_blobs.side_effect = list_blobs
+    return mock
+
+
+class TestGCSGlob:
+    """Tests for the GCSGlob."""
+
+    @pytest.mark.parametrize(
+        ("uri", "prefix", "is_recursive", "matches_shallow"),
+        [
+            pytest.param("gs://b/raw/**.h.tsv.gz", "raw/", True, True, id="double_star"),
+            pytest.param("gs://b/raw/*.h.tsv.gz", "raw/", False, True, id="single_star"),
+            pytest.param("gs://b/raw/GCST*/*.h.tsv.gz", "raw/GCST", True, False, id="nested"),
+            pytest.param("gs://b/raw/file.tsv", "raw/file.tsv", False, True, id="literal"),
+            pytest.param("gs://b/raw/GCST?????/*.h.tsv.gz", "raw/GCST", True, False, id="question_mark"),
+            pytest.param("gs://b/raw/GCST[0-9]*.h.tsv.gz", "raw/GCST", False, True, id="character_class"),
+        ],
+    )
+    def test_prefix(self, uri: str, prefix: str, is_recursive: bool, matches_shallow: bool) -> None:
+        """Test the literal prefix extraction."""
+        glob = GCSGlob.from_uri(uri)
+        assert glob.prefix == prefix
+        assert glob.is_recursive is is_recursive
+        assert glob.matches_shallow is matches_shallow
+        assert str(glob) == uri
+
+    def test_invalid_uri(self) -> None:
+        """Test that only gs uris are accepted."""
+        with pytest.raises(GentroutilsError, match="Unsupported URL scheme"):
+            GCSGlob.from_uri("s3://bucket/raw/**.h.tsv.gz")
+
+
+class TestGCSGlobLister:
+    """Tests for the GCSGlobLister."""
+
+    def test_shards(self, client: MagicMock) -> None:
+        """Test that a recursive glob is split into a shallow root shard and discovered sub prefixes."""
+        lister = GCSGlobLister(["gs://b/raw/**.h.tsv.gz"], client=client)
+        glob = GCSGlob("b", "raw/**.h.tsv.gz")
+        assert lister.shards() == [
+            ListingShard(glob, "raw/", shallow=True),
+            ListingShard(glob, "raw/GCST1-GCST2/"),
+            ListingShard(glob, "raw/GCST3-GCST4/"),
+        ]
+
+    def test_shards_non_recursive(self, client: MagicMock) -> None:
+        """Test that a non recursive glob does not discover sub prefixes."""
+        lister = GCSGlobLister(["gs://b/raw/*.h.tsv.gz", "gs://b/raw/*.h.tsv.gz"], client=client)
+        assert lister.shards() == [ListingShard(GCSGlob("b", "raw/*.h.tsv.gz"), "raw/")]
+        client.list_blobs.assert_not_called()
+
+    def test_map_pages(self, client: MagicMock) -> None:
+        """Test that all pages of all shards are converted."""
+        lister = GCSGlobLister(["gs://b/raw/**.h.tsv.gz"], client=client)
+        pages = list(lister.map_pages(lambda glob, items: [f"{glob.bucket}:{item['name']}" for item in items]))
+        assert sorted(path for page in pages for path in page) == [
+            "b:raw/GCST1-GCST2/GCST1/GCST1.h.tsv.gz",
+            "b:raw/GCST1-GCST2/GCST2/GCST2.h.tsv.gz",
+            "b:raw/GCST3-GCST4/GCST3/GCST3.h.tsv.gz",
+        ]
+        for call in client.list_blobs.call_args_list:
+            if call.kwargs["fields"] != "prefixes,nextPageToken":
+                assert call.kwargs["match_glob"] == "raw/**.h.tsv.gz"
+                assert call.kwargs["fields"] == "items(name,size,generation,updated),nextPageToken"
+
+    def test_map_pages_start_offset(self, client: MagicMock) -> None:
+        """Test that each shard is listed from the offset given for it."""
+        lister = GCSGlobLister(["gs://b/raw/**.h.tsv.gz"], client=client)
+        offsets = {"raw/GCST1-GCST2/": "raw/GCST1-GCST2/GCST2/GCST2.h.tsv.gz"}
+        pages = list(
+            lister.map_pages(lambda _, items: [item["name"] for item in items], lambda s: offsets.get(s.prefix))
+        )
+        assert sorted(name for page in pages for name in page) == [
+            "raw/GCST1-GCST2/GCST2/GCST2.h.tsv.gz",
+            "raw/GCST3-GCST4/GCST3/GCST3.h.tsv.gz",
+        ]
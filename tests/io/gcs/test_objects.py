@@ -0,0 +1,59 @@
+"""Test the GCS object metadata lookups and copies."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gentroutils.io.gcs.objects import copy_object, object_metadata, read_object, set_object_metadata, write_object
+
+
+@pytest.fixture
+def mock_bucket():
+    """Bucket of the patched storage client."""
+    with patch("gentroutils.io.gcs.objects.gcs_client") as client:
+        yield client.return_value.bucket.return_value
+
+
+def test_object_metadata(mock_bucket):
+    """Test that the custom metadata is read with a single request, None when the object is missing."""
+    mock_bucket.get_blob.return_value.metadata = {"key": "value"}
+    assert object_metadata("gs://bucket/20250101/curation.tsv") == {"key": "value"}
+    mock_bucket.get_blob.assert_called_once_with("20250101/curation.tsv")
+
+    mock_bucket.get_blob.return_value = None
+    assert object_metadata("gs://bucket/20250101/curation.tsv") is None
+
+
+@patch("gentroutils.io.path.gcs.GCSPath.blob")
+def test_set_object_metadata(mock_blob):
+    """Test that the metadata is patched onto the object."""
+    set_object_metadata("gs://bucket/curation.tsv", {"key": "value"})
+    assert mock_blob.return_value.metadata == {"key": "value"}
+    mock_blob.return_value.patch.assert_called_once_with()
+
+
+@patch("gentroutils.io.path.gcs.GCSPath.blob")
+def test_copy_object(mock_blob, mock_bucket):
+    """Test that the object is rewritten until the copy completes."""
+    source = mock_bucket.get_blob.return_value
+    destination: MagicMock = mock_blob.return_value
+    destination.rewrite.side_effect = [("token", 1, 2), (None, 2, 2)]
+
+    copy_object("gs://bucket/20250101/curation.tsv", "gs://bucket/20250201/curation.tsv")
+
+    assert [c.args for c in destination.rewrite.call_args_list] == [(source,), (source,)]
+    assert [c.kwargs for c in destination.rewrite.call_args_list] == [{}, {"token": "token"}]
+
+    mock_bucket.get_blob.return_value = None
+    with pytest.raises(FileNotFoundError):
+        copy_object("gs://bucket/20250101/curation.tsv", "gs://bucket/20250201/curation.tsv")
+
+
+@patch("gentroutils.io.path.gcs.GCSPath.blob")
+def test_read_write_object(mock_blob):
+    """Test that the content is downloaded and uploaded with the blob of the shared client."""
+    mock_blob.return_value.download_as_bytes.return_value = b"content"
+    assert read_object("gs://bucket/index.parquet") == b"content"
+
+    write_object("gs://bucket/index.parquet", b"content")
+    mock_blob.return_value.upload_from_string.assert_called_once_with(b"content")
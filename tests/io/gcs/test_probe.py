@@ -0,0 +1,177 @@
+"""Test probing of gzipped objects in GCS."""
+
+import gzip
+import struct
+import threading
+import time
+import zlib
+from unittest.mock import MagicMock, call
+
+import pytest
+from google.api_core.exceptions import NotFound
+
+from gentroutils.io.gcs.probe import BGZF_EOF, GCSGzipProber, GzipProbe, decode_header, decode_isize, is_bgzf
+
+CONTENT = b"variant_id\tp_value\tbeta\n" + b"".join(f"rs{i}\t0.{i}\t1.0\n".encode() for i in range(5000))
+
+
+def bgzf_compress(content: bytes) -> bytes:
+    """Compress the content into a single BGZF block followed by the end-of-file block, as `bgzip` does."""
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    deflated = compressor.compress(content) + compressor.flush()
+    block_size = 18 + len(deflated) + 8
+    header = b"\x1f\x8b\x08\x04" + b"\x00" * 4 + b"\x00\xff\x06\x00BC\x02\x00" + struct.pack("<H", block_size - 1)
+    trailer = struct.pack("<II", zlib.crc32(content), len(content))
+    return header + deflated + trailer + BGZF_EOF
+
+
+def ranged_client(objects: dict[str, bytes]) -> MagicMock:
+    """Storage client serving the ranged reads of the objects from memory."""
+    blobs: dict[str, MagicMock] = {}
+
+    def blob(name: str) -> MagicMock:
+        if name in blobs:
+            return blobs[name]
+
+        def download_as_bytes(start=None, end=None, raw_download=False, checksum="auto"):
+            if name not in objects:
+                raise NotFound(name)
+            content = objects[name]
+            if start is not None and start < 0:
+                return content[start:]
+            return content[start : end + 1 if end is not None else None]
+
+        blobs[name] = MagicMock()
+        blobs[name].download_as_bytes.side_effect = download_as_bytes
+        return blobs[name]
+
+    client = MagicMock()
+    client.bucket.return_value.blob.side_effect = blob
+    return client
+
+
+class TestDecode:
+    """Tests for the gzip head and trailer decoding."""
+
+    def test_decode_header_partial_head(self) -> None:
+        """Test that the header is decoded from the first bytes of a large file."""
+        assert decode_header(gzip.compress(CONTENT)[:1024]) == ["variant_id", "p_value", "beta"]
+
+    @pytest.mark.parametrize(
+        ("head", "expected"),
+        [
+            pytest.param(gzip.compress(b"a\tb"), ["a", "b"], id="no_trailing_newline"),
+            pytest.param(gzip.compress(b"a\tb\r\n1\t2\r\n"), ["a", "b"], id="crlf"),
+            pytest.param(gzip.compress(b""), None, id="empty"),
+            pytest.param(b"\x1f\x8bnot deflate", None, id="corrupted"),
+            pytest.param(gzip.compress(b"a" * 100_000)[:64], None, id="incomplete_header"),
+        ],
+    )
+    def test_decode_header(self, head: bytes, expected: list[str] | None) -> None:
+        """Test the header decoding edge cases."""
+        assert decode_header(head) == expected
+
+    def test_decode_isize(self) -> None:
+        """Test the uncompressed size is read from the trailer."""
+        assert decode_isize(gzip.compress(CONTENT)[-8:]) == len(CONTENT)
+        assert decode_isize(b"\x00" * 4) is None
+
+    def test_is_bgzf(self) -> None:
+        """Test that the BGZF files are told apart from the plain gzip files."""
+        assert is_bgzf(bgzf_compress(CONTENT))
+        assert gzip.decompress(bgzf_compress(CONTENT)) == CONTENT
+        assert not is_bgzf(gzip.compress(CONTENT))
+        assert not is_bgzf(b"\x1f\x8b\x08\x04")
+
+
+class TestGCSGzipProber:
+    """Tests for the GCSGzipProber."""
+
+    def test_probe(self) -> None:
+        """Test that only the head and the trailer are read."""
+        compressed = gzip.compress(CONTENT)
+        client = ranged_client({"f.tsv.gz": compressed})
+        probe = GCSGzipProber(head_bytes=512, client=client).probe("gs://bucket/f.tsv.gz", len(compressed))
+
+        assert probe == GzipProbe(
+            "gs://bucket/f.tsv.gz", ["variant_id", "p_value", "beta"], len(compressed), len(CONTENT), None
+        )
+        client.bucket.assert_called_with("bucket")
+        assert client.bucket.return_value.blob("f.tsv.gz").download_as_bytes.call_args_list == [
+            call(start=0, end=511, raw_download=True, checksum=None),
+            call(start=len(compressed) - len(BGZF_EOF), raw_download=True, checksum=None),
+        ]
+
+    @pytest.mark.parametrize(
+        ("content", "is_complete"),
+        [
+            pytest.param(bgzf_compress(CONTENT), True, id="complete"),
+            pytest.param(bgzf_compress(CONTENT)[:-1], False, id="truncated_eof"),
+            pytest.param(bgzf_compress(CONTENT)[:2048], False, id="truncated"),
+        ],
+    )
+    def test_probe_bgzf(self, content: bytes, is_complete: bool) -> None:
+        """Test that a BGZF file is complete only when it ends with the end-of-file block."""
+        probe = GCSGzipProber(client=ranged_client({"f.tsv.gz": content})).probe("gs://bucket/f.tsv.gz", len(content))
+        assert probe == GzipProbe(
+            "gs://bucket/f.tsv.gz", ["variant_id", "p_value", "beta"], len(content), None, is_complete
+        )
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param(b"variant_id\tp_value\n", id="not_gzip"),
+            pytest.param(gzip.compress(CONTENT)[:10], id="too_small"),
+        ],
+    )
+    def test_probe_incomplete(self, content: bytes) -> None:
+        """Test that the objects that cannot be gzip files are never complete."""
+        probe = GCSGzipProber(client=ranged_client({"f.tsv.gz": content})).probe("gs://bucket/f.tsv.gz", len(content))
+        assert probe.is_complete is False
+
+    def test_probe_suffix_range(self) -> None:
+        """Test that the trailer is read with a suffix range when the size is unknown."""
+        client = ranged_client({"f.tsv.gz": gzip.compress(CONTENT)})
+        probe = GCSGzipProber(client=client).probe("gs://bucket/f.tsv.gz")
+        assert probe.uncompressed_size == len(CONTENT)
+        assert probe.compressed_size is None
+
+    def test_probe_truncated(self) -> None:
+        """Test that the trailer of a truncated upload does not hold the uncompressed size."""
+        truncated = gzip.compress(CONTENT)[:2048]
+        client = ranged_client({"f.tsv.gz": truncated})
+        probe = GCSGzipProber(client=client).probe("gs://bucket/f.tsv.gz", len(truncated))
+        assert probe.columns == ["variant_id", "p_value", "beta"]
+        assert probe.uncompressed_size != len(CONTENT)
+        assert probe.is_complete is None
+
+    def test_probe_missing_object(self) -> None:
+        """Test that an object that cannot be read returns an invalid probe."""
+        probe = GCSGzipProber(client=ranged_client({})).probe("gs://bucket/missing.tsv.gz", 100)
+        assert probe == GzipProbe("gs://bucket/missing.tsv.gz", None, 100, None, None)
+
+    def test_probe_many_bounded(self) -> None:
+        """Test that the probes keep the input order and at most `max_workers` objects are read at once."""
+        objects = {f"f{i}.tsv.gz": gzip.compress(f"c{i}\n".encode()) for i in range(8)}
+        client = ranged_client(objects)
+        in_flight, peak, lock = 0, 0, threading.Lock()
+        probe = GCSGzipProber.probe
+
+        def tracked_probe(self, uri, size=None):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            try:
+                return probe(self, uri, size)
+            finally:
+                with lock:
+                    in_flight -= 1
+
+        prober = GCSGzipProber(max_workers=2, client=client)
+        prober.probe = tracked_probe.__get__(prober)  # type: ignore[method-assign]
+        probes = prober.probe_many((f"gs://bucket/{name}", len(content)) for name, content in objects.items())
+
+        assert [p.columns for p in probes] == [[f"c{i}"] for i in range(8)]
+        assert peak == 2
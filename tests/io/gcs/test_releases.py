@@ -0,0 +1,59 @@
+"""Test the lookup of the previous releases."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gentroutils.io.gcs.releases import previous_release
+
+TEMPLATE = "gs://gwas_catalog_inputs/gentroutils/{release_date}/{stem}.tsv"
+
+
+@pytest.fixture
+def mock_client():
+    """Storage client listing the release directories of the gentroutils prefix."""
+    client = MagicMock()
+    iterator = SimpleNamespace(
+        pages=[],
+        prefixes={
+            "gentroutils/20250101/",
+            "gentroutils/20250201/",
+            "gentroutils/20250301/",
+            "gentroutils/latest/",
+            "gentroutils/profiles/",
+        },
+    )
+    client.list_blobs.return_value = iterator
+    with patch("gentroutils.io.gcs.releases.gcs_client", return_value=client):
+        yield client
+
+
+@pytest.mark.parametrize(
+    ("release_date", "expected"),
+    [
+        pytest.param("20250301", "20250201", id="latest_before"),
+        pytest.param("20250401", "20250301", id="new_release"),
+        pytest.param("20250101", None, id="first_release"),
+    ],
+)
+def test_previous_release(mock_client, release_date, expected):
+    """Test that the latest dated release directory before the release is found."""
+    assert previous_release(TEMPLATE, release_date) == expected
+    mock_client.list_blobs.assert_called_once_with(
+        "gwas_catalog_inputs", prefix="gentroutils/", delimiter="/", fields="prefixes,nextPageToken"
+    )
+
+
+def test_previous_release_bucket_root(mock_client):
+    """Test that the release directories are listed at the root of the bucket."""
+    previous_release("gs://gwas_catalog_inputs/{release_date}/pending/curation.tsv", "20250301")
+    mock_client.list_blobs.assert_called_once_with(
+        "gwas_catalog_inputs", prefix="", delimiter="/", fields="prefixes,nextPageToken"
+    )
+
+
+def test_previous_release_not_a_directory(mock_client):
+    """Test that no previous release is looked up when the release date is not a directory of the template."""
+    assert previous_release("gs://gwas_catalog_inputs/gentroutils/stats_{release_date}.json", "20250301") is None
+    mock_client.list_blobs.assert_not_called()
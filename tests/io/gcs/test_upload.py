@@ -0,0 +1,91 @@
+"""Test the parallel composite uploads."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from google.api_core.exceptions import Forbidden
+
+from gentroutils.io.gcs.upload import COMPOSITE_PART_PREFIX, CompositeUploader
+
+CONTENT = b"0123456789"
+
+
+@pytest.fixture
+def mock_blob():
+    """Destination blob whose part objects record the bytes uploaded to them."""
+    blob = MagicMock(name="blob")
+    blob.name = "20250101/associations.tsv"
+    uploaded: dict[str, bytes] = {}
+
+    def part(name):
+        part_blob = MagicMock(name=name)
+        part_blob.name = name
+        part_blob.upload_from_file.side_effect = lambda stream, size, **_: uploaded.update({name: stream.read(size)})
+        return part_blob
+
+    blob.bucket.blob.side_effect = part
+    blob.uploaded = uploaded
+    return blob
+
+
+def test_upload_single_stream(mock_blob):
+    """Test that the objects below the threshold are uploaded with a single stream."""
+    assert CompositeUploader(threshold=len(CONTENT) + 1).upload(mock_blob, CONTENT) == 1
+    mock_blob.upload_from_string.assert_called_once_with(CONTENT)
+    mock_blob.compose.assert_not_called()
+
+
+def test_upload_composite(mock_blob):
+    """Test that the large objects are uploaded in parts, composed in order and the parts are deleted."""
+    assert CompositeUploader(threshold=len(CONTENT), part_size=4, parallelism=2).upload(mock_blob, CONTENT) == 3
+
+    mock_blob.upload_from_string.assert_not_called()
+    (parts,) = mock_blob.compose.call_args.args
+    assert all(p.name.startswith(f"{COMPOSITE_PART_PREFIX}/") for p in parts)
+    assert b"".join(mock_blob.uploaded[p.name] for p in parts) == CONTENT
+    for p in parts:
+        assert p.upload_from_file.call_args.kwargs == {
+            "size": len(mock_blob.uploaded[p.name]),
+            "checksum": "crc32c",
+            "if_generation_match": 0,
+        }
+    assert mock_blob.bucket.delete_blobs.call_args.args == (parts,)
+
+
+def test_upload_composite_failure(mock_blob):
+    """Test that the parts are deleted when a part fails, and a failed cleanup does not hide the error."""
+    failed = MagicMock()
+    failed.upload_from_file.side_effect = ConnectionResetError("reset")
+    mock_blob.bucket.blob.side_effect = None
+    mock_blob.bucket.blob.return_value = failed
+    mock_blob.bucket.delete_blobs.side_effect = Forbidden("denied")
+
+    with pytest.raises(ConnectionResetError):
+        CompositeUploader(threshold=1, part_size=4).upload(mock_blob, CONTENT)
+
+    mock_blob.compose.assert_not_called()
+    mock_blob.bucket.delete_blobs.assert_called_once()
+
+
+def test_upload_composite_shared_parallelism():
+    """Test that the concurrent uploads of an uploader share its `parallelism` part uploads."""
+    in_flight, peak, lock = 0, 0, threading.Lock()
+
+    def upload_part(stream, size, **_):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+
+    blob = MagicMock()
+    blob.bucket.blob.return_value.upload_from_file.side_effect = upload_part
+    uploader = CompositeUploader(threshold=1, part_size=1, parallelism=2)
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(lambda _: uploader.upload(blob, CONTENT), range(4))) == [len(CONTENT)] * 4
+    assert peak == 2
@@ -10,9 +10,17 @@ class TestFtpPath:
         ftp_path = FTPPath("ftp://example.com/path/to/file.txt")
         assert ftp_path.uri == "ftp://example.com/path/to/file.txt"
         assert ftp_path.server == "example.com"
+        assert (ftp_path.host, ftp_path.port) == ("example.com", 21)
         assert ftp_path.filename == "file.txt"
         assert ftp_path.base_dir == "/path/to"
 
+    def test_initialization_with_port(self):
+        from gentroutils.io.path.ftp import FTPPath
+
+        ftp_path = FTPPath("ftp://127.0.0.1:2121/path/to/file.txt")
+        assert ftp_path.server == "127.0.0.1:2121"
+        assert (ftp_path.host, ftp_path.port) == ("127.0.0.1", 2121)
+
     @pytest.mark.parametrize(
         ("uri", "expected_error"),
         [
@@ -34,3 +42,28 @@ class TestFtpPath:
         ftp_path = FTPPath("ftp://example.com/path/to/file.txt")
         assert repr(ftp_path) == "ftp://example.com/path/to/file.txt"
         assert str(ftp_path) == "ftp://example.com/path/to/file.txt"
+
+
+class TestFtpPathStream:
+    @pytest.mark.asyncio
+    async def test_read_stream(self, ftp_server):
+        from gentroutils.io.path.ftp import FTPPath
+
+        server, root = ftp_server
+        (root / "file.txt").write_bytes(b"x" * 2500)
+        chunks = [chunk async for chunk in FTPPath(f"ftp://{server}/file.txt").read_stream(chunk_size=1000)]
+        assert b"".join(chunks) == b"x" * 2500
+        assert max(len(chunk) for chunk in chunks) <= 1000
+
+    @pytest.mark.asyncio
+    async def test_write_stream(self, ftp_server):
+        from gentroutils.io.path.ftp import FTPPath
+
+        async def chunks():  # noqa: RUF029
+            for chunk in (b"abc", b"def"):
+                yield chunk
+
+        server, root = ftp_server
+        written = await FTPPath(f"ftp://{server}/file.txt").write_stream(chunks())
+        assert written == 6
+        assert (root / "file.txt").read_bytes() == b"abcdef"
@@ -1,5 +1,8 @@
 """Test GCS path module."""
 
+import io
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 
@@ -33,3 +36,51 @@ class TestGCSPath:
 
         with pytest.raises(GentroutilsError, match=expected_error):
             GCSPath(uri)
+
+
+class TestGCSPathStream:
+    @pytest.mark.asyncio
+    @patch("google.cloud.storage.Client")
+    async def test_read_stream(self, mock_client):
+        from gentroutils.io.path.gcs import GCSPath
+
+        blob = mock_client.return_value.bucket.return_value.blob.return_value
+        blob.open.return_value = io.BytesIO(b"abcdef")
+        chunks = [chunk async for chunk in GCSPath("gs://bucket/path/file.txt").read_stream(chunk_size=4)]
+
+        assert chunks == [b"abcd", b"ef"]
+        mock_client.return_value.bucket.assert_called_once_with("bucket")
+        mock_client.return_value.bucket.return_value.blob.assert_called_once_with("path/file.txt")
+        blob.open.assert_called_once_with("rb", chunk_size=4)
+        assert blob.open.return_value.closed
+
+    @pytest.mark.asyncio
+    @patch("google.cloud.storage.Client")
+    async def test_write_stream(self, mock_client):
+        from gentroutils.io.path.gcs import GCSPath
+
+        async def chunks():  # noqa: RUF029
+            yield b"abc"
+            yield b"def"
+
+        writer = MagicMock(write=len)
+        mock_client.return_value.bucket.return_value.blob.return_value.open.return_value = writer
+        assert await GCSPath("gs://bucket/file.txt").write_stream(chunks()) == 6
+        writer.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("google.cloud.storage.Client")
+    async def test_write_stream_failure(self, mock_client):
+        from gentroutils.io.path.gcs import GCSPath
+
+        async def failing():  # noqa: RUF029
+            yield b"abc"
+            raise ConnectionError("source closed")
+
+        writer = MagicMock(write=len)
+        mock_client.return_value.bucket.return_value.blob.return_value.open.return_value = writer
+        with pytest.raises(ConnectionError):
+            await GCSPath("gs://bucket/file.txt").write_stream(failing())
+        # The upload is cancelled rather than finalized, so the object is left untouched
+        writer.close.assert_not_called()
+        writer.terminate.assert_called_once()
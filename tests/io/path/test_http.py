@@ -0,0 +1,60 @@
+"""Test HTTP path module."""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gentroutils.io.path import HTTPPath
+
+
+@pytest_asyncio.fixture
+async def http_server():
+    """HTTP server keeping the uploaded resources in memory."""
+    resources: dict[str, bytes] = {"/file.txt": b"x" * 2500}
+
+    async def get(request: web.Request) -> web.Response:  # noqa: RUF029
+        if request.path not in resources:
+            raise web.HTTPNotFound
+        return web.Response(body=resources[request.path])
+
+    async def put(request: web.Request) -> web.Response:
+        resources[request.path] = await request.read()
+        return web.Response(status=201)
+
+    app = web.Application()
+    app.router.add_get("/{name}", get)
+    app.router.add_put("/{name}", put)
+    async with TestServer(app) as server:
+        yield f"http://{server.host}:{server.port}", resources
+
+
+class TestHTTPPath:
+    def test_initialization(self):
+        path = HTTPPath("https://example.com:8080/path/to/file.txt")
+        assert path.host == "example.com:8080"
+        assert path.path == "/path/to/file.txt"
+
+    @pytest.mark.asyncio
+    async def test_read_stream(self, http_server):
+        url, _ = http_server
+        chunks = [chunk async for chunk in HTTPPath(f"{url}/file.txt").read_stream(chunk_size=1000)]
+        assert b"".join(chunks) == b"x" * 2500
+
+    @pytest.mark.asyncio
+    async def test_read_stream_not_found(self, http_server):
+        import aiohttp
+
+        url, _ = http_server
+        with pytest.raises(aiohttp.ClientResponseError):
+            _ = [chunk async for chunk in HTTPPath(f"{url}/missing.txt").read_stream()]
+
+    @pytest.mark.asyncio
+    async def test_write_stream(self, http_server):
+        async def chunks():  # noqa: RUF029
+            for chunk in (b"abc", b"def"):
+                yield chunk
+
+        url, resources = http_server
+        assert await HTTPPath(f"{url}/upload.txt").write_stream(chunks()) == 6
+        assert resources["/upload.txt"] == b"abcdef"
@@ -0,0 +1,40 @@
+"""Test local path module."""
+
+import pytest
+
+from gentroutils.io.path import LocalPath, copy_uri
+
+
+async def chunks(*content: bytes):  # noqa: RUF029
+    for chunk in content:
+        yield chunk
+
+
+class TestLocalPath:
+    @pytest.mark.asyncio
+    async def test_copy(self, tmp_path):
+        source = tmp_path / "source.txt"
+        source.write_bytes(b"x" * 2500)
+        destination = tmp_path / "nested" / "destination.txt"
+
+        assert await copy_uri(str(source), f"file://{destination}", chunk_size=1000) == 2500
+        assert destination.read_bytes() == b"x" * 2500
+
+    @pytest.mark.asyncio
+    async def test_write_stream_failure(self, tmp_path):
+        async def failing():  # noqa: RUF029
+            yield b"partial"
+            raise ConnectionError("source closed")
+
+        destination = tmp_path / "destination.txt"
+        destination.write_bytes(b"previous")
+        with pytest.raises(ConnectionError):
+            await LocalPath(str(destination)).write_stream(failing())
+        assert destination.read_bytes() == b"previous"
+        assert list(tmp_path.iterdir()) == [destination]
+
+    @pytest.mark.asyncio
+    async def test_read_stream(self, tmp_path):
+        (tmp_path / "file.txt").write_bytes(b"abcdef")
+        read = [chunk async for chunk in LocalPath(str(tmp_path / "file.txt")).read_stream(chunk_size=4)]
+        assert read == [b"abcd", b"ef"]
@@ -0,0 +1,63 @@
+"""Test the uri parsing and interning."""
+
+import pickle
+
+import pytest
+
+from gentroutils.errors import GentroutilsError
+from gentroutils.io.path import FTPPath, GCSPath, HTTPPath, LocalPath, parse_uri
+
+
+class TestURIPath:
+    def test_interned(self):
+        assert GCSPath("gs://bucket/file.txt") is GCSPath("gs://bucket/file.txt")
+        assert GCSPath("gs://bucket/file.txt") is not GCSPath("gs://bucket/other.txt")
+
+    def test_immutable(self):
+        path = GCSPath("gs://bucket/file.txt")
+        with pytest.raises(AttributeError, match="immutable"):
+            path.bucket = "other"  # type: ignore[misc]
+        with pytest.raises(AttributeError, match="immutable"):
+            del path.bucket
+
+    def test_pickle(self):
+        path = FTPPath("ftp://example.com/path/to/file.txt")
+        assert pickle.loads(pickle.dumps(path)) is path
+
+    def test_equality(self):
+        assert GCSPath("gs://bucket/file.txt") == GCSPath("gs://bucket/file.txt")
+        assert GCSPath("gs://bucket/file.txt") != "gs://bucket/file.txt"
+        assert len({GCSPath("gs://bucket/file.txt"), GCSPath("gs://bucket/file.txt")}) == 1
+
+
+class TestParseURI:
+    @pytest.mark.parametrize(
+        ("uri", "expected_type"),
+        [
+            pytest.param("gs://bucket/file.txt", GCSPath, id="gcs"),
+            pytest.param("ftp://example.com/file.txt", FTPPath, id="ftp"),
+            pytest.param("http://example.com/file.txt", HTTPPath, id="http"),
+            pytest.param("https://example.com/file.txt", HTTPPath, id="https"),
+            pytest.param("file:///data/file.txt", LocalPath, id="file"),
+            pytest.param("/data/file.txt", LocalPath, id="plain_path"),
+        ],
+    )
+    def test_dispatch(self, uri, expected_type):
+        path = parse_uri(uri)
+        assert type(path) is expected_type
+        assert parse_uri(path) is path
+
+    def test_local_path(self):
+        assert parse_uri("file:///data/file.txt").local_path == parse_uri("/data/file.txt").local_path
+
+    @pytest.mark.parametrize(
+        ("uri", "expected_error"),
+        [
+            pytest.param("s3://bucket/file.txt", "Unsupported URL scheme", id="unsupported_scheme"),
+            pytest.param("https:///file.txt", "Host is missing", id="missing_host"),
+            pytest.param("/data/", "File name is missing", id="missing_file_name"),
+        ],
+    )
+    def test_invalid(self, uri, expected_error):
+        with pytest.raises(GentroutilsError, match=expected_error):
+            parse_uri(uri)
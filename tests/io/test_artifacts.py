@@ -0,0 +1,56 @@
+"""Test the run scoped artifact cache."""
+
+import os
+from pathlib import Path
+
+from gentroutils.io.artifacts import ArtifactCache
+
+
+class TestArtifactCache:
+    """Tests for the ArtifactCache."""
+
+    def test_register_and_lookup(self, tmp_path: Path) -> None:
+        """Test that the registered copy is returned only for the same uri and generation."""
+        cache = ArtifactCache(tmp_path / "artifacts")
+        path = cache.register("gs://bucket/studies.tsv", 1700000000000000, b"studyId\nGCST1\n")
+        assert path.read_bytes() == b"studyId\nGCST1\n"
+        assert cache.lookup("gs://bucket/studies.tsv", "1700000000000000") == path
+        assert cache.lookup("gs://bucket/studies.tsv", 1700000000000001) is None
+        assert cache.lookup("gs://bucket/other.tsv", 1700000000000000) is None
+
+    def test_register_overwrites(self, tmp_path: Path) -> None:
+        """Test that registering a new generation replaces the previous copy."""
+        cache = ArtifactCache(tmp_path)
+        cache.register("gs://bucket/studies.tsv", 1, b"old")
+        path = cache.register("gs://bucket/studies.tsv", 2, b"new content")
+        assert cache.lookup("gs://bucket/studies.tsv", 1) is None
+        assert cache.lookup("gs://bucket/studies.tsv", 2) == path
+        assert path.read_bytes() == b"new content"
+
+    def test_lookup_truncated_copy(self, tmp_path: Path) -> None:
+        """Test that a local copy that does not match the registered size is ignored."""
+        cache = ArtifactCache(tmp_path)
+        path = cache.register("gs://bucket/studies.tsv", 1, b"content")
+        path.write_bytes(b"cont")
+        assert cache.lookup("gs://bucket/studies.tsv", 1) is None
+
+    def test_register_shares_content(self, tmp_path: Path) -> None:
+        """Test that the same content uploaded to several uris is stored once."""
+        cache = ArtifactCache(tmp_path)
+        dated = cache.register("gs://bucket/20250101/studies.tsv", 1, b"content")
+        latest = cache.register("gs://bucket/latest/studies.tsv", 2, b"content")
+        assert dated == latest
+        assert cache.lookup("gs://bucket/20250101/studies.tsv", 1) == cache.lookup("gs://bucket/latest/studies.tsv", 2)
+        assert len(list((tmp_path / "objects").iterdir())) == 1
+
+    def test_register_evicts(self, tmp_path: Path) -> None:
+        """Test that the least recently used copies are evicted beyond the maximum size."""
+        cache = ArtifactCache(tmp_path, max_bytes=10)
+        cache.register("gs://bucket/studies.tsv", 1, b"studies")
+        for path in (tmp_path / "objects").iterdir():
+            os.utime(path, (0, 0))
+        cache.register("gs://bucket/ancestries.tsv", 1, b"ancestry")
+        assert cache.lookup("gs://bucket/studies.tsv", 1) is None
+        assert cache.lookup("gs://bucket/ancestries.tsv", 1) is not None
+        assert cache.register("gs://bucket/associations.tsv", 1, b"associations") is None
+        assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,103 @@
+"""Test the download cache."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from gentroutils.io.downloads import DownloadCache
+
+URI = "ftp://ftp.ebi.ac.uk/pub/databases/gwas/releases/2025/01/01/associations.zip"
+
+
+class TestDownloadCache:
+    """Tests for the DownloadCache."""
+
+    def test_store_and_load(self, tmp_path: Path) -> None:
+        """Test that the content is returned only for the same uri, size and mtime."""
+        cache = DownloadCache(tmp_path)
+        path = cache.store(URI, 7, "20250101120000", b"content")
+        assert path is not None
+        assert path.read_bytes() == b"content"
+        assert cache.load(URI, 7, "20250101120000") == b"content"
+        assert cache.load(URI, 8, "20250101120000") is None
+        assert cache.load(URI, 7, "20250102120000") is None
+        assert cache.load(URI.replace("2025/01/01", "latest"), 7, "20250101120000") is None
+
+    def test_same_content_stored_once(self, tmp_path: Path) -> None:
+        """Test that the content reached through two uris is stored once."""
+        cache = DownloadCache(tmp_path)
+        first = cache.store(URI, 7, "20250101120000", b"content")
+        second = cache.store(URI.replace("2025/01/01", "latest"), 7, "20250101120000", memoryview(b"content"))
+        assert first == second
+        assert len(list((tmp_path / "objects").iterdir())) == 1
+
+    def test_concurrent_stores(self, tmp_path: Path) -> None:
+        """Test that the worker threads storing the same content at the same time write distinct temporary files."""
+        cache = DownloadCache(tmp_path)
+        # Both threads have written their temporary copy before either of them replaces the file
+        barrier, replaced, os_replace = threading.Barrier(2, timeout=5), [], os.replace
+
+        def replace(src, dst):
+            replaced.append(src)
+            barrier.wait()
+            os_replace(src, dst)
+
+        with patch("gentroutils.io.files.os.replace", side_effect=replace), ThreadPoolExecutor(2) as executor:
+            paths = list(executor.map(lambda i: cache.store(f"{URI}.{i}", 7, "20250101120000", b"content"), range(2)))
+
+        assert paths[0] == paths[1]
+        assert len(set(replaced)) == len(replaced) == 4
+        assert cache.load(f"{URI}.0", 7, "20250101120000") == cache.load(f"{URI}.1", 7, "20250101120000") == b"content"
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_corrupted_content_discarded(self, tmp_path: Path) -> None:
+        """Test that a cached content that does not match its checksum is discarded."""
+        cache = DownloadCache(tmp_path)
+        path = cache.store(URI, 7, "20250101120000", b"content")
+        assert path is not None
+        path.write_bytes(b"CONTENT")
+        assert cache.load(URI, 7, "20250101120000") is None
+        assert not path.exists()
+        assert cache.load(URI, 7, "20250101120000") is None
+
+    def test_least_recently_used_evicted(self, tmp_path: Path) -> None:
+        """Test that the least recently used contents are evicted beyond the maximum size."""
+        cache = DownloadCache(tmp_path, max_bytes=10)
+        old = cache.store("ftp://example.com/a.tsv", 4, "1", b"aaaa")
+        recent = cache.store("ftp://example.com/b.tsv", 4, "1", b"bbbb")
+        assert old is not None
+        assert recent is not None
+        os.utime(old, (1, 1))
+        os.utime(recent, (2, 2))
+        assert cache.load("ftp://example.com/a.tsv", 4, "1") == b"aaaa"
+
+        cache.store("ftp://example.com/c.tsv", 4, "1", b"cccc")
+        assert cache.load("ftp://example.com/a.tsv", 4, "1") == b"aaaa"
+        assert cache.load("ftp://example.com/b.tsv", 4, "1") is None
+        assert cache.load("ftp://example.com/c.tsv", 4, "1") == b"cccc"
+
+    def test_eviction_skips_removed_files(self, tmp_path: Path) -> None:
+        """Test that the files removed by a concurrent eviction while listing the directory are skipped."""
+        cache = DownloadCache(tmp_path, max_bytes=10)
+        old = cache.store("ftp://example.com/a.tsv", 4, "1", b"aaaa")
+        assert old is not None
+        os.utime(old, (1, 1))
+        iterdir = Path.iterdir
+
+        def iterdir_with_removed(directory: Path):
+            yield directory / "removed"
+            yield from iterdir(directory)
+
+        with patch.object(Path, "iterdir", iterdir_with_removed):
+            cache.store("ftp://example.com/b.tsv", 4, "1", b"bbbb")
+            cache.store("ftp://example.com/c.tsv", 4, "1", b"cccc")
+        assert cache.load("ftp://example.com/a.tsv", 4, "1") is None
+        assert cache.load("ftp://example.com/c.tsv", 4, "1") == b"cccc"
+
+    def test_content_larger_than_cache_not_stored(self, tmp_path: Path) -> None:
+        """Test that a content larger than the cache is not stored."""
+        cache = DownloadCache(tmp_path, max_bytes=4)
+        assert cache.store(URI, 7, "20250101120000", b"content") is None
+        assert cache.load(URI, 7, "20250101120000") is None
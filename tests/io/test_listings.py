@@ -0,0 +1,51 @@
+"""Test the cached FTP directory listings."""
+
+import os
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from gentroutils.io.listings import FTPListingCache, list_ftp_directory
+from gentroutils.io.mirror import RemoteFile
+from gentroutils.io.path import FTPPath
+
+DIRECTORY = "ftp://example.com/releases/2025/01/01"
+FILES = [RemoteFile("studies.tsv", 7, datetime(2025, 1, 1, tzinfo=UTC))]
+
+
+@pytest.mark.asyncio
+async def test_list_ftp_directory(ftp_server):
+    server, root = ftp_server
+    (root / "releases" / "nested").mkdir(parents=True)
+    (root / "releases" / "studies.tsv").write_bytes(b"studyId\n")
+    (root / "releases" / "ancestries.tsv").write_bytes(b"ancestry\n")
+
+    files = await list_ftp_directory(FTPPath(f"ftp://{server}/releases"))
+
+    assert [(f.path, f.size) for f in files] == [("ancestries.tsv", 9), ("studies.tsv", 8)]
+
+
+class TestFTPListingCache:
+    """Tests for the FTPListingCache."""
+
+    def test_expired_listing(self, tmp_path: Path) -> None:
+        """Test that a listing older than the maximum age is not reused."""
+        cache = FTPListingCache(tmp_path, max_age=60)
+        cache.store(DIRECTORY, FILES)
+        assert cache.load(DIRECTORY) == FILES
+        (listing,) = tmp_path.glob("*.json")
+        os.utime(listing, (time.time() - 120, time.time() - 120))
+        assert cache.load(DIRECTORY) is None
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.listings.list_ftp_directory", new_callable=AsyncMock)
+    async def test_list_once(self, mock_list, tmp_path: Path) -> None:
+        """Test that the directory is listed on the server once."""
+        mock_list.return_value = FILES
+        cache = FTPListingCache(tmp_path)
+        assert await cache.list(FTPPath(DIRECTORY)) == FILES
+        assert await cache.list(FTPPath(DIRECTORY)) == FILES
+        mock_list.assert_awaited_once_with(FTPPath(DIRECTORY))
@@ -0,0 +1,128 @@
+"""Test the incremental FTP to GCS mirror."""
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import aioftp
+import pytest
+
+from gentroutils.io.mirror import (
+    MTIME_METADATA_KEY,
+    MirroredObject,
+    MirrorManifest,
+    RemoteFile,
+    list_mirror,
+    plan_mirror,
+    walk_ftp,
+)
+from gentroutils.io.path import FTPPath, GCSPath
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+T1 = datetime(2025, 1, 2, tzinfo=UTC)
+
+
+class TestMirroredObject:
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            pytest.param(MirroredObject(7, T1, T0), True, id="same_mtime"),
+            pytest.param(MirroredObject(7, T1, T1), False, id="other_mtime"),
+            pytest.param(MirroredObject(8, T1, T0), False, id="other_size"),
+            pytest.param(MirroredObject(7, T1), True, id="uploaded_after_modification"),
+            pytest.param(
+                MirroredObject(7, datetime(2024, 12, 31, tzinfo=UTC)), False, id="uploaded_before_modification"
+            ),
+        ],
+    )
+    def test_is_current(self, obj, expected):
+        assert obj.is_current(RemoteFile("GCST1/GCST1.h.tsv.gz", 7, T0)) is expected
+
+
+class TestWalkFtp:
+    @pytest.mark.asyncio
+    async def test_walk(self, ftp_server):
+        server, root = ftp_server
+        for name in ["GCST1-GCST2/GCST1/GCST1.h.tsv.gz", "GCST1-GCST2/GCST2/GCST2.h.tsv.gz", "README"]:
+            (root / "sumstats" / name).parent.mkdir(parents=True, exist_ok=True)
+            (root / "sumstats" / name).write_bytes(b"x" * len(name))
+        os.utime(root / "sumstats" / "README", (T0.timestamp(), T0.timestamp()))
+
+        files = await walk_ftp(FTPPath(f"ftp://{server}/sumstats"), max_connections=2)
+
+        assert [(f.path, f.size) for f in files] == [
+            ("GCST1-GCST2/GCST1/GCST1.h.tsv.gz", 32),
+            ("GCST1-GCST2/GCST2/GCST2.h.tsv.gz", 32),
+            ("README", 6),
+        ]
+        assert files[-1].mtime == T0
+
+    @pytest.mark.asyncio
+    async def test_walk_failure(self, ftp_server):
+        server, _ = ftp_server
+        with pytest.raises(aioftp.StatusCodeError):
+            await walk_ftp(FTPPath(f"ftp://{server}/missing"), max_connections=2)
+
+
+class TestListMirror:
+    @patch("gentroutils.io.gcs.listing.gcs_client")
+    def test_list(self, mock_gcs_client):
+        items = [
+            {
+                "name": "raw/GCST1/GCST1.h.tsv.gz",
+                "size": "7",
+                "updated": "2025-01-02T00:00:00.000Z",
+                "metadata": {MTIME_METADATA_KEY: str(int(T0.timestamp()))},
+            },
+            {"name": "raw/GCST2/GCST2.h.tsv.gz", "size": "8", "updated": "2025-01-02T00:00:00.000Z"},
+        ]
+
+        def list_blobs(bucket, prefix=None, fields=None, **kwargs):
+            if fields == "prefixes,nextPageToken":
+                return SimpleNamespace(pages=[], prefixes=set())
+            assert fields == "items(name,size,updated,metadata),nextPageToken"
+            return SimpleNamespace(pages=[SimpleNamespace(raw_page={"items": items})])
+
+        mock_gcs_client.return_value = MagicMock()
+        mock_gcs_client.return_value.list_blobs.side_effect = list_blobs
+        mirrored = list_mirror(GCSPath("gs://bucket/raw"))
+
+        assert mirrored == {
+            "GCST1/GCST1.h.tsv.gz": MirroredObject(7, T1, T0),
+            "GCST2/GCST2.h.tsv.gz": MirroredObject(8, T1),
+        }
+
+
+def test_plan_mirror():
+    files = [RemoteFile("a", 1, T1), RemoteFile("b", 1, T0), RemoteFile("c", 1, T0)]
+    mirrored = {"a": MirroredObject(1, T1, T0), "b": MirroredObject(1, T1, T0), "removed": MirroredObject(1, T1, T0)}
+    assert plan_mirror(files, mirrored) == [RemoteFile("a", 1, T1), RemoteFile("c", 1, T0)]
+
+
+class TestMirrorManifest:
+    def test_resume(self, tmp_path: Path):
+        manifest = MirrorManifest(tmp_path / "mirror" / "run.jsonl", "ftp://example.com/sumstats", "gs://bucket/raw")
+        assert manifest.resume() is None
+
+        files = [RemoteFile("a", 1, T0), RemoteFile("b", 2, T1)]
+        manifest.start(files)
+        assert manifest.resume() == files
+
+        manifest.transferred(files[0])
+        assert manifest.resume() == [files[1]]
+
+        other = MirrorManifest(manifest.path, "ftp://example.com/sumstats", "gs://bucket/other")
+        assert other.resume() is None
+
+        manifest.transferred(files[1])
+        manifest.complete()
+        assert manifest.resume() is None
+
+    def test_start_replaces_previous_run(self, tmp_path: Path):
+        manifest = MirrorManifest(tmp_path / "run.jsonl", "ftp://example.com/sumstats", "gs://bucket/raw")
+        manifest.start([RemoteFile("a", 1, T0)])
+        manifest.transferred(RemoteFile("a", 1, T0))
+        manifest.start([RemoteFile("a", 1, T1)])
+        assert manifest.resume() == [RemoteFile("a", 1, T1)]
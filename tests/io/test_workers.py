@@ -0,0 +1,40 @@
+"""Test the worker pool of the transfers."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from gentroutils.io.workers import WorkerPool, offload
+
+
+class TestWorkerPool:
+    @pytest.mark.asyncio
+    async def test_run_on_pool_threads(self):
+        with WorkerPool(2) as workers:
+            name = await workers.run(lambda: threading.current_thread().name)
+        assert name.startswith("gentroutils-cpu")
+        assert workers._executor is None
+
+    @pytest.mark.asyncio
+    async def test_event_loop_responsive(self):
+        """Test that the event loop keeps running while the pool computes."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        with WorkerPool(1) as workers:
+            await workers.run(time.sleep, 0.2)
+        task.cancel()
+        assert ticks > 10
+
+    @pytest.mark.asyncio
+    async def test_offload_without_pool(self):
+        name = await offload(None, lambda: threading.current_thread().name)
+        assert name != threading.current_thread().name
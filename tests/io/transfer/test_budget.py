@@ -0,0 +1,95 @@
+"""Test the memory budget of the transfers."""
+
+import asyncio
+
+import pytest
+
+from gentroutils.io.transfer.budget import MemoryBudget, Reservation
+
+
+class TestMemoryBudget:
+    @pytest.mark.asyncio
+    async def test_reservations_within_budget(self):
+        budget = MemoryBudget(100)
+        async with budget.reservation() as a, budget.reservation() as b:
+            await a.grow(40)
+            await b.grow(60)
+            assert budget.in_use == 100
+            a.shrink(10)
+            assert (a.held, budget.in_use) == (30, 90)
+        assert budget.in_use == 0
+        assert budget.high_water_mark == 100
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self):
+        """Test that a reservation waits until the other transfers released enough memory."""
+        budget = MemoryBudget(100)
+        events = []
+        released = asyncio.Event()
+
+        async def holder():
+            async with budget.reservation() as memory:
+                await memory.grow(80)
+                events.append("holder reserved")
+                await released.wait()
+                events.append("holder released")
+
+        async def waiter():
+            await asyncio.sleep(0)
+            async with budget.reservation() as memory:
+                await memory.grow(50)
+                events.append("waiter reserved")
+
+        tasks = [asyncio.create_task(holder()), asyncio.create_task(waiter())]
+        await asyncio.sleep(0.01)
+        assert events == ["holder reserved"]
+        assert budget.in_use == 80
+        released.set()
+        await asyncio.gather(*tasks)
+        assert events == ["holder reserved", "holder released", "waiter reserved"]
+        assert budget.high_water_mark == 80
+
+    @pytest.mark.asyncio
+    async def test_oversized_reservation_granted_when_idle(self):
+        budget = MemoryBudget(100)
+        async with budget.reservation() as memory:
+            await asyncio.wait_for(memory.grow(150), timeout=1)
+        assert budget.high_water_mark == 150
+        assert budget.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_stalled_transfers_make_progress(self):
+        """Test that transfers holding memory and all waiting for more do not deadlock."""
+        budget = MemoryBudget(100)
+        reserved = asyncio.Barrier(2)
+
+        async def transfer():
+            async with budget.reservation() as memory:
+                await memory.grow(50)
+                await reserved.wait()
+                await memory.grow(50)
+
+        await asyncio.wait_for(asyncio.gather(transfer(), transfer()), timeout=1)
+        assert budget.in_use == 0
+        assert budget.high_water_mark == 150
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self):
+        budget = MemoryBudget(100)
+        async with budget.reservation() as memory:
+            await memory.grow(100)
+            waiter = asyncio.create_task(budget.acquire(10))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert budget.in_use == 0
+        async with budget.reservation() as memory:
+            await asyncio.wait_for(memory.grow(100), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_reservation_without_budget(self):
+        async with Reservation(None) as memory:
+            await memory.grow(10)
+            memory.shrink(20)
+            assert memory.held == 0
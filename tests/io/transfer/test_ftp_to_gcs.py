@@ -8,8 +8,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from gentroutils.errors import GentroutilsError
-from gentroutils.io.transfer import FTPtoGCPTransferableObject
-from gentroutils.io.transfer.ftp_to_gcs import unzip_buffer
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.io.downloads import DownloadCache
+from gentroutils.io.transfer import FTPtoGCPTransferableObject, MemoryBudget
+from gentroutils.io.transfer.ftp_to_gcs import source_metadata, unzip_buffer, unzip_buffer_offloaded
+from gentroutils.io.workers import WorkerPool
+from gentroutils.tracing import Tracer
 
 
 @contextmanager
@@ -38,9 +42,9 @@ class TestFTPtoGCPTransferableObject:
             FTPtoGCPTransferableObject(source=source, destination=destination)
 
     @pytest.mark.asyncio
-    @patch("gentroutils.io.transfer.ftp_to_gcs.storage.Client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
     @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
-    async def test_transfer(self, mock_ftp_context, mock_storage_client):
+    async def test_transfer(self, mock_ftp_context, mock_gcs_client):
         # Mock FTP client and its operations
         mock_ftp_client = AsyncMock()
         mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
@@ -65,7 +69,7 @@ class TestFTPtoGCPTransferableObject:
 
         # Mock GCS client and operations
         mock_client = MagicMock()
-        mock_storage_client.return_value = mock_client
+        mock_gcs_client.return_value = mock_client
         mock_bucket = MagicMock()
         mock_blob = MagicMock()
         mock_client.bucket.return_value = mock_bucket
@@ -78,16 +82,233 @@ class TestFTPtoGCPTransferableObject:
         await obj.transfer()
 
         # Verify FTP operations
-        mock_ftp_context.assert_called_once_with("example.com", user="anonymous", password="anonymous")  # noqa: S106
+        mock_ftp_context.assert_called_once_with("example.com", 21, user="anonymous", password="anonymous")  # noqa: S106
         mock_ftp_client.change_directory.assert_called()
         mock_ftp_client.download_stream.assert_called_once_with("file.txt")
 
         # Verify GCS operations
-        mock_storage_client.assert_called_once()
+        mock_gcs_client.assert_called_once()
         mock_client.bucket.assert_called_once_with("test-bucket")
         mock_bucket.blob.assert_called_once_with("file.txt")
         mock_blob.upload_from_string.assert_called_once_with(b"testdatacontent")
 
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
+    async def test_transfer_registers_artifact(self, mock_ftp_context, mock_gcs_client, tmp_path):
+        """Test that the uploaded content is registered with the generation of the uploaded blob."""
+        mock_ftp_client = AsyncMock()
+        mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
+        mock_stream = AsyncMock()
+        mock_stream.__aenter__.return_value = mock_stream
+
+        async def mock_iter_by_block():  # noqa: RUF029
+            yield b"studyId\n"
+
+        mock_stream.iter_by_block = mock_iter_by_block
+        mock_ftp_client.download_stream = AsyncMock(return_value=mock_stream)
+        mock_blob = mock_gcs_client.return_value.bucket.return_value.blob.return_value
+        mock_blob.generation = 1234
+
+        artifacts = ArtifactCache(tmp_path)
+        obj = FTPtoGCPTransferableObject(
+            source="ftp://example.com/2025/12/12/file.txt", destination="gs://test-bucket/file.txt", artifacts=artifacts
+        )
+        await obj.transfer()
+
+        local_copy = artifacts.lookup("gs://test-bucket/file.txt", 1234)
+        assert local_copy is not None
+        assert local_copy.read_bytes() == b"studyId\n"
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
+    async def test_transfer_artifact_failure(self, mock_ftp_context, mock_gcs_client, tmp_path):
+        """Test that a failure to keep the local copy does not fail the uploaded transfer."""
+        mock_ftp_client = AsyncMock()
+        mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
+        mock_stream = AsyncMock()
+        mock_stream.__aenter__.return_value = mock_stream
+
+        async def mock_iter_by_block():  # noqa: RUF029
+            yield b"studyId\n"
+
+        mock_stream.iter_by_block = mock_iter_by_block
+        mock_ftp_client.download_stream = AsyncMock(return_value=mock_stream)
+        mock_blob = mock_gcs_client.return_value.bucket.return_value.blob.return_value
+
+        artifacts = ArtifactCache(tmp_path)
+        obj = FTPtoGCPTransferableObject(
+            source="ftp://example.com/2025/12/12/file.txt", destination="gs://test-bucket/file.txt", artifacts=artifacts
+        )
+        with patch.object(ArtifactCache, "register", side_effect=OSError("No space left on device")):
+            await obj.transfer()
+
+        mock_blob.upload_from_string.assert_called_once_with(b"studyId\n")
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
+    async def test_transfer_traced(self, mock_ftp_context, mock_gcs_client):
+        """Test that the phases of the transfer are traced on a lane of their own."""
+        mock_ftp_client = AsyncMock()
+        mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
+        mock_stream = AsyncMock()
+        mock_stream.__aenter__.return_value = mock_stream
+
+        async def mock_iter_by_block():  # noqa: RUF029
+            for chunk in [b"test", b"data"]:
+                yield chunk
+
+        mock_stream.iter_by_block = mock_iter_by_block
+        mock_ftp_client.download_stream = AsyncMock(return_value=mock_stream)
+
+        tracer = Tracer("fetch")
+        obj = FTPtoGCPTransferableObject(
+            source="ftp://example.com/2025/12/12/file.txt", destination="gs://test-bucket/file.txt"
+        )
+        with tracer.activate():
+            await obj.transfer()
+
+        spans = {e["name"]: e for e in tracer.events() if e["ph"] == "X"}
+        assert list(spans) == ["transfer", "ftp connect", "directory resolution", "download", "gcs upload"]
+        assert {e["tid"] for e in spans.values()} == {1}
+        assert tracer.lanes[1] == "gs://test-bucket/file.txt"
+        assert spans["download"]["args"]["bytes"] == 8
+        assert spans["gcs upload"]["args"]["bytes"] == 8
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
+    async def test_transfer_reserves_memory(self, mock_ftp_context, mock_gcs_client):
+        """Test that the downloaded and unzipped buffers are reserved against the memory budget."""
+        content = b"studyId\tpubmedId\n" * 100
+        zipped = io.BytesIO()
+        with zipfile.ZipFile(zipped, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            z.writestr("file.tsv", content)
+        compressed = zipped.getvalue()
+
+        mock_ftp_client = AsyncMock()
+        mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
+        mock_stream = AsyncMock()
+        mock_stream.__aenter__.return_value = mock_stream
+
+        async def mock_iter_by_block():  # noqa: RUF029
+            for i in range(0, len(compressed), 64):
+                yield compressed[i : i + 64]
+
+        mock_stream.iter_by_block = mock_iter_by_block
+        mock_ftp_client.download_stream = AsyncMock(return_value=mock_stream)
+        mock_blob = mock_gcs_client.return_value.bucket.return_value.blob.return_value
+
+        budget = MemoryBudget(10 * 1024 * 1024)
+        obj = FTPtoGCPTransferableObject(
+            source="ftp://example.com/2025/12/12/file.zip", destination="gs://test-bucket/file.tsv", budget=budget
+        )
+        await obj.transfer()
+
+        mock_blob.upload_from_string.assert_called_once_with(content)
+        assert budget.high_water_mark == len(compressed) + len(content)
+        assert budget.in_use == 0
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
+    async def test_transfer_reuses_cached_download(self, mock_ftp_context, mock_gcs_client, tmp_path):
+        """Test that an unchanged file is read from the download cache instead of being downloaded again."""
+        mock_ftp_client = AsyncMock()
+        mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
+        mock_ftp_client.stat = AsyncMock(return_value={"size": "8", "modify": "20251212120000", "type": "file"})
+        mock_stream = AsyncMock()
+        mock_stream.__aenter__.return_value = mock_stream
+
+        async def mock_iter_by_block():  # noqa: RUF029
+            for chunk in [b"test", b"data"]:
+                yield chunk
+
+        mock_stream.iter_by_block = mock_iter_by_block
+        mock_ftp_client.download_stream = AsyncMock(return_value=mock_stream)
+        mock_blob = mock_gcs_client.return_value.bucket.return_value.blob.return_value
+
+        downloads = DownloadCache(tmp_path)
+        obj = FTPtoGCPTransferableObject(
+            source="ftp://example.com/2025/12/12/file.txt", destination="gs://test-bucket/file.txt", downloads=downloads
+        )
+        await obj.transfer()
+        await obj.transfer()
+
+        mock_ftp_client.stat.assert_called_with("file.txt")
+        mock_ftp_client.download_stream.assert_called_once_with("file.txt")
+        assert mock_blob.upload_from_string.call_count == 2
+        mock_blob.upload_from_string.assert_called_with(b"testdata")
+        assert downloads.load("ftp://example.com/2025/12/12/file.txt", 8, "20251212120000") == b"testdata"
+
+        # The file changed on the server, so it is downloaded again.
+        mock_ftp_client.stat.return_value = {"size": "8", "modify": "20251213120000", "type": "file"}
+        await obj.transfer()
+        assert mock_ftp_client.download_stream.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
+    async def test_transfer_copies_unchanged_previous(self, mock_ftp_context, mock_gcs_client):
+        """Test that the object of the previous release is copied server side when the file did not change."""
+        mock_ftp_client = AsyncMock()
+        mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
+        mock_ftp_client.stat = AsyncMock(return_value={"size": "8", "modify": "20251212120000", "type": "file"})
+        mock_bucket = mock_gcs_client.return_value.bucket.return_value
+        mock_blob = mock_bucket.blob.return_value
+        mock_blob.rewrite.side_effect = [("token", 4, 8), (None, 8, 8)]
+        previous_blob = mock_bucket.get_blob.return_value
+        previous_blob.metadata = source_metadata("file.txt", (8, "20251212120000"))
+
+        tracer = Tracer("fetch")
+        obj = FTPtoGCPTransferableObject(
+            source="ftp://example.com/2025/12/12/file.txt",
+            destination="gs://test-bucket/20251212/file.txt",
+            previous="gs://test-bucket/20251112/file.txt",
+        )
+        with tracer.activate():
+            await obj.transfer()
+
+        mock_bucket.get_blob.assert_called_once_with("20251112/file.txt")
+        assert mock_blob.rewrite.call_args_list[-1].kwargs == {"token": "token"}
+        mock_ftp_client.download_stream.assert_not_called()
+        mock_blob.upload_from_string.assert_not_called()
+        spans = [e["name"] for e in tracer.events() if e["ph"] == "X"]
+        assert spans[-2:] == ["previous release lookup", "gcs copy"]
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.ftp_to_gcs.gcs_client")
+    @patch("gentroutils.io.transfer.ftp_to_gcs.aioftp.Client.context")
+    async def test_transfer_changed_since_previous(self, mock_ftp_context, mock_gcs_client):
+        """Test that a file changed since the previous release is transferred with its version recorded."""
+        mock_ftp_client = AsyncMock()
+        mock_ftp_context.return_value.__aenter__.return_value = mock_ftp_client
+        mock_ftp_client.stat = AsyncMock(return_value={"size": "8", "modify": "20251212120000", "type": "file"})
+        mock_stream = AsyncMock()
+        mock_stream.__aenter__.return_value = mock_stream
+
+        async def mock_iter_by_block():  # noqa: RUF029
+            yield b"testdata"
+
+        mock_stream.iter_by_block = mock_iter_by_block
+        mock_ftp_client.download_stream = AsyncMock(return_value=mock_stream)
+        mock_bucket = mock_gcs_client.return_value.bucket.return_value
+        mock_blob = mock_bucket.blob.return_value
+        mock_bucket.get_blob.return_value.metadata = source_metadata("file.txt", (7, "20251112120000"))
+
+        obj = FTPtoGCPTransferableObject(
+            source="ftp://example.com/2025/12/12/file.txt",
+            destination="gs://test-bucket/20251212/file.txt",
+            previous="gs://test-bucket/20251112/file.txt",
+        )
+        await obj.transfer()
+
+        mock_blob.rewrite.assert_not_called()
+        mock_blob.upload_from_string.assert_called_once_with(b"testdata")
+        assert mock_blob.metadata == source_metadata("file.txt", (8, "20251212120000"))
+
 
 class TestUnzipBuffer:
     """Test the unzip_buffer function."""
@@ -135,3 +356,39 @@ class TestUnzipBuffer:
 
         with pytest.raises(ValueError, match="No files were found in the zipped buffer"):
             unzip_buffer(buffer)
+
+
+class TestUnzipBufferOffloaded:
+    """Test the unzip_buffer_offloaded function."""
+
+    @pytest.mark.asyncio
+    async def test_unzip_in_units(self):
+        """Test that the file is decompressed on the worker pool, one unit at a time."""
+        content = b"studyId\tpubmedId\n" * 1000
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            z.writestr("file.tsv", content)
+
+        with WorkerPool(1) as workers, patch.object(workers, "run", wraps=workers.run) as run:
+            result = await unzip_buffer_offloaded(buffer, workers, unit_size=4096)
+
+        assert result == content
+        # One call per unit and a last one returning the empty end of the file
+        assert run.call_count == len(content) // 4096 + 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("files", "expected_error"),
+        [
+            pytest.param({}, "No files were found", id="empty"),
+            pytest.param({"file1.txt": b"1", "file2.txt": b"2"}, "Multiple files were found", id="multiple"),
+        ],
+    )
+    async def test_unzip_invalid(self, files, expected_error):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as z:
+            for name, data in files.items():
+                z.writestr(name, data)
+
+        with pytest.raises(ValueError, match=expected_error):
+            await unzip_buffer_offloaded(buffer, None)
@@ -0,0 +1,45 @@
+"""Test the mirror transfers."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gentroutils.errors import GentroutilsError
+from gentroutils.io.mirror import MTIME_METADATA_KEY, MirrorManifest, RemoteFile
+from gentroutils.io.transfer import MirrorTransferableObject
+
+FILE = RemoteFile("GCST1/GCST1.h.tsv.gz", 2500, datetime(2025, 1, 1, tzinfo=UTC))
+
+
+class TestMirrorTransferableObject:
+    def test_validation_failure(self):
+        with pytest.raises(GentroutilsError, match="Unsupported URL scheme"):
+            MirrorTransferableObject(source="ftp://example.com/a.tsv", destination="/data/a.tsv", file=FILE)
+
+    @pytest.mark.asyncio
+    @patch("google.cloud.storage.Client")
+    async def test_transfer(self, mock_client, ftp_server, tmp_path):
+        server, root = ftp_server
+        (root / "GCST1").mkdir()
+        (root / "GCST1" / "GCST1.h.tsv.gz").write_bytes(b"x" * 2500)
+        written = bytearray()
+        writer = MagicMock(write=lambda chunk: written.extend(chunk) or len(chunk))
+        blob = mock_client.return_value.bucket.return_value.blob.return_value
+        blob.open.return_value = writer
+        manifest = MirrorManifest(tmp_path / "run.jsonl", f"ftp://{server}", "gs://bucket/raw")
+        manifest.start([FILE])
+
+        obj = MirrorTransferableObject(
+            source=f"ftp://{server}/GCST1/GCST1.h.tsv.gz",
+            destination="gs://bucket/raw/GCST1/GCST1.h.tsv.gz",
+            file=FILE,
+            manifest=manifest,
+            chunk_size=1000,
+        )
+        await obj.transfer()
+
+        assert bytes(written) == b"x" * 2500
+        writer.close.assert_called_once()
+        assert blob.metadata == {MTIME_METADATA_KEY: "1735689600"}
+        assert manifest.resume() == []
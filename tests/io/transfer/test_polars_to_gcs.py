@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import polars as pl
 import pytest
 
+from gentroutils.io.gcs import CompositeUploader
 from gentroutils.io.transfer import PolarsDataFrameToGCSTransferableObject
 
 
@@ -21,27 +22,41 @@ class TestPolarsDataFrameToGCSTransferableObject:
         assert obj.destination == "gs://test-bucket/data.tsv"
 
     @pytest.mark.asyncio
-    async def test_transfer(self):
-        """Test the transfer method with mocked DataFrame write_csv operation."""
-        # Create a mock DataFrame
-        mock_df = MagicMock(spec=pl.DataFrame)
+    @patch("gentroutils.io.transfer.polars_to_gcs.GCSPath")
+    async def test_transfer(self, mock_gcs_path, df):
+        """Test that the DataFrame is serialized as a TSV and uploaded to the destination."""
+        obj = PolarsDataFrameToGCSTransferableObject(source=df, destination="gs://test-bucket/output.tsv")
 
-        # Create the transferable object
-        obj = PolarsDataFrameToGCSTransferableObject(source=mock_df, destination="gs://test-bucket/output.tsv")
+        await obj.transfer()
+
+        mock_gcs_path.assert_called_once_with("gs://test-bucket/output.tsv")
+        blob = mock_gcs_path.return_value.blob.return_value
+        blob.upload_from_string.assert_called_once_with(b"col1\tcol2\n1\ta\n2\tb\n3\tc\n")
+
+    @pytest.mark.asyncio
+    @patch("gentroutils.io.transfer.polars_to_gcs.GCSPath")
+    async def test_transfer_composite(self, mock_gcs_path, df):
+        """Test that the serialized DataFrame is uploaded by the upload engine of the batch."""
+        uploader = MagicMock(spec=CompositeUploader)
+        obj = PolarsDataFrameToGCSTransferableObject(
+            source=df, destination="gs://test-bucket/output.tsv", uploader=uploader
+        )
 
-        # Execute the transfer
         await obj.transfer()
 
-        # Verify the write_csv method was called with correct destination
-        mock_df.write_csv.assert_called_once_with("gs://test-bucket/output.tsv", separator="\t", include_header=True)
+        blob = mock_gcs_path.return_value.blob.return_value
+        uploader.upload.assert_called_once_with(blob, b"col1\tcol2\n1\ta\n2\tb\n3\tc\n")
 
     @pytest.mark.asyncio
-    async def test_transfer_current_implementation(self, df):
-        """Test transfer with current implementation (direct write_csv call)."""
-        with patch.object(df, "write_csv") as mock_write_csv:
-            obj = PolarsDataFrameToGCSTransferableObject(source=df, destination="gs://test-bucket/study_data.tsv")
-
-            await obj.transfer()
-            mock_write_csv.assert_called_once_with(
-                "gs://test-bucket/study_data.tsv", separator="\t", include_header=True
-            )
+    @patch("gentroutils.io.transfer.polars_to_gcs.GCSPath")
+    async def test_transfer_metadata(self, mock_gcs_path, df):
+        """Test that the metadata is uploaded together with the object."""
+        obj = PolarsDataFrameToGCSTransferableObject(
+            source=df, destination="gs://test-bucket/output.tsv", metadata={"key": "value"}
+        )
+
+        await obj.transfer()
+
+        blob = mock_gcs_path.return_value.blob.return_value
+        assert blob.metadata == {"key": "value"}
+        blob.upload_from_string.assert_called_once()
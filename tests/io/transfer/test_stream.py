@@ -0,0 +1,33 @@
+"""Test streaming transfers."""
+
+import pytest
+
+from gentroutils.errors import GentroutilsError
+from gentroutils.io.transfer import StreamTransferableObject
+
+
+class TestStreamTransferableObject:
+    def test_validation_success(self):
+        obj = StreamTransferableObject(source="ftp://example.com/file.txt", destination="/data/file.txt")
+        assert obj.source == "ftp://example.com/file.txt"
+        assert obj.destination == "/data/file.txt"
+
+    @pytest.mark.parametrize(
+        ("source", "destination", "expected_error"),
+        [
+            pytest.param("s3://bucket/file.txt", "/data/file.txt", "Unsupported URL scheme", id="invalid_source"),
+            pytest.param("gs://bucket/file.txt", "gs://bucket/", "File name is missing", id="invalid_destination"),
+        ],
+    )
+    def test_validation_failure(self, source, destination, expected_error):
+        with pytest.raises(GentroutilsError, match=expected_error):
+            StreamTransferableObject(source=source, destination=destination)
+
+    @pytest.mark.asyncio
+    async def test_transfer(self, tmp_path):
+        (tmp_path / "source.txt").write_bytes(b"x" * 2500)
+        obj = StreamTransferableObject(
+            source=str(tmp_path / "source.txt"), destination=f"file://{tmp_path}/destination.txt", chunk_size=1000
+        )
+        await obj.transfer()
+        assert (tmp_path / "destination.txt").read_bytes() == b"x" * 2500
@@ -0,0 +1,68 @@
+"""Tests for the associations partitioning."""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from gentroutils.parsers.associations import (
+    AssociationsPartition,
+    AssociationsSchema,
+    chromosome,
+    partition_associations,
+    study_bucket,
+)
+
+
+@pytest.fixture
+def associations_file(tmp_path: Path) -> Path:
+    """Fixture with the associations TSV, including haplotype and missing chromosomes."""
+    path = tmp_path / "associations.tsv"
+    pl.DataFrame({
+        "PUBMEDID": ["1", "2", "3", "4", "5"],
+        AssociationsSchema.CHR_ID: ["1", "1", "X", "1 x 2", ""],
+        "CHR_POS": ["100", "200", "300", "400", ""],
+        "P-VALUE": ["1E-8", "2E-9", "3E-10", "4E-11", "5E-12"],
+        AssociationsSchema.STUDY_ACCESSION: ["GCST000001", "GCST000005", "GCST000001", "GCST000002", "GCST000003"],
+    }).write_csv(path, separator="\t")
+    return path
+
+
+@pytest.mark.parametrize(
+    ("chr_id", "expected"),
+    [
+        pytest.param("1", "1", id="autosome"),
+        pytest.param(" X", "X", id="sex_chromosome"),
+        pytest.param("1 x 2", "NA", id="haplotype"),
+        pytest.param("1;1", "NA", id="multiple"),
+        pytest.param(None, "NA", id="missing"),
+    ],
+)
+def test_chromosome(chr_id: str | None, expected: str) -> None:
+    """Test the normalisation of the chromosome partition key."""
+    assert pl.DataFrame({"c": [chr_id]}, schema={"c": pl.String}).select(chromosome("c")).item() == expected
+
+
+def test_study_bucket() -> None:
+    """Test that the study bucket only depends on the numeric part of the accession."""
+    buckets = pl.DataFrame({"s": ["GCST000001", "GCST000005", "GCST90000004"]}).select(study_bucket("s", 4))
+    assert buckets[AssociationsPartition.STUDY_BUCKET].to_list() == [1, 1, 0]
+
+
+def test_partition_associations(associations_file: Path, tmp_path: Path) -> None:
+    """Test that the associations are written as a hive partitioned dataset."""
+    dataset = tmp_path / "dataset"
+    partition_associations(associations_file, dataset, study_buckets=4)
+    partitions = sorted(p.parent.relative_to(dataset).as_posix() for p in dataset.rglob("*.parquet"))
+    assert partitions == [
+        "chromosome=1/studyBucket=1",
+        "chromosome=NA/studyBucket=2",
+        "chromosome=NA/studyBucket=3",
+        "chromosome=X/studyBucket=1",
+    ]
+    result = pl.read_parquet(dataset, hive_partitioning=True)
+    assert result.height == 5
+    lookup = pl.scan_parquet(dataset, hive_partitioning=True).filter(
+        (pl.col(AssociationsPartition.CHROMOSOME) == "1") & (pl.col(AssociationsPartition.STUDY_BUCKET) == 1)
+    )
+    assert lookup.select("P-VALUE").collect().to_series().sort().to_list() == ["1E-8", "2E-9"]
@@ -1,16 +1,30 @@
 """Tests for curation."""
 
+import gzip
+import importlib.metadata
+import os
+import threading
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import polars as pl
 import pytest
 
 from gentroutils.errors import GentroutilsError
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.io.gcs import GCSGlob, ListingShard
+from gentroutils.parsers import curation as curation_module
 from gentroutils.parsers.curation import (
+    INDEX_FULL_LISTING_METADATA_KEY,
+    CuratedStudyStatus,
     CurationSchema,
     DownloadStudiesSchema,
+    GCSSummaryStatisticsFileCrawler,
     GWASCatalogCuration,
+    SummaryStatisticsIndexSchema,
+    SummaryStatisticsProbeSchema,
     SyncedSummaryStatisticsSchema,
 )
 
@@ -156,6 +170,109 @@ class TestGwasCatalogCuration:
 
         assert result.filter(pl.col("isCurated")).shape[0] == 4, "There should be 4 curated studies."
 
+    def test_result_dtypes(
+        self,
+        curation_data: pl.DataFrame,
+        studies_data: pl.DataFrame,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that the low cardinality columns of the result are encoded as categoricals."""
+        result = GWASCatalogCuration(
+            previous_curation=curation_data,
+            studies=studies_data,
+            synced=synced_data,
+        ).result
+        assert result.schema["status"] == CuratedStudyStatus.dtype(), "Status should be an enum."
+        for column in CurationSchema.categorical_columns():
+            assert result.schema[column] == pl.Categorical, f"{column} should be categorical."
+        assert result.schema[CurationSchema.STUDY_ID] == pl.String, "Study ids are unique and stay as strings."
+
+    def test_delta(
+        self,
+        curation_data: pl.DataFrame,
+        studies_data: pl.DataFrame,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that the delta holds only the added and removed studies when the previous status is unknown."""
+        delta = GWASCatalogCuration(
+            previous_curation=curation_data,
+            studies=studies_data,
+            synced=synced_data,
+        ).delta
+        assert delta.columns == CurationSchema.delta_columns()
+        assert delta.select("studyId", "status", "previousStatus").rows() == [
+            ("GCST000004", "removed", "curated"),
+            ("GCST000005", "to_curate", None),
+            ("GCST000006", "no_summary_statistics", None),
+        ]
+
+    def test_result_with_probes(
+        self,
+        curation_data: pl.DataFrame,
+        studies_data: pl.DataFrame,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that the probed fields are added to the result and the delta of the probed studies."""
+        probes = pl.DataFrame(
+            [("GCST000005", "variant_id,p_value", 100, 1000, True)],
+            schema=SummaryStatisticsProbeSchema.schema(),
+            orient="row",
+        )
+        curation = GWASCatalogCuration(curation_data, studies_data, synced_data, probes)
+        assert curation.result.columns == [*CurationSchema.extended_columns(), *SummaryStatisticsProbeSchema.columns()]
+        assert curation.result.filter(pl.col(SummaryStatisticsProbeSchema.IS_COMPLETE).is_not_null())[
+            CurationSchema.STUDY_ID
+        ].to_list() == ["GCST000005"]
+        assert curation.delta.columns == [*CurationSchema.delta_columns(), *SummaryStatisticsProbeSchema.columns()]
+        assert curation.delta.filter(pl.col(CurationSchema.STUDY_ID) == "GCST000005").select(
+            SummaryStatisticsProbeSchema.columns()
+        ).row(0) == ("variant_id,p_value", 100, 1000, True)
+
+    def test_delta_with_previous_status(
+        self,
+        curation_data: pl.DataFrame,
+        studies_data: pl.DataFrame,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that the studies keeping their previous status are not part of the delta."""
+        previous_curation = curation_data.with_columns(
+            pl.Series("status", ["curated", "to_curate", "no_summary_statistics", "removed"])
+        )
+        curation = GWASCatalogCuration(
+            previous_curation=previous_curation,
+            studies=studies_data,
+            synced=synced_data,
+        )
+        # GCST000002 is still waiting for its curation, GCST000003 got its summary statistics synced since.
+        assert curation.result.filter(pl.col("studyId").is_in(["GCST000002", "GCST000003"]))["status"].to_list() == [
+            "to_curate",
+            "to_curate",
+        ]
+        assert curation.delta.select("studyId", "status", "previousStatus").rows() == [
+            ("GCST000003", "to_curate", "no_summary_statistics"),
+            ("GCST000005", "to_curate", None),
+            ("GCST000006", "no_summary_statistics", None),
+        ]
+
+    def test_result_no_sumstats_still_missing(
+        self,
+        curation_data: pl.DataFrame,
+        studies_data: pl.DataFrame,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that a study without synced summary statistics keeps its status and is not part of the delta."""
+        waiting = curation_data.head(1).with_columns(
+            pl.lit("GCST000006").alias("studyId"), pl.lit(False).alias("isCurated")
+        )
+        previous_curation = pl.concat([curation_data, waiting]).with_columns(
+            pl.Series("status", ["curated", "curated", "curated", "removed", "no_summary_statistics"])
+        )
+        curation = GWASCatalogCuration(previous_curation, studies_data, synced_data)
+        assert curation.result.filter(pl.col("studyId") == "GCST000006")["status"].to_list() == [
+            "no_summary_statistics"
+        ]
+        assert curation.delta["studyId"].to_list() == ["GCST000005"]
+
     @patch("gentroutils.parsers.curation.GCSSummaryStatisticsFileCrawler")
     def test_constructor_from_prev_curation(
         self,
@@ -166,7 +283,7 @@ class TestGwasCatalogCuration:
     ) -> None:
         """Test constructor from previous curation and studies."""
         mock_crawler_instance = MagicMock()
-        mock_crawler_instance.crawl = MagicMock(return_value=synced_data)
+        mock_crawler_instance.crawled = MagicMock(return_value=synced_data)
         crawl.return_value = mock_crawler_instance
         curation = GWASCatalogCuration.from_prev_curation(
             prev_curation_file,
@@ -178,6 +295,161 @@ class TestGwasCatalogCuration:
         assert curation.studies.shape[0] == 5, "Studies should have 5 rows."
         assert curation.synced.shape[0] == 4, "Synced data should have 4 rows."
 
+    @patch("gentroutils.parsers.curation.GCSSummaryStatisticsFileCrawler")
+    def test_constructor_from_prev_curation_probe(
+        self,
+        crawl: MagicMock,
+        prev_curation_file: str,
+        downloaded_studies_file: str,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that only the new studies with synced summary statistics are probed."""
+        crawl.return_value.crawled.return_value = synced_data
+        crawl.return_value.probe.return_value = pl.DataFrame(schema=SummaryStatisticsProbeSchema.schema())
+        curation = GWASCatalogCuration.from_prev_curation(
+            prev_curation_file,
+            downloaded_studies_file,
+            "gs://fake-bucket/path/*.h.tsv.gz",
+            probe=True,
+            max_concurrent_probes=4,
+        )
+        crawl.return_value.probe.assert_called_once_with(["GCST000005"], max_workers=4)
+        assert curation.probes is crawl.return_value.probe.return_value
+
+    @patch("gentroutils.parsers.curation.GCSSummaryStatisticsFileCrawler")
+    def test_constructor_from_prev_curation_gcs(
+        self,
+        crawl: MagicMock,
+        prev_curation_file: str,
+        downloaded_studies_file: str,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that the GCS inputs are downloaded once each with the shared storage client."""
+        crawl.return_value.crawled.return_value = synced_data
+        sources = {"gs://bucket/curation.tsv": prev_curation_file, "gs://bucket/studies.tsv": downloaded_studies_file}
+        with patch(
+            "gentroutils.parsers.curation.read_object", side_effect=lambda uri: Path(sources[uri]).read_bytes()
+        ) as read_object:
+            curation = GWASCatalogCuration.from_prev_curation(
+                "gs://bucket/curation.tsv", "gs://bucket/studies.tsv", "gs://fake-bucket/path/*.h.tsv.gz"
+            )
+        assert sorted(c.args for c in read_object.call_args_list) == [
+            ("gs://bucket/curation.tsv",),
+            ("gs://bucket/studies.tsv",),
+        ]
+        expected = GWASCatalogCuration.from_prev_curation(
+            prev_curation_file, downloaded_studies_file, "gs://fake-bucket/path/*.h.tsv.gz"
+        )
+        assert curation.studies.equals(expected.studies)
+        assert curation.previous_curation.equals(expected.previous_curation)
+
+    @patch("gentroutils.parsers.curation.GCSSummaryStatisticsFileCrawler")
+    def test_constructor_from_prev_curation_cache(
+        self,
+        crawl: MagicMock,
+        prev_curation_file: str,
+        downloaded_studies_file: str,
+        synced_data: pl.DataFrame,
+        tmp_path: Path,
+    ) -> None:
+        """Test that the parsed inputs are cached as Parquet and reused while the sources are unchanged."""
+        crawl.return_value.crawled.return_value = synced_data
+        cache_path = (tmp_path / "cache").as_posix()
+        first = GWASCatalogCuration.from_prev_curation(
+            prev_curation_file, downloaded_studies_file, "gs://fake-bucket/path/*.h.tsv.gz", cache_path=cache_path
+        )
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 2, "Both inputs should be cached."
+
+        with patch("gentroutils.parsers.curation.pl.read_csv") as read_csv:
+            second = GWASCatalogCuration.from_prev_curation(
+                prev_curation_file, downloaded_studies_file, "gs://fake-bucket/path/*.h.tsv.gz", cache_path=cache_path
+            )
+        read_csv.assert_not_called()
+        assert second.studies.equals(first.studies)
+        assert second.previous_curation.equals(first.previous_curation)
+
+        # Rewriting the source invalidates its cached copy
+        Path(downloaded_studies_file).write_text(Path(downloaded_studies_file).read_text() + "\n")
+        os.utime(downloaded_studies_file, ns=(0, 0))
+        GWASCatalogCuration.from_prev_curation(
+            prev_curation_file, downloaded_studies_file, "gs://fake-bucket/path/*.h.tsv.gz", cache_path=cache_path
+        )
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 3, "The changed studies should be cached again."
+
+    @patch("gentroutils.parsers.curation.GCSSummaryStatisticsFileCrawler")
+    def test_constructor_from_prev_curation_concurrent(
+        self,
+        crawl: MagicMock,
+        prev_curation_file: str,
+        downloaded_studies_file: str,
+        synced_data: pl.DataFrame,
+    ) -> None:
+        """Test that the crawl and both reads are in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+        read_through_cache = curation_module._read_through_cache
+
+        def crawl_in_barrier() -> pl.DataFrame:
+            barrier.wait()
+            return synced_data
+
+        def read_in_barrier(*args: Any) -> pl.DataFrame:
+            barrier.wait()
+            return read_through_cache(*args)
+
+        crawl.return_value.crawled.side_effect = crawl_in_barrier
+        with patch("gentroutils.parsers.curation._read_through_cache", side_effect=read_in_barrier):
+            curation = GWASCatalogCuration.from_prev_curation(
+                prev_curation_file, downloaded_studies_file, "gs://fake-bucket/path/*.h.tsv.gz"
+            )
+        assert curation.synced is synced_data
+        assert curation.studies.shape[0] == 5
+
+    @patch("gentroutils.parsers.curation._source_generation", return_value="1234")
+    @patch("gentroutils.parsers.curation.GCSSummaryStatisticsFileCrawler")
+    def test_constructor_from_prev_curation_artifacts(
+        self,
+        crawl: MagicMock,
+        source_generation: MagicMock,
+        prev_curation_file: str,
+        downloaded_studies_file: str,
+        synced_data: pl.DataFrame,
+        tmp_path: Path,
+    ) -> None:
+        """Test that the local copy registered for the GCS object is read in place of the object."""
+        crawl.return_value.crawled.return_value = synced_data
+        artifacts = ArtifactCache(tmp_path / "artifacts")
+        artifacts.register("gs://bucket/studies.tsv", 1234, Path(downloaded_studies_file).read_bytes())
+        curation = GWASCatalogCuration.from_prev_curation(
+            prev_curation_file, "gs://bucket/studies.tsv", "gs://fake-bucket/path/*.h.tsv.gz", artifacts=artifacts
+        )
+        assert curation.studies.shape[0] == 5
+
+    def test_fingerprint(self, prev_curation_file: str, downloaded_studies_file: str, tmp_path: Path) -> None:
+        """Test that the fingerprint only changes with the inputs."""
+        crawler = MagicMock()
+        crawler.listing_digest.return_value = "digest"
+        fingerprint = GWASCatalogCuration.fingerprint(prev_curation_file, downloaded_studies_file, crawler)
+        crawler.crawled.assert_called_once()
+        assert fingerprint == GWASCatalogCuration.fingerprint(prev_curation_file, downloaded_studies_file, crawler)
+        assert fingerprint != GWASCatalogCuration.fingerprint(
+            prev_curation_file, downloaded_studies_file, crawler, probe=True
+        )
+
+        with patch("gentroutils.parsers.curation.CURATION_VERSION", 0):
+            assert fingerprint != GWASCatalogCuration.fingerprint(prev_curation_file, downloaded_studies_file, crawler)
+        with patch("gentroutils.parsers.curation.importlib.metadata.version", return_value="0.0.0"):
+            assert fingerprint != GWASCatalogCuration.fingerprint(prev_curation_file, downloaded_studies_file, crawler)
+        not_installed = importlib.metadata.PackageNotFoundError("gentroutils")
+        with patch("gentroutils.parsers.curation.importlib.metadata.version", side_effect=not_installed):
+            unknown = GWASCatalogCuration.fingerprint(prev_curation_file, downloaded_studies_file, crawler)
+        assert unknown is not None
+        assert unknown != fingerprint
+
+        crawler.listing_digest.return_value = "new summary statistics"
+        assert fingerprint != GWASCatalogCuration.fingerprint(prev_curation_file, downloaded_studies_file, crawler)
+        missing = (tmp_path / "missing.tsv").as_posix()
+        assert GWASCatalogCuration.fingerprint(prev_curation_file, missing, crawler) is None
+
     @patch("gentroutils.parsers.curation.GCSSummaryStatisticsFileCrawler")
     def test_empty_previous_curation(
         self,
@@ -257,3 +529,151 @@ class TestSyncedSummaryStatisticsSchema:
         assert all(col in synced_data.columns for col in SyncedSummaryStatisticsSchema.columns()), (
             "All SyncedSummaryStatisticsSchema columns should be present in the synced DataFrame."
         )
+
+
+class TestGCSSummaryStatisticsFileCrawler:
+    """Tests for GCSSummaryStatisticsFileCrawler."""
+
+    @staticmethod
+    def _blob(name: str, generation: int = 1) -> dict[str, str]:
+        """Create a listed object resource."""
+        return {
+            "name": name,
+            "size": "100",
+            "generation": str(generation),
+            "updated": f"2025-01-0{generation}T00:00:00Z",
+        }
+
+    @pytest.fixture
+    def lister(self) -> Iterator[MagicMock]:
+        """Patched lister returning a page of blobs per accession range shard, starting at the requested offset."""
+        blobs = [
+            self._blob("raw/GCST1-GCST2/GCST000001/harmonised/GCST000001.h.tsv.gz"),
+            self._blob("raw/GCST1-GCST2/GCST000002/harmonised/GCST000002.h.tsv.gz"),
+            self._blob("raw/GCST1-GCST2/GCST000002/harmonised/GCST000002_copy.h.tsv.gz"),
+        ]
+        glob = GCSGlob("bucket", "raw/**.h.tsv.gz")
+
+        def map_pages(func, start_offset=None):
+            shards = sorted({b["name"].rsplit("/", 3)[0] + "/" for b in blobs})
+            for prefix in shards:
+                offset = start_offset(ListingShard(glob, prefix)) if start_offset is not None else None
+                page = [b for b in blobs if b["name"].startswith(prefix) and (offset is None or b["name"] >= offset)]
+                yield func(glob, page)
+
+        with patch("gentroutils.parsers.curation.GCSGlobLister") as mock:
+            mock.return_value.map_pages.side_effect = map_pages
+            mock.blobs = blobs
+            yield mock
+
+    def test_crawl(self, lister: MagicMock) -> None:
+        """Test crawling multiple globs into the synced summary statistics frame."""
+        globs = ["gs://bucket/raw/**.h.tsv.gz", "gs://bucket/other/**.h.tsv.gz"]
+        crawler = GCSSummaryStatisticsFileCrawler(globs, max_workers=4)
+        result = crawler.crawl()
+
+        lister.assert_called_once_with(globs, max_workers=4)
+        assert sorted(result[SyncedSummaryStatisticsSchema.STUDY_ID].to_list()) == ["GCST000001", "GCST000002"]
+        assert result[SyncedSummaryStatisticsSchema.SYNCED].all()
+        assert result[SyncedSummaryStatisticsSchema.FILE_PATH].str.starts_with("gs://bucket/raw/").all()
+
+    def test_crawl_incremental_index(self, lister: MagicMock, tmp_path: Path) -> None:
+        """Test that the next crawls only list each shard from its last indexed object."""
+        index_path = (tmp_path / "index" / "sumstats.parquet").as_posix()
+        crawler = GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz", index_path=index_path)
+        crawler.crawl()
+        index = pl.read_parquet(index_path)
+        assert index.columns == list(SummaryStatisticsIndexSchema.schema().names())
+        assert index.height == 3
+        assert INDEX_FULL_LISTING_METADATA_KEY in pl.read_parquet_metadata(index_path)
+
+        # New studies are published past the watermark of their shard and in a new shard, the sumstats of an
+        # older accession are synced late below the watermark.
+        lister.blobs.append(self._blob("raw/GCST1-GCST2/GCST000003/harmonised/GCST000003.h.tsv.gz"))
+        lister.blobs.append(self._blob("raw/GCST3-GCST4/GCST000004/harmonised/GCST000004.h.tsv.gz"))
+        lister.blobs.append(self._blob("raw/GCST1-GCST2/GCST000000/harmonised/GCST000000.h.tsv.gz"))
+        offsets = []
+        wrapped = lister.return_value.map_pages.side_effect
+
+        def map_pages(func, start_offset=None):
+            offsets.append(start_offset)
+            return wrapped(func, start_offset)
+
+        lister.return_value.map_pages.side_effect = map_pages
+        result = crawler.crawl()
+
+        assert lister.call_args.kwargs.get("fields") is None
+        assert offsets[0](ListingShard(GCSGlob("bucket", "raw/**.h.tsv.gz"), "raw/GCST1-GCST2/")) == (
+            "raw/GCST1-GCST2/GCST000002/harmonised/GCST000002_copy.h.tsv.gz"
+        )
+        assert offsets[0](ListingShard(GCSGlob("bucket", "raw/**.h.tsv.gz"), "raw/GCST3-GCST4/")) is None
+        assert sorted(result[SyncedSummaryStatisticsSchema.STUDY_ID].to_list()) == [
+            "GCST000001",
+            "GCST000002",
+            "GCST000003",
+            "GCST000004",
+        ]
+        assert pl.read_parquet(index_path).height == 5
+
+        # The late sync is picked up once the index is older than the refresh period.
+        GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz", index_path=index_path, refresh_days=0).crawl()
+        assert offsets[-1] is None
+        assert pl.read_parquet(index_path).height == 6
+
+    def test_watermarks_shallow_shard(self) -> None:
+        """Test that the watermark of a shallow shard ignores the objects nested under its prefix."""
+        index = pl.DataFrame({
+            SummaryStatisticsIndexSchema.FILE_PATH: ["gs://bucket/raw/a.h.tsv.gz", "gs://bucket/raw/z/b.h.tsv.gz"]
+        })
+        watermark = GCSSummaryStatisticsFileCrawler._watermarks(index)
+        glob = GCSGlob("bucket", "raw/*.h.tsv.gz")
+        assert watermark(ListingShard(glob, "raw/", shallow=True)) == "raw/a.h.tsv.gz"
+        assert watermark(ListingShard(glob, "raw/")) == "raw/z/b.h.tsv.gz"
+        assert watermark(ListingShard(GCSGlob("other", "raw/*.h.tsv.gz"), "raw/")) is None
+
+    def test_crawl_full_refresh(self, lister: MagicMock, tmp_path: Path) -> None:
+        """Test that the full refresh lists all objects even if the index exists."""
+        index_path = (tmp_path / "sumstats.parquet").as_posix()
+        GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz", index_path=index_path).crawl()
+        GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz", index_path=index_path, full_refresh=True).crawl()
+        assert lister.call_args.kwargs.get("fields") is None
+        assert pl.read_parquet(index_path).height == 3
+
+    def test_probe(self, lister: MagicMock) -> None:
+        """Test that the files of the requested studies are probed with their listed size."""
+        compressed = gzip.compress(b"variant_id\tp_value\nrs1\t0.1\n")
+        lister.blobs[1]["size"] = str(len(compressed))
+        crawler = GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz")
+        crawler.crawl()
+        with patch("gentroutils.io.gcs.probe.gcs_client") as client:
+            blob = client.return_value.bucket.return_value.blob.return_value
+            blob.download_as_bytes.side_effect = lambda start, end=None, **kwargs: compressed[start : end and end + 1]
+            probes = crawler.probe(["GCST000002", "GCST000003"], max_workers=2)
+
+        assert probes.schema == SummaryStatisticsProbeSchema.schema()
+        assert probes.rows() == [("GCST000002", "variant_id,p_value", len(compressed), 27, None)]
+        client.return_value.bucket.return_value.blob.assert_called_once_with(
+            "raw/GCST1-GCST2/GCST000002/harmonised/GCST000002.h.tsv.gz"
+        )
+
+    def test_listing_digest(self, lister: MagicMock) -> None:
+        """Test that the listing is crawled once and its digest follows the generations of the files."""
+        crawler = GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz")
+        assert crawler.crawled() is crawler.crawled()
+        lister.return_value.map_pages.assert_called_once()
+        digest = crawler.listing_digest()
+        same = GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz")
+        same.crawled()
+        assert same.listing_digest() == digest
+
+        lister.blobs[0] = self._blob(lister.blobs[0]["name"], generation=2)
+        changed = GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz")
+        changed.crawled()
+        assert changed.listing_digest() != digest
+
+    def test_crawl_empty_listing(self, lister: MagicMock) -> None:
+        """Test that an empty listing still returns the synced summary statistics columns."""
+        lister.return_value.map_pages.side_effect = lambda func, start_offset=None: iter([])
+        result = GCSSummaryStatisticsFileCrawler("gs://bucket/raw/**.h.tsv.gz").crawl()
+        assert result.is_empty()
+        assert result.columns == SyncedSummaryStatisticsSchema.columns()
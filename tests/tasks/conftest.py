@@ -53,7 +53,7 @@ class TestGwasCatalogReleaseInfo:
         assert release_info.gene_build == "GRCh38.p13"
 
     @pytest.mark.asyncio
-    @patch("gentroutils.tasks.aiohttp.ClientSession")
+    @patch("aiohttp.ClientSession")
     async def test_fetch_release_info(self, mock_session):
         """Test fetching release information from a URI."""
         mock_response = MagicMock()
@@ -1,7 +1,7 @@
 """Test cases for the Crawl task."""
 
 from datetime import date
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, call, mock_open, patch
 
 import pytest
 from otter.task.model import State, TaskContext
@@ -56,9 +56,10 @@ def crawl_spec_no_promote():
 
 
 @pytest.fixture
-def mock_task_context():
+def mock_task_context(tmp_path):
     """Return a mock TaskContext."""
     context = Mock(spec=TaskContext)
+    context.config = Mock(work_path=tmp_path)
     # Set up required attributes that the otter framework expects
     context.state = State.PENDING_RUN
     context.abort = Mock()
@@ -120,14 +121,14 @@ class TestCrawlTask:
     """Test cases for the Crawl task."""
 
     @patch("gentroutils.tasks.crawl.GwasCatalogReleaseInfo.from_uri")
-    @patch("gentroutils.tasks.crawl.get_remote_storage")
+    @patch("gentroutils.tasks.crawl.GCSPath")
     @patch("tempfile.NamedTemporaryFile")
     @patch("builtins.open", new_callable=mock_open)
     def test_crawl_task_run_success(
         self,
         mock_open_file,
         mock_temp_file,
-        mock_get_storage,
+        mock_gcs_path,
         mock_from_uri,
         crawl_spec,
         mock_task_context,
@@ -141,8 +142,6 @@ class TestCrawlTask:
         mock_temp_file.return_value.__enter__.return_value = mock_temp_file_instance
 
         mock_from_uri.return_value = mock_gwas_catalog_release_info
-        mock_storage = Mock()
-        mock_get_storage.return_value = mock_storage
 
         # Create and run task
         task = Crawl(crawl_spec, mock_task_context)
@@ -158,18 +157,24 @@ class TestCrawlTask:
         handle.write.assert_called_once()
         handle.flush.assert_called_once()
 
-        # Verify storage upload calls
-        assert mock_get_storage.call_count == 2  # Two destinations when promote=True
-        assert mock_storage.upload.call_count == 2
-
-    @patch("gentroutils.tasks.crawl.get_remote_storage")
+        # Verify the uploads through the shared storage client
+        assert [c.args for c in mock_gcs_path.call_args_list] == [
+            ("gs://test-bucket/gwas/20231001/stats.json",),
+            ("gs://test-bucket/gwas/latest/stats.json",),
+        ]  # Two destinations when promote=True
+        assert mock_gcs_path.return_value.blob.return_value.upload_from_filename.call_args_list == [
+            call(temp_file_path),
+            call(temp_file_path),
+        ]
+
+    @patch("gentroutils.tasks.crawl.GCSPath")
     @patch("tempfile.NamedTemporaryFile")
     @patch("builtins.open", new_callable=mock_open)
     def test_write_release_info(
         self,
         mock_open_file,
         mock_temp_file,
-        mock_get_storage,
+        mock_gcs_path,
         crawl_spec,
         mock_task_context,
         mock_gwas_catalog_release_info,
@@ -181,9 +186,6 @@ class TestCrawlTask:
         mock_temp_file_instance.name = temp_file_path
         mock_temp_file.return_value.__enter__.return_value = mock_temp_file_instance
 
-        mock_storage = Mock()
-        mock_get_storage.return_value = mock_storage
-
         # Create task and call method
         task = Crawl(crawl_spec, mock_task_context)
         result = task._write_release_info(mock_gwas_catalog_release_info)
@@ -1,13 +1,15 @@
 """Test cases for the Curation task."""
 
 from datetime import date
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import polars as pl
 import pytest
 from otter.task.model import State, TaskContext
 
 from gentroutils.errors import GentroutilsError
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.parsers.curation import CURATION_FINGERPRINT_METADATA_KEY
 from gentroutils.tasks.curation import Curation, CurationSpec
 
 
@@ -68,11 +70,22 @@ class TestCurationSpec:
 class TestCurationTask:
     """Test cases for the Curation task."""
 
+    @patch("gentroutils.io.gcs.previous_release", return_value=None)
+    @patch("gentroutils.io.gcs.object_metadata", return_value=None)
     @patch("gentroutils.tasks.curation.date")
-    @patch("gentroutils.tasks.curation.GWASCatalogCuration")
-    @patch("gentroutils.tasks.curation.PolarsDataFrameToGCSTransferableObject")
-    @patch("gentroutils.tasks.curation.TransferManager")
-    def test_curation_run(self, mock_transfer_manager, mock_transferable_object, mock_gwas_catalog_curation, mock_date):
+    @patch("gentroutils.parsers.curation.GWASCatalogCuration")
+    @patch("gentroutils.io.transfer.polars_to_gcs.PolarsDataFrameToGCSTransferableObject")
+    @patch("gentroutils.transfer.TransferManager")
+    def test_curation_run(
+        self,
+        mock_transfer_manager,
+        mock_transferable_object,
+        mock_gwas_catalog_curation,
+        mock_date,
+        mock_object_metadata,
+        mock_previous_release,
+        tmp_path,
+    ):
         """Test Curation task run method with mocked dataframes."""
         # Setup mocks
         mock_today = date(2023, 10, 1)
@@ -116,6 +129,7 @@ class TestCurationTask:
         )
 
         mock_context = MagicMock(spec=TaskContext)
+        mock_context.config = MagicMock(work_path=tmp_path)
         # Set up required attributes that the otter framework expects
         mock_context.state = State.PENDING_RUN
         mock_context.abort = MagicMock()
@@ -136,6 +150,14 @@ class TestCurationTask:
             "gs://test-bucket/previous_curation.tsv",
             "gs://test-bucket/studies.tsv",
             "gs://test-bucket/summary_statistics/*.txt",
+            summary_statistics_index=None,
+            full_refresh=False,
+            refresh_days=7,
+            cache_path=None,
+            artifacts=ArtifactCache(tmp_path / "artifacts"),
+            probe=False,
+            max_concurrent_probes=16,
+            crawler=ANY,
         )
 
         # Verify substituted destinations are correct
@@ -157,12 +179,21 @@ class TestCurationTask:
         mock_transfer_manager.assert_called_once()
         mock_transfer_manager_instance.transfer.assert_called_once_with([mock_transfer_obj1, mock_transfer_obj2])
 
+    @patch("gentroutils.io.gcs.previous_release", return_value=None)
+    @patch("gentroutils.io.gcs.object_metadata", return_value=None)
     @patch("gentroutils.tasks.curation.date")
-    @patch("gentroutils.tasks.curation.GWASCatalogCuration")
-    @patch("gentroutils.tasks.curation.PolarsDataFrameToGCSTransferableObject")
-    @patch("gentroutils.tasks.curation.TransferManager")
+    @patch("gentroutils.parsers.curation.GWASCatalogCuration")
+    @patch("gentroutils.io.transfer.polars_to_gcs.PolarsDataFrameToGCSTransferableObject")
+    @patch("gentroutils.transfer.TransferManager")
     def test_curation_run_without_promote(
-        self, mock_transfer_manager, mock_transferable_object, mock_gwas_catalog_curation, mock_date
+        self,
+        mock_transfer_manager,
+        mock_transferable_object,
+        mock_gwas_catalog_curation,
+        mock_date,
+        mock_object_metadata,
+        mock_previous_release,
+        tmp_path,
     ):
         """Test Curation task run method without promote flag."""
         # Setup mocks
@@ -206,6 +237,7 @@ class TestCurationTask:
         )
 
         mock_context = MagicMock(spec=TaskContext)
+        mock_context.config = MagicMock(work_path=tmp_path)
         # Set up required attributes that the otter framework expects
         mock_context.state = State.PENDING_RUN
         mock_context.abort = MagicMock()
@@ -226,3 +258,168 @@ class TestCurationTask:
 
         # Verify transfer was called with single object
         mock_transfer_manager_instance.transfer.assert_called_once_with([mock_transfer_obj])
+
+    @patch("gentroutils.io.gcs.previous_release", return_value=None)
+    @patch("gentroutils.io.gcs.object_metadata", return_value=None)
+    @patch("gentroutils.tasks.curation.date")
+    @patch("gentroutils.parsers.curation.GWASCatalogCuration")
+    @patch("gentroutils.io.transfer.polars_to_gcs.PolarsDataFrameToGCSTransferableObject")
+    @patch("gentroutils.transfer.TransferManager")
+    def test_curation_run_with_delta(
+        self,
+        mock_transfer_manager,
+        mock_transferable_object,
+        mock_gwas_catalog_curation,
+        mock_date,
+        mock_object_metadata,
+        mock_previous_release,
+        tmp_path,
+    ):
+        """Test that the curation delta is uploaded next to the full curation."""
+        mock_date.today.return_value = date(2023, 10, 1)
+        mock_curation_instance = MagicMock()
+        mock_gwas_catalog_curation.from_prev_curation.return_value = mock_curation_instance
+
+        curation_spec = CurationSpec(
+            name="test curation",
+            previous_curation="gs://test-bucket/previous_curation.tsv",
+            studies="gs://test-bucket/studies.tsv",
+            destination_template="gs://test-bucket/{release_date}/curation.tsv",
+            delta_destination_template="gs://test-bucket/{release_date}/curation_delta.tsv",
+            summary_statistics_glob="gs://test-bucket/summary_statistics/*.txt",
+            promote=True,
+        )
+        mock_context = MagicMock(spec=TaskContext)
+        mock_context.config = MagicMock(work_path=tmp_path)
+        mock_context.state = State.PENDING_RUN
+        curation_task = Curation(curation_spec, mock_context)
+        curation_task.run()
+
+        calls = [(c.kwargs["source"], c.kwargs["destination"]) for c in mock_transferable_object.call_args_list]
+        assert calls == [
+            (mock_curation_instance.result, "gs://test-bucket/20231001/curation.tsv"),
+            (mock_curation_instance.result, "gs://test-bucket/latest/curation.tsv"),
+            (mock_curation_instance.delta, "gs://test-bucket/20231001/curation_delta.tsv"),
+            (mock_curation_instance.delta, "gs://test-bucket/latest/curation_delta.tsv"),
+        ]
+        assert len(mock_transfer_manager.return_value.transfer.call_args.args[0]) == 4
+
+    def test_curation_spec_delta_requires_release_date_template(self):
+        """Test that the delta destination is validated like the curation destination."""
+        with pytest.raises(GentroutilsError, match="must contain a template for the release date"):
+            CurationSpec(
+                previous_curation="gs://test-bucket/previous_curation.tsv",
+                studies="gs://test-bucket/studies.tsv",
+                destination_template="gs://test-bucket/{release_date}/curation.tsv",
+                delta_destination_template="gs://test-bucket/curation_delta.tsv",
+                summary_statistics_glob="gs://test-bucket/summary_statistics/*.txt",
+            )
+
+    @pytest.fixture
+    def unchanged_task(self, tmp_path) -> Curation:
+        """Promoted curation task skipping the curation of unchanged inputs."""
+        spec = CurationSpec(
+            name="test curation",
+            previous_curation="gs://test-bucket/previous_curation.tsv",
+            studies="gs://test-bucket/studies.tsv",
+            destination_template="gs://test-bucket/{release_date}/curation.tsv",
+            summary_statistics_glob="gs://test-bucket/summary_statistics/*.txt",
+            promote=True,
+        )
+        context = MagicMock(spec=TaskContext)
+        context.config = MagicMock(work_path=tmp_path)
+        context.state = State.PENDING_RUN
+        context.abort = MagicMock()
+        return Curation(spec, context)
+
+    @patch("gentroutils.io.gcs.copy_object")
+    @patch("gentroutils.io.gcs.previous_release", return_value=None)
+    @patch("gentroutils.io.gcs.object_metadata")
+    @patch("gentroutils.tasks.curation.date")
+    @patch("gentroutils.parsers.curation.GWASCatalogCuration")
+    @patch("gentroutils.transfer.TransferManager")
+    def test_curation_run_skips_unchanged(
+        self,
+        mock_transfer_manager,
+        mock_curation,
+        mock_date,
+        mock_metadata,
+        mock_previous_release,
+        mock_copy,
+        unchanged_task,
+    ):
+        """Test that the curation is skipped when every output was built from the same inputs."""
+        mock_date.today.return_value = date(2023, 10, 1)
+        mock_curation.fingerprint.return_value = "abc"
+        mock_metadata.return_value = {CURATION_FINGERPRINT_METADATA_KEY: "abc"}
+
+        unchanged_task.run()
+
+        assert [c.args[0] for c in mock_metadata.call_args_list] == [
+            "gs://test-bucket/20231001/curation.tsv",
+            "gs://test-bucket/latest/curation.tsv",
+        ]
+        mock_curation.from_prev_curation.assert_not_called()
+        mock_transfer_manager.assert_not_called()
+        mock_copy.assert_not_called()
+
+    @patch("gentroutils.io.gcs.copy_object")
+    @patch("gentroutils.io.gcs.previous_release", return_value="20230901")
+    @patch("gentroutils.io.gcs.object_metadata")
+    @patch("gentroutils.tasks.curation.date")
+    @patch("gentroutils.parsers.curation.GWASCatalogCuration")
+    @patch("gentroutils.transfer.TransferManager")
+    def test_curation_run_copies_previous_release(
+        self,
+        mock_transfer_manager,
+        mock_curation,
+        mock_date,
+        mock_metadata,
+        mock_previous_release,
+        mock_copy,
+        unchanged_task,
+    ):
+        """Test that the outputs of the previous release built from the same inputs are copied."""
+        mock_date.today.return_value = date(2023, 10, 1)
+        mock_curation.fingerprint.return_value = "abc"
+        mock_metadata.side_effect = lambda uri: (
+            {CURATION_FINGERPRINT_METADATA_KEY: "abc"} if uri == "gs://test-bucket/20230901/curation.tsv" else None
+        )
+
+        unchanged_task.run()
+
+        assert [c.args for c in mock_copy.call_args_list] == [
+            ("gs://test-bucket/20230901/curation.tsv", "gs://test-bucket/20231001/curation.tsv"),
+            ("gs://test-bucket/20230901/curation.tsv", "gs://test-bucket/latest/curation.tsv"),
+        ]
+        mock_curation.from_prev_curation.assert_not_called()
+        mock_transfer_manager.assert_not_called()
+
+    @patch("gentroutils.io.gcs.previous_release", return_value=None)
+    @patch("gentroutils.io.gcs.object_metadata")
+    @patch("gentroutils.tasks.curation.date")
+    @patch("gentroutils.parsers.curation.GWASCatalogCuration")
+    @patch("gentroutils.io.transfer.polars_to_gcs.PolarsDataFrameToGCSTransferableObject")
+    @patch("gentroutils.transfer.TransferManager")
+    def test_curation_run_records_fingerprint(
+        self,
+        mock_transfer_manager,
+        mock_transferable_object,
+        mock_curation,
+        mock_date,
+        mock_metadata,
+        mock_previous_release,
+        unchanged_task,
+    ):
+        """Test that the changed inputs are curated and their fingerprint is recorded on the outputs."""
+        mock_date.today.return_value = date(2023, 10, 1)
+        mock_curation.fingerprint.return_value = "abc"
+        mock_metadata.return_value = {CURATION_FINGERPRINT_METADATA_KEY: "previous"}
+
+        unchanged_task.run()
+
+        mock_curation.from_prev_curation.assert_called_once()
+        assert [c.kwargs["metadata"] for c in mock_transferable_object.call_args_list] == [
+            {CURATION_FINGERPRINT_METADATA_KEY: "abc"}
+        ] * 2
+        mock_transfer_manager.return_value.transfer.assert_called_once()
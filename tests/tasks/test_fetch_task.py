@@ -1,9 +1,13 @@
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 from otter.task.model import State, TaskContext
 
 from gentroutils.errors import GentroutilsError
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.io.downloads import DownloadCache
+from gentroutils.io.gcs import CompositeUploader
 from gentroutils.tasks import GwasCatalogReleaseInfo
 from gentroutils.tasks.fetch import Fetch, FetchSpec
 
@@ -153,13 +157,72 @@ class TestFetchSpec:
         assert len(substituted_sources) == 1
         assert all(i == "https://example.com/2023/10/01/data.json" for i in substituted_sources)
 
+    def test_pattern_limited_to_file_name(self):
+        """Test that the glob pattern is only accepted in the file name of the source."""
+        with pytest.raises(GentroutilsError, match="only supported in the file name"):
+            FetchSpec(
+                source_template="ftp://example.com/*/{release_date}/data.json",
+                destination_template="gs://test-bucket/{release_date}/data.json",
+            )
+
+    def test_substituted_transfers(self, mock_gwas_catalog_release_info):
+        """Test that the pattern matches are transferred to the destinations derived from their names."""
+        fetch_spec = FetchSpec(
+            source_template="ftp://example.com/{release_date}/gwas-catalog-download-*-v1.0.3.?.txt",
+            destination_template="gs://test-bucket/{release_date}/{stem}.tsv",
+            promote=True,
+        )
+        assert fetch_spec.is_pattern
+        filenames = [
+            "README",
+            "gwas-catalog-download-ancestries-v1.0.3.1.txt",
+            "gwas-catalog-download-studies-v1.0.3.1.txt",
+        ]
+        assert fetch_spec.substituted_transfers(mock_gwas_catalog_release_info, filenames) == [
+            (
+                "ftp://example.com/2023/10/01/gwas-catalog-download-ancestries-v1.0.3.1.txt",
+                "gs://test-bucket/20231001/gwas-catalog-download-ancestries-v1.0.3.1.tsv",
+            ),
+            (
+                "ftp://example.com/2023/10/01/gwas-catalog-download-ancestries-v1.0.3.1.txt",
+                "gs://test-bucket/latest/gwas-catalog-download-ancestries-v1.0.3.1.tsv",
+            ),
+            (
+                "ftp://example.com/2023/10/01/gwas-catalog-download-studies-v1.0.3.1.txt",
+                "gs://test-bucket/20231001/gwas-catalog-download-studies-v1.0.3.1.tsv",
+            ),
+            (
+                "ftp://example.com/2023/10/01/gwas-catalog-download-studies-v1.0.3.1.txt",
+                "gs://test-bucket/latest/gwas-catalog-download-studies-v1.0.3.1.tsv",
+            ),
+        ]
+
+    @pytest.mark.parametrize(
+        ("filenames", "expected_error"),
+        [
+            pytest.param(["README"], "No file in the release directory matches", id="no_match"),
+            pytest.param(["studies-v1.txt", "studies-v2.txt"], "needs a {filename} or {stem}", id="not_unique"),
+        ],
+    )
+    def test_substituted_transfers_failure(self, mock_gwas_catalog_release_info, filenames, expected_error):
+        """Test that a pattern must match files with distinct destinations."""
+        fetch_spec = FetchSpec(
+            source_template="ftp://example.com/{release_date}/studies-v*.txt",
+            destination_template="gs://test-bucket/{release_date}/studies.tsv",
+        )
+        with pytest.raises(GentroutilsError, match=expected_error):
+            fetch_spec.substituted_transfers(mock_gwas_catalog_release_info, filenames)
+
 
 class TestFetchTask:
     """Test cases for the Fetch task."""
 
+    @patch("gentroutils.io.gcs.previous_release", return_value=None)
     @patch("gentroutils.tasks.fetch.GwasCatalogReleaseInfo.from_uri")
-    @patch("gentroutils.tasks.fetch.TransferManager")
-    def test_fetch_run(self, mock_tf_manager, mock_from_uri, mock_gwas_catalog_release_info):
+    @patch("gentroutils.transfer.TransferManager")
+    def test_fetch_run(
+        self, mock_tf_manager, mock_from_uri, mock_previous_release, mock_gwas_catalog_release_info, tmp_path
+    ):
         fetch_spec = FetchSpec(
             name="test fetch",
             stats_uri="https://www.ebi.ac.uk/gwas/api/search/stats",
@@ -176,6 +239,7 @@ class TestFetchTask:
         mock_tf_manager_instance.transfer = mock_tf_manager_instance_transfer
 
         mock_context = MagicMock(spec=TaskContext)
+        mock_context.config = MagicMock(work_path=tmp_path)
         # Set up required attributes that the otter framework expects
         mock_context.state = State.PENDING_RUN
         mock_context.abort = MagicMock()
@@ -192,6 +256,7 @@ class TestFetchTask:
 
         # Assert transfer was called once
         mock_tf_manager_instance.transfer.assert_called_once()
+        assert mock_tf_manager.call_args.kwargs["uploader"] == CompositeUploader()
 
         # Get the transferable objects that were passed to transfer
         call_args = mock_tf_manager_instance.transfer.call_args[0][0]
@@ -200,6 +265,82 @@ class TestFetchTask:
         assert call_args[0].destination == "gs://test-bucket/20231001/data.json"
         assert call_args[1].source == "ftp://example.com/2023/10/01/data.json"
         assert call_args[1].destination == "gs://test-bucket/latest/data.json"
+        assert all(obj.artifacts == ArtifactCache(tmp_path / "artifacts") for obj in call_args)
+        assert all(obj.downloads == DownloadCache(tmp_path / "downloads") for obj in call_args)
+        assert all(obj.previous is None for obj in call_args)
+        assert [a.destination for a in task.artifacts] == [obj.destination for obj in call_args]
 
         assert result == task  # Should return self
         assert isinstance(result, Fetch)
+        assert not (tmp_path / "profiles").exists()
+
+    @patch("gentroutils.io.gcs.previous_release", return_value=None)
+    @patch("gentroutils.io.listings.list_ftp_directory")
+    @patch("gentroutils.tasks.fetch.GwasCatalogReleaseInfo.from_uri")
+    @patch("gentroutils.transfer.TransferManager")
+    def test_fetch_run_pattern(
+        self, mock_tf_manager, mock_from_uri, mock_list, mock_previous_release, mock_gwas_catalog_release_info, tmp_path
+    ):
+        """Test that the source pattern is expanded against a single cached listing of the release directory."""
+        import aioftp
+
+        from gentroutils.io.mirror import RemoteFile
+
+        fetch_spec = FetchSpec(
+            name="test fetch",
+            source_template="ftp://example.com/{release_date}/studies-v*.txt",
+            destination_template="gs://test-bucket/{release_date}/studies.tsv",
+        )
+        mock_from_uri.return_value = mock_gwas_catalog_release_info
+        mtime = datetime(2023, 10, 1, tzinfo=UTC)
+        # The dated directory is missing, the `latest` release is listed instead.
+        mock_list.side_effect = [
+            aioftp.StatusCodeError("250", "550", "not found"),
+            [RemoteFile("README", 1, mtime), RemoteFile("studies-v1.0.3.2.txt", 2, mtime)],
+        ]
+        mock_context = MagicMock(spec=TaskContext)
+        mock_context.config = MagicMock(work_path=tmp_path)
+        mock_context.state = State.PENDING_RUN
+        mock_context.abort = MagicMock()
+
+        Fetch(fetch_spec, mock_context).run()
+        Fetch(fetch_spec, mock_context).run()
+
+        assert [c.args[0].uri for c in mock_list.call_args_list] == [
+            "ftp://example.com/2023/10/01",
+            "ftp://example.com/latest",
+        ]
+        assert mock_tf_manager.return_value.transfer.call_count == 2
+        objects = mock_tf_manager.return_value.transfer.call_args[0][0]
+        assert [(o.source, o.destination) for o in objects] == [
+            ("ftp://example.com/2023/10/01/studies-v1.0.3.2.txt", "gs://test-bucket/20231001/studies.tsv")
+        ]
+
+    @patch("gentroutils.io.gcs.previous_release")
+    @patch("gentroutils.tasks.fetch.GwasCatalogReleaseInfo.from_uri")
+    @patch("gentroutils.transfer.TransferManager")
+    def test_fetch_run_previous_release(
+        self, mock_tf_manager, mock_from_uri, mock_previous_release, mock_gwas_catalog_release_info, tmp_path
+    ):
+        """Test that every destination is paired with its object in the previous release."""
+        fetch_spec = FetchSpec(
+            name="test fetch",
+            source_template="ftp://example.com/{release_date}/data.json",
+            destination_template="gs://test-bucket/{release_date}/data.json",
+            promote=True,
+        )
+        mock_from_uri.return_value = mock_gwas_catalog_release_info
+        mock_previous_release.return_value = "20230901"
+        mock_context = MagicMock(spec=TaskContext)
+        mock_context.config = MagicMock(work_path=tmp_path)
+        mock_context.state = State.PENDING_RUN
+        mock_context.abort = MagicMock()
+
+        Fetch(fetch_spec, mock_context).run()
+
+        mock_previous_release.assert_called_once_with(fetch_spec.destination_template, "20231001")
+        objects = mock_tf_manager.return_value.transfer.call_args[0][0]
+        assert [(o.destination, o.previous) for o in objects] == [
+            ("gs://test-bucket/20231001/data.json", "gs://test-bucket/20230901/data.json"),
+            ("gs://test-bucket/latest/data.json", "gs://test-bucket/20230901/data.json"),
+        ]
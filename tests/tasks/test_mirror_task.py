@@ -0,0 +1,88 @@
+"""Test cases for the Mirror task."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from otter.task.model import State, TaskContext
+
+from gentroutils.io.mirror import MirroredObject, MirrorManifest, RemoteFile
+from gentroutils.tasks.mirror import Mirror, MirrorSpec
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+T1 = datetime(2025, 1, 2, tzinfo=UTC)
+SOURCE = "ftp://example.com/pub/sumstats"
+DESTINATION = "gs://test-bucket/raw"
+
+
+@pytest.fixture
+def task(tmp_path: Path) -> Mirror:
+    """Mirror task of the harmonised summary statistics with the work path in the temporary directory."""
+    spec = MirrorSpec(source=SOURCE, destination=f"{DESTINATION}/", pattern="*.h.tsv.gz")
+    context = MagicMock(spec=TaskContext)
+    context.state = State.PENDING_RUN
+    context.abort = MagicMock()
+    context.config = MagicMock(work_path=tmp_path)
+    return Mirror(spec, context)
+
+
+class TestMirrorTask:
+    """Test cases for the Mirror task."""
+
+    @patch("gentroutils.transfer.TransferManager")
+    @patch("gentroutils.io.mirror.list_mirror")
+    @patch("gentroutils.io.mirror.walk_ftp")
+    def test_run(self, mock_walk, mock_list, mock_tf_manager, task, tmp_path):
+        """Test that only the new and changed files matching the pattern are transferred."""
+        mock_walk.return_value = [
+            RemoteFile("GCST1/GCST1.h.tsv.gz", 1, T0),
+            RemoteFile("GCST2/GCST2.h.tsv.gz", 2, T1),
+            RemoteFile("GCST3/GCST3.h.tsv.gz", 3, T0),
+            RemoteFile("GCST3/README", 3, T0),
+        ]
+        mock_list.return_value = {
+            "GCST1/GCST1.h.tsv.gz": MirroredObject(1, T1, T0),
+            "GCST2/GCST2.h.tsv.gz": MirroredObject(2, T1, T0),
+        }
+
+        task.run()
+
+        objects = mock_tf_manager.return_value.transfer.call_args[0][0]
+        assert [(o.source, o.destination) for o in objects] == [
+            (f"{SOURCE}/GCST2/GCST2.h.tsv.gz", f"{DESTINATION}/GCST2/GCST2.h.tsv.gz"),
+            (f"{SOURCE}/GCST3/GCST3.h.tsv.gz", f"{DESTINATION}/GCST3/GCST3.h.tsv.gz"),
+        ]
+        assert mock_tf_manager.call_args.kwargs["max_concurrency"] == 16
+        assert [(a.source, a.destination) for a in task.artifacts] == [(SOURCE, DESTINATION)]
+        manifest = MirrorManifest(tmp_path / "mirror" / "mirror_summary_statistics.jsonl", SOURCE, DESTINATION)
+        assert manifest.resume() is None
+
+    @patch("gentroutils.transfer.TransferManager")
+    @patch("gentroutils.io.mirror.list_mirror")
+    @patch("gentroutils.io.mirror.walk_ftp")
+    def test_run_resumes(self, mock_walk, mock_list, mock_tf_manager, task, tmp_path):
+        """Test that an interrupted run is resumed from its manifest without walking the tree again."""
+        manifest = MirrorManifest(tmp_path / "mirror" / "mirror_summary_statistics.jsonl", SOURCE, DESTINATION)
+        files = [RemoteFile("GCST1/GCST1.h.tsv.gz", 1, T0), RemoteFile("GCST2/GCST2.h.tsv.gz", 2, T0)]
+        manifest.start(files)
+        manifest.transferred(files[0])
+
+        task.run()
+
+        mock_walk.assert_not_called()
+        mock_list.assert_not_called()
+        objects = mock_tf_manager.return_value.transfer.call_args[0][0]
+        assert [o.file for o in objects] == [files[1]]
+
+    @patch("gentroutils.transfer.TransferManager")
+    @patch("gentroutils.io.mirror.list_mirror")
+    @patch("gentroutils.io.mirror.walk_ftp")
+    def test_run_up_to_date(self, mock_walk, mock_list, mock_tf_manager, task):
+        """Test that nothing is transferred when the mirror is up to date."""
+        mock_walk.return_value = [RemoteFile("GCST1/GCST1.h.tsv.gz", 1, T0)]
+        mock_list.return_value = {"GCST1/GCST1.h.tsv.gz": MirroredObject(1, T1, T0)}
+
+        task.run()
+
+        mock_tf_manager.assert_not_called()
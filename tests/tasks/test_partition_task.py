@@ -0,0 +1,119 @@
+"""Test cases for the Partition task."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+import pytest
+from otter.task.model import State, TaskContext
+
+from gentroutils.errors import GentroutilsError
+from gentroutils.io.artifacts import ArtifactCache
+from gentroutils.tasks import GwasCatalogReleaseInfo
+from gentroutils.tasks.partition import Partition, PartitionSpec
+
+SOURCE = "gs://test-bucket/{release_date}/associations.tsv"
+
+
+@pytest.fixture
+def release_info() -> GwasCatalogReleaseInfo:
+    """Release information of the 2023-10-01 release."""
+    return GwasCatalogReleaseInfo(
+        date="2023-10-01",
+        associations=3,
+        studies=2,
+        sumstats=1,
+        snps=3,
+        ensemblbuild="114",
+        dbsnpbuild="156",
+        efoversion="3.60.0",
+        genebuild="GRCh38",
+    )
+
+
+@pytest.fixture
+def associations() -> bytes:
+    """Associations TSV content."""
+    return b"CHR_ID\tCHR_POS\tSTUDY ACCESSION\n1\t100\tGCST000001\n2\t200\tGCST000002\n1\t300\tGCST000002\n"
+
+
+@pytest.fixture
+def task(tmp_path: Path) -> Partition:
+    """Partition task with the work path in the temporary directory."""
+    spec = PartitionSpec(
+        source_template=SOURCE,
+        destination_template="gs://test-bucket/{release_date}/associations",
+        study_buckets=2,
+        promote=True,
+    )
+    context = MagicMock(spec=TaskContext)
+    context.state = State.PENDING_RUN
+    context.abort = MagicMock()
+    context.config = MagicMock(work_path=tmp_path)
+    return Partition(spec, context)
+
+
+class TestPartitionTask:
+    """Test cases for the Partition task."""
+
+    @patch("gentroutils.tasks.partition.get_remote_storage")
+    @patch("google.cloud.storage.Client")
+    @patch("gentroutils.tasks.partition.GwasCatalogReleaseInfo.from_uri")
+    def test_run(
+        self,
+        from_uri: MagicMock,
+        client: MagicMock,
+        remote_storage: MagicMock,
+        task: Partition,
+        release_info: GwasCatalogReleaseInfo,
+        associations: bytes,
+    ) -> None:
+        """Test that the downloaded associations are partitioned and uploaded to all destinations."""
+        from_uri.return_value = release_info
+        blob = client.return_value.bucket.return_value.get_blob.return_value
+        blob.generation = 1
+        blob.download_to_filename.side_effect = lambda path: Path(path).write_bytes(associations)
+
+        task.run()
+
+        client.return_value.bucket.return_value.get_blob.assert_called_once_with("20231001/associations.tsv")
+        uploads = sorted(c.args[1] for c in remote_storage.return_value.upload.call_args_list)
+        assert uploads == [
+            f"gs://test-bucket/{release}/associations/chromosome={chrom}/studyBucket={bucket}/00000000.parquet"
+            for release in ("20231001", "latest")
+            for chrom, bucket in (("1", 0), ("1", 1), ("2", 0))
+        ]
+        dataset = pl.read_parquet(task.context.config.work_path / "partition" / "20231001" / "associations")
+        assert dataset.height == 3
+
+    @patch("gentroutils.tasks.partition.get_remote_storage")
+    @patch("google.cloud.storage.Client")
+    @patch("gentroutils.tasks.partition.GwasCatalogReleaseInfo.from_uri")
+    def test_run_from_artifact(
+        self,
+        from_uri: MagicMock,
+        client: MagicMock,
+        remote_storage: MagicMock,
+        task: Partition,
+        release_info: GwasCatalogReleaseInfo,
+        associations: bytes,
+    ) -> None:
+        """Test that the local copy registered by the fetch task is used instead of downloading the source."""
+        from_uri.return_value = release_info
+        blob = client.return_value.bucket.return_value.get_blob.return_value
+        blob.generation = 7
+        ArtifactCache(task.context.config.work_path / "artifacts").register(
+            "gs://test-bucket/20231001/associations.tsv", 7, associations
+        )
+
+        task.run()
+
+        blob.download_to_filename.assert_not_called()
+        assert remote_storage.return_value.upload.call_count == 6
+
+    @patch("google.cloud.storage.Client")
+    def test_local_source_missing(self, client: MagicMock, task: Partition, tmp_path: Path) -> None:
+        """Test that a missing source object raises an error."""
+        client.return_value.bucket.return_value.get_blob.return_value = None
+        with pytest.raises(GentroutilsError, match="The source does not exist"):
+            task._local_source("gs://test-bucket/20231001/associations.tsv", tmp_path)
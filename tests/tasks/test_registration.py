@@ -0,0 +1,39 @@
+"""Test the import footprint of the task registration."""
+
+import json
+import subprocess
+import sys
+
+from gentroutils.parsers.associations import DEFAULT_ROW_GROUP_SIZE, DEFAULT_STUDY_BUCKETS
+from gentroutils.tasks.partition import PartitionSpec
+
+DEFERRED_MODULES = ("polars", "aiohttp", "aioftp", "tqdm")
+
+
+def test_registration_defers_heavy_imports() -> None:
+    """Test that importing all task modules, as otter does when registering them, skips the heavy dependencies."""
+    code = (
+        "import importlib, json, pkgutil, sys\n"
+        "import gentroutils.tasks\n"
+        "for m in pkgutil.iter_modules(gentroutils.tasks.__path__, 'gentroutils.tasks.'):\n"
+        "    importlib.import_module(m.name)\n"
+        f"print(json.dumps([m for m in {DEFERRED_MODULES} if m in sys.modules]))\n"
+    )
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert json.loads(process.stdout.splitlines()[-1]) == []
+
+
+def test_partition_spec_defaults() -> None:
+    """Test that the partition spec defaults follow the parser defaults it does not import."""
+    spec = PartitionSpec(source_template="gs://b/{release_date}/a.tsv", destination_template="gs://b/{release_date}/a")
+    assert spec.study_buckets == DEFAULT_STUDY_BUCKETS
+    assert spec.row_group_size == DEFAULT_ROW_GROUP_SIZE
+
+
+def test_mirror_spec_defaults() -> None:
+    """Test that the mirror spec defaults follow the walk defaults it does not import."""
+    from gentroutils.io.mirror import DEFAULT_WALK_CONNECTIONS
+    from gentroutils.tasks.mirror import MirrorSpec
+
+    spec = MirrorSpec(source="ftp://example.com/sumstats", destination="gs://b/raw")
+    assert spec.walk_connections == DEFAULT_WALK_CONNECTIONS
@@ -0,0 +1,96 @@
+"""Test the task profiling."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from otter.manifest.model import Artifact
+
+from gentroutils.profiling import TaskProfiler, profiled
+
+
+def busy_loop(stop: threading.Event) -> None:
+    """Keep the thread busy until stopped."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class FakeTask:
+    """Minimal task with a spec, a context and the output artifacts."""
+
+    def __init__(self, work_path: Path, profile: bool, destination: str | None = None) -> None:
+        self.spec = MagicMock(profile=profile)
+        self.spec.name = "fetch associations"
+        self.context = MagicMock()
+        self.context.config.work_path = work_path
+        self.destination = destination
+        self.artifacts: list[Artifact] | None = None
+
+    @profiled
+    def run(self, fail: bool = False) -> "FakeTask":
+        if self.destination:
+            self.artifacts = [Artifact(source="ftp://example.com/file.tsv", destination=self.destination)]
+        _ = [str(i) for i in range(10_000)]
+        if fail:
+            raise ValueError("run failed")
+        return self
+
+
+class TestTaskProfiler:
+    def test_samples_threads(self, tmp_path):
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop,), name="worker")
+        with TaskProfiler(tmp_path, interval=0.001) as profiler:
+            worker.start()
+            time.sleep(0.2)
+            stop.set()
+            worker.join()
+
+        stacks = (tmp_path / "cpu.folded").read_text().splitlines()
+        assert any(s.startswith("worker;") and "busy_loop (test_profiling.py:" in s for s in stacks)
+        assert all(s.rsplit(" ", 1)[1].isdigit() for s in stacks)
+        assert "gentroutils-profiler" not in "".join(stacks)
+        assert profiler.files == [tmp_path / "cpu.folded", tmp_path / "memory.txt"]
+
+    def test_memory_summary(self, tmp_path):
+        with TaskProfiler(tmp_path, top_allocations=3):
+            kept = [bytearray(1024) for _ in range(1000)]
+
+        summary = (tmp_path / "memory.txt").read_text().splitlines()
+        assert summary[1].startswith("Peak traced Python memory:")
+        assert summary[2].startswith("Peak resident set size:")
+        assert summary[3].startswith("Top 3 allocation sites")
+        assert len(summary) <= 7
+        assert "test_profiling.py" in summary[4]
+        assert len(kept) == 1000
+
+
+class TestProfiled:
+    def test_disabled(self, tmp_path):
+        task = FakeTask(tmp_path, profile=False)
+        assert task.run() is task
+        assert not (tmp_path / "profiles").exists()
+
+    def test_profile_uploaded_next_to_output(self, tmp_path):
+        task = FakeTask(tmp_path / "work", profile=True, destination=f"{tmp_path}/release/20250101/file.tsv")
+        assert task.run() is task
+
+        profile = tmp_path / "work" / "profiles" / "fetch_associations"
+        assert sorted(p.name for p in profile.iterdir()) == ["cpu.folded", "memory.txt"]
+        uploaded = tmp_path / "release" / "20250101" / "profiles" / "fetch_associations"
+        assert (uploaded / "memory.txt").read_text() == (profile / "memory.txt").read_text()
+
+    def test_profile_failed_run(self, tmp_path):
+        task = FakeTask(tmp_path / "work", profile=True, destination=f"{tmp_path}/release/file.tsv")
+        with pytest.raises(ValueError, match="run failed"):
+            task.run(fail=True)
+        assert (tmp_path / "work" / "profiles" / "fetch_associations" / "cpu.folded").exists()
+        assert (tmp_path / "release" / "profiles" / "fetch_associations" / "cpu.folded").exists()
+
+    def test_profile_upload_failure(self, tmp_path):
+        task = FakeTask(tmp_path / "work", profile=True, destination="gs://bucket/release/file.tsv")
+        with patch("gentroutils.io.path.copy_uri", side_effect=OSError("no credentials")):
+            assert task.run() is task
+        assert (tmp_path / "work" / "profiles" / "fetch_associations" / "memory.txt").exists()
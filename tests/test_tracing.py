@@ -0,0 +1,103 @@
+"""Test the task tracing."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from gentroutils.tracing import Tracer, span, traced
+
+
+class FakeTask:
+    """Minimal task with a spec and a context."""
+
+    def __init__(self, work_path: Path) -> None:
+        self.spec = MagicMock()
+        self.spec.name = "fetch associations"
+        self.context = MagicMock()
+        self.context.config.work_path = work_path
+
+    @traced
+    def run(self, fail: bool = False) -> "FakeTask":
+        with span("download", source="ftp://example.com/file.tsv") as s:
+            s.add("bytes", 10)
+            s.add("bytes", 5)
+        if fail:
+            raise ValueError("run failed")
+        return self
+
+
+def complete_events(tracer: Tracer) -> dict[str, dict]:
+    """Get the complete (`X`) events of the tracer by name."""
+    return {e["name"]: e for e in tracer.events() if e["ph"] == "X"}
+
+
+class TestSpan:
+    def test_not_recorded_outside_tracer(self):
+        with span("download", bytes=1) as s:
+            s.set(bytes=2)
+        assert s.tracer is None
+        assert s.args == {"bytes": 2}
+
+    def test_nested_spans_share_the_lane(self):
+        tracer = Tracer("task")
+        with tracer.activate(), span("outer"), span("inner", rows=3):
+            pass
+
+        events = complete_events(tracer)
+        assert events["outer"]["tid"] == events["inner"]["tid"] == 0
+        assert events["inner"]["args"] == {"rows": 3}
+        assert events["outer"]["ts"] <= events["inner"]["ts"]
+        assert events["inner"]["ts"] + events["inner"]["dur"] <= events["outer"]["ts"] + events["outer"]["dur"]
+
+    def test_error_recorded(self):
+        tracer = Tracer("task")
+        with pytest.raises(ValueError, match="boom"), tracer.activate(), span("unzip"):
+            raise ValueError("boom")
+
+        assert complete_events(tracer)["unzip"]["args"]["error"] == "ValueError('boom')"
+
+    def test_concurrent_transfers_get_their_own_lanes(self):
+        tracer = Tracer("task")
+
+        async def transfer(destination: str) -> None:
+            with span("transfer", lane=destination):
+                await asyncio.sleep(0.01)
+                with span("gcs upload"):
+                    await asyncio.sleep(0.01)
+
+        async def main() -> None:
+            with tracer.activate():
+                await asyncio.gather(transfer("gs://bucket/a"), transfer("gs://bucket/b"))
+
+        asyncio.run(main())
+
+        spans = [e for e in tracer.events() if e["ph"] == "X"]
+        assert len(spans) == 4
+        lanes = {e["tid"] for e in spans}
+        assert len(lanes) == 2
+        assert 0 not in lanes
+        names = {e["args"]["name"] for e in tracer.events() if e["name"] == "thread_name"}
+        assert names == {"task", "gs://bucket/a", "gs://bucket/b"}
+        for lane in lanes:
+            assert sorted(e["name"] for e in spans if e["tid"] == lane) == ["gcs upload", "transfer"]
+
+
+class TestTraced:
+    def test_writes_trace(self, tmp_path):
+        FakeTask(tmp_path).run()
+
+        trace = json.loads((tmp_path / "traces" / "fetch_associations.json").read_text())
+        events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert events["fetch associations"]["args"] == {"task": "FakeTask"}
+        assert events["download"]["args"] == {"source": "ftp://example.com/file.tsv", "bytes": 15}
+
+    def test_writes_trace_on_failure(self, tmp_path):
+        with pytest.raises(ValueError, match="run failed"):
+            FakeTask(tmp_path).run(fail=True)
+
+        trace = json.loads((tmp_path / "traces" / "fetch_associations.json").read_text())
+        events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert events["fetch associations"]["args"]["error"] == "ValueError('run failed')"
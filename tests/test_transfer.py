@@ -1,9 +1,15 @@
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from gentroutils.errors import GentroutilsError
-from gentroutils.io.transfer import FTPtoGCPTransferableObject, PolarsDataFrameToGCSTransferableObject
+from gentroutils.io.gcs import CompositeUploader
+from gentroutils.io.transfer import (
+    FTPtoGCPTransferableObject,
+    PolarsDataFrameToGCSTransferableObject,
+    StreamTransferableObject,
+)
 from gentroutils.transfer import TransferManager
 
 
@@ -98,3 +104,74 @@ class TestTransferManager:
         # Verify the transfer method was called
         mock_polars_obj.transfer.assert_called_once()
         mock_polars_obj.transfer.assert_awaited()
+
+    def test_transfer_stream_objects(self, tmp_path):
+        """Test transfer method with stream transferable objects."""
+        sources = [tmp_path / f"source{i}.txt" for i in range(3)]
+        for i, source in enumerate(sources):
+            source.write_text(f"content {i}")
+        transferable_objects = [
+            StreamTransferableObject(source=str(source), destination=str(tmp_path / "out" / source.name))
+            for source in sources
+        ]
+
+        TransferManager().transfer(transferable_objects)
+
+        assert [(tmp_path / "out" / s.name).read_text() for s in sources] == [f"content {i}" for i in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_transfer_bounded_concurrency(self):
+        """Test that at most `max_concurrency` objects are transferred at the same time."""
+        in_flight, peak = 0, 0
+
+        async def transfer():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        transferable_objects = [MagicMock(spec=StreamTransferableObject, transfer=transfer) for _ in range(8)]
+        await TransferManager.transfer_streams(transferable_objects, max_concurrency=3)
+        assert peak == 3
+
+    @patch("gentroutils.transfer.GCS_CLIENTS")
+    def test_transfer_sizes_connection_pool(self, gcs_clients, tmp_path):
+        """Test that the connection pool of the shared storage client is sized to the transfers and the parts."""
+        (tmp_path / "source.txt").write_text("content")
+        transferable_object = StreamTransferableObject(
+            source=str(tmp_path / "source.txt"), destination=str(tmp_path / "destination.txt")
+        )
+        TransferManager(max_concurrency=32, uploader=CompositeUploader(parallelism=8)).transfer([transferable_object])
+        gcs_clients.resize.assert_called_once_with(40)
+
+    @patch("gentroutils.transfer.GCS_CLIENTS")
+    def test_transfer_shares_uploader(self, gcs_clients):
+        """Test that the batch shares the upload engine, and the pool holds a connection for each part uploaded."""
+        uploader = CompositeUploader(parallelism=16)
+        transferable_object = MagicMock(spec=StreamTransferableObject, uploader=None, transfer=AsyncMock())
+        transferable_object.model_copy.return_value = transferable_object
+
+        TransferManager(max_concurrency=4, uploader=uploader).transfer([transferable_object])
+
+        gcs_clients.resize.assert_called_once_with(20)
+        assert transferable_object.model_copy.call_args.kwargs["update"]["uploader"] is uploader
+
+    def test_transfer_memory_budget(self, tmp_path):
+        """Test that the transfers of a batch share the memory budget and its high-water mark is kept."""
+        sources = [tmp_path / f"source{i}.txt" for i in range(4)]
+        for i, source in enumerate(sources):
+            source.write_text(f"content {i}")
+        transferable_objects = [
+            StreamTransferableObject(source=str(s), destination=str(tmp_path / "out" / s.name), chunk_size=16)
+            for s in sources
+        ]
+
+        manager = TransferManager(max_concurrency=4, memory_budget=32)
+        manager.transfer(transferable_objects)
+
+        assert manager.budget is not None
+        assert manager.budget.in_use == 0
+        assert manager.budget.high_water_mark == 32
+        assert all(x.budget is None for x in transferable_objects)
+        assert [(tmp_path / "out" / s.name).read_text() for s in sources] == [f"content {i}" for i in range(4)]